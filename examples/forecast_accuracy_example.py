@@ -19,7 +19,7 @@ from src.utils.config import Config
 from src.utils.logging import ProductionLogger, PerformanceMonitor
 from src.weather.accuracy import (
     ForecastAccuracyCalculator,
-    get_sensor_data_from_influxdb
+    get_sensor_data_from_influxdb_async
 )
 from src.weather.storage import WeatherErrorStorage
 
@@ -36,7 +36,7 @@ async def example_sensor_data_retrieval():
     # Retrieve sensor data for the last 7 days
     print("📊 Retrieving sensor data...")
     
-    sensor_df = get_sensor_data_from_influxdb(
+    sensor_df = await get_sensor_data_from_influxdb_async(
         measurement="ruuvi_environmental",
         fields=["temperature", "pressure", "humidity"],
         time_range="7d",
@@ -18,7 +18,7 @@ from src.utils.config import Config
 from src.utils.logging import ProductionLogger, PerformanceMonitor
 from src.weather.accuracy import (
     ForecastAccuracyCalculator,
-    get_sensor_data_from_influxdb
+    get_sensor_data_from_influxdb_async
 )
 from src.weather.storage import WeatherErrorStorage
 from src.influxdb.client import RuuviInfluxDBClient
@@ -43,7 +43,7 @@ async def test_sensor_data_retrieval():
         # Test sensor data retrieval
         print(f"\n📊 Testing sensor data retrieval...")
         
-        sensor_df = get_sensor_data_from_influxdb(
+        sensor_df = await get_sensor_data_from_influxdb_async(
             measurement="ruuvi_environmental",
             fields=["temperature", "pressure", "humidity"],
             time_range="7d",
@@ -305,7 +305,7 @@ async def test_data_alignment():
             print(f"✓ Error calculation completed: {len(errors)} errors calculated")
             
             if errors:
-                sample_error = errors[0]
+                sample_error = next(errors.iter_errors())
                 print(f"  - Sample error:")
                 print(f"    - Temperature abs error: {sample_error.temp_abs_error}")
                 print(f"    - Temperature signed error: {sample_error.temp_signed_error}")
@@ -405,8 +405,8 @@ class WeatherServiceHealthChecker:
             
             # Check for recent sensor data
             try:
-                from src.weather.accuracy import get_sensor_data_from_influxdb
-                sensor_df = get_sensor_data_from_influxdb(
+                from src.weather.accuracy import get_sensor_data_from_influxdb_async
+                sensor_df = await get_sensor_data_from_influxdb_async(
                     measurement="ruuvi_environmental",
                     fields=["temperature", "pressure", "humidity"],
                     time_range="24h",
@@ -4,8 +4,9 @@ Handles connection management, data buffering, batch writing, and retry logic.
 """
 
 import asyncio
+import functools
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from collections import deque
@@ -627,18 +628,77 @@ class RuuviInfluxDBClient:
             raise ConnectionError("Not connected to InfluxDB")
         
         try:
-            tables = self._query_api.query(flux_query, org=self.org)
-            results = []
+            # The query API is synchronous; run it off the event loop so
+            # concurrent queries overlap
+            return await asyncio.get_event_loop().run_in_executor(
+                None, self._run_query, flux_query
+            )
             
-            for table in tables:
-                for record in table.records:
-                    results.append(record.values)
+        except Exception as e:
+            self.logger.error(f"Query failed: {e}")
+            raise WriteError(f"Query failed: {e}")
+    
+    def _run_query(self, flux_query: str) -> List[Dict[str, Any]]:
+        """
+        Execute a Flux query synchronously and flatten the result tables.
+        
+        Args:
+            flux_query: Flux query string
             
-            return results
+        Returns:
+            List[Dict[str, Any]]: Query results
+        """
+        tables = self._query_api.query(flux_query, org=self.org)
+        results = []
+        
+        for table in tables:
+            for record in table.records:
+                results.append(record.values)
+        
+        return results
+    
+    async def query_data_frame_stream(self, flux_query: str) -> AsyncIterator[Any]:
+        """
+        Execute a Flux query and stream the result as pandas DataFrames.
+        
+        The response is parsed incrementally, one DataFrame per result table,
+        so callers can project each chunk instead of buffering every record.
+        
+        Args:
+            flux_query: Flux query string
             
+        Yields:
+            pd.DataFrame: Result chunk
+        """
+        if not self._is_connected or not self._query_api:
+            raise ConnectionError("Not connected to InfluxDB")
+        
+        loop = asyncio.get_event_loop()
+        
+        try:
+            # Both the request and the parsing of each chunk block, so they run
+            # in the executor like query()
+            frames = await loop.run_in_executor(
+                None,
+                functools.partial(self._query_api.query_data_frame_stream, flux_query, org=self.org)
+            )
         except Exception as e:
             self.logger.error(f"Query failed: {e}")
             raise WriteError(f"Query failed: {e}")
+        
+        try:
+            while True:
+                try:
+                    frame = await loop.run_in_executor(None, next, frames, None)
+                except Exception as e:
+                    self.logger.error(f"Query failed: {e}")
+                    raise WriteError(f"Query failed: {e}")
+                
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            frames.close()
     
     async def get_sensor_data(self, mac_address: str, start_time: datetime, 
                             end_time: Optional[datetime] = None, 
@@ -13,8 +13,19 @@ from typing import Dict, Any, Optional, Set, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..utils.config import Config, ConfigurationError
 from ..utils.logging import ProductionLogger, PerformanceMonitor
 from ..metadata.manager import MetadataManager, MetadataError
@@ -97,6 +108,8 @@ class RuuviDaemon:
         self._scan_task: Optional[asyncio.Task] = None
         self._write_task: Optional[asyncio.Task] = None
         self._stats_task: Optional[asyncio.Task] = None
+        self._process = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Configuration monitoring
         self._config_observer: Optional[Observer] = None
@@ -115,17 +128,24 @@ class RuuviDaemon:
         
         # Data buffer for batch processing
         self._data_buffer: Dict[str, RuuviSensorData] = {}
+        self._readings_since_flush = 0
         self._buffer_lock = asyncio.Lock()
+        self._flush_trigger = asyncio.Event()
         
         # Error recovery
         self._consecutive_errors = 0
         self._max_consecutive_errors = 10
         self._error_backoff_base = 1.0
         self._error_backoff_max = 60.0
+        self._backoff_schedule = tuple(
+            min(self._error_backoff_base * (2 ** i), self._error_backoff_max)
+            for i in range(6)
+        )
         
         # Callbacks
         self._data_callbacks: Set[Callable[[RuuviSensorData], None]] = set()
         self._status_callbacks: Set[Callable[[Dict[str, Any]], None]] = set()
+        self._status_json_callbacks: Set[Callable[[str], None]] = set()
     
     def add_data_callback(self, callback: Callable[[RuuviSensorData], None]):
         """Add callback for sensor data events."""
@@ -143,6 +163,14 @@ class RuuviDaemon:
         """Remove status callback."""
         self._status_callbacks.discard(callback)
     
+    def add_status_json_callback(self, callback: Callable[[str], None]):
+        """Add callback for status updates serialized by get_status_json()."""
+        self._status_json_callbacks.add(callback)
+    
+    def remove_status_json_callback(self, callback: Callable[[str], None]):
+        """Remove status JSON callback."""
+        self._status_json_callbacks.discard(callback)
+    
     async def _initialize_components(self):
         """Initialize all daemon components."""
         try:
@@ -206,32 +234,48 @@ class RuuviDaemon:
         
         signal.signal(signal.SIGHUP, reload_handler)
     
+    def _config_watch_dirs(self) -> list:
+        """Get directories to watch for configuration changes."""
+        watch_dirs = [self.config_path]
+        
+        # Data directory holds metadata.json; only watch it if present
+        data_dir = self.config_path / "data"
+        if data_dir.is_dir():
+            watch_dirs.append(data_dir)
+        
+        return watch_dirs
+    
+    def _start_observer(self, observer) -> None:
+        """Schedule configuration watches on an observer and start it."""
+        for watch_dir in self._config_watch_dirs():
+            observer.schedule(
+                self._config_handler,
+                str(watch_dir),
+                recursive=False
+            )
+        observer.start()
+    
     def _setup_config_monitoring(self):
         """Set up configuration file monitoring for hot-reloading."""
         try:
             self._config_handler = ConfigFileHandler(self)
-            self._config_observer = Observer()
             
-            # Monitor project directory for .env and metadata.json changes
-            self._config_observer.schedule(
-                self._config_handler,
-                str(self.config_path),
-                recursive=False
-            )
-            
-            # Monitor data directory for metadata.json changes
-            data_dir = self.config_path / "data"
-            if data_dir.exists():
-                self._config_observer.schedule(
-                    self._config_handler,
-                    str(data_dir),
-                    recursive=False
+            # Prefer the native (inotify) observer; fall back to polling when
+            # the kernel refuses more watches or inotify is unavailable
+            try:
+                self._config_observer = Observer()
+                self._start_observer(self._config_observer)
+            except OSError as e:
+                self.logger.warning(
+                    f"Native file observer unavailable ({e}), falling back to polling"
                 )
+                self._config_observer = PollingObserver(timeout=2.0)
+                self._start_observer(self._config_observer)
             
-            self._config_observer.start()
             self.logger.info("Configuration monitoring started")
             
         except Exception as e:
+            self._config_observer = None
             self.logger.warning(f"Failed to setup configuration monitoring: {e}")
     
     async def _reload_configuration(self):
@@ -302,7 +346,19 @@ class RuuviDaemon:
             raise
     
     def _handle_sensor_data(self, sensor_data: RuuviSensorData):
-        """Handle incoming sensor data."""
+        """
+        Handle incoming sensor data.
+        
+        Called from the BLE backend's thread; hands the sample over to the
+        event loop immediately so the BLE thread can return.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._ingest_sensor_data, sensor_data)
+        else:
+            self._ingest_sensor_data(sensor_data)
+    
+    def _ingest_sensor_data(self, sensor_data: RuuviSensorData):
+        """Process sensor data on the event loop thread."""
         try:
             # Update statistics
             self._stats.data_points_collected += 1
@@ -333,6 +389,12 @@ class RuuviDaemon:
         async with self._buffer_lock:
             # Use MAC address as key to avoid duplicates in buffer
             self._data_buffer[sensor_data.mac_address] = sensor_data
+            
+            # The buffer holds one reading per sensor, so count readings
+            # instead and flush early once a batch worth has arrived
+            self._readings_since_flush += 1
+            if self._readings_since_flush >= self.config.influxdb_batch_size:
+                self._flush_trigger.set()
     
     async def _continuous_scan_loop(self):
         """Main continuous scanning loop."""
@@ -378,7 +440,13 @@ class RuuviDaemon:
         
         while self._running and not self._shutdown_requested:
             try:
-                await asyncio.sleep(write_interval)
+                # Flush when the batch is full or the flush interval elapses
+                try:
+                    await asyncio.wait_for(self._flush_trigger.wait(), timeout=write_interval)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._flush_trigger.clear()
                 
                 # Get buffered data
                 async with self._buffer_lock:
@@ -387,6 +455,7 @@ class RuuviDaemon:
                     
                     data_to_write = list(self._data_buffer.values())
                     self._data_buffer.clear()
+                    self._readings_since_flush = 0
                 
                 # Write to InfluxDB
                 if data_to_write:
@@ -404,10 +473,9 @@ class RuuviDaemon:
                 self._stats.errors_count += 1
                 
                 # Error backoff
-                backoff_time = min(
-                    self._error_backoff_base * (2 ** min(self._consecutive_errors, 5)),
-                    self._error_backoff_max
-                )
+                backoff_time = self._backoff_schedule[
+                    min(self._consecutive_errors, len(self._backoff_schedule) - 1)
+                ]
                 await asyncio.sleep(backoff_time)
         
         # Flush remaining data on shutdown
@@ -435,14 +503,13 @@ class RuuviDaemon:
                     (datetime.now() - self._stats.start_time).total_seconds()
                 )
                 
-                # Update resource usage
-                try:
-                    import psutil
-                    process = psutil.Process()
-                    self._stats.memory_usage_mb = process.memory_info().rss / 1024 / 1024
-                    self._stats.cpu_usage_percent = process.cpu_percent()
-                except ImportError:
-                    pass
+                # Update resource usage (STATS_REPORT_CPU turns this off)
+                if psutil is not None and self.config.stats_report_cpu:
+                    # Reuse the Process so cpu_percent() measures since the last tick
+                    if self._process is None:
+                        self._process = psutil.Process()
+                    self._stats.memory_usage_mb = self._process.memory_info().rss / 1024 / 1024
+                    self._stats.cpu_usage_percent = self._process.cpu_percent(interval=None)
                 
                 # Periodic metadata save (batched to avoid race conditions)
                 if self.metadata_manager:
@@ -452,13 +519,24 @@ class RuuviDaemon:
                     except Exception as e:
                         self.logger.error(f"Failed to save metadata: {e}")
                 
-                # Notify status callbacks
-                status = self.get_status()
-                for callback in self._status_callbacks:
-                    try:
-                        callback(status)
-                    except Exception as e:
-                        self.logger.warning(f"Status callback failed: {e}")
+                # Notify status callbacks (skip building status if nobody listens)
+                if self._status_callbacks:
+                    status = self.get_status()
+                    for callback in self._status_callbacks:
+                        try:
+                            callback(status)
+                        except Exception as e:
+                            self.logger.warning(f"Status callback failed: {e}")
+                
+                # Consumers that publish the status (MQTT, HTTP) get it
+                # serialized once on the orjson fast path
+                if self._status_json_callbacks:
+                    status_json = self.get_status_json()
+                    for callback in self._status_json_callbacks:
+                        try:
+                            callback(status_json)
+                        except Exception as e:
+                            self.logger.warning(f"Status callback failed: {e}")
                 
             except Exception as e:
                 self.logger.error(f"Statistics loop error: {e}")
@@ -468,10 +546,34 @@ class RuuviDaemon:
     
     def get_status(self) -> Dict[str, Any]:
         """Get current daemon status."""
+        return self._build_status(asdict(self._stats))
+    
+    def get_status_json(self) -> str:
+        """
+        Get current daemon status serialized as JSON.
+        
+        Uses orjson when available, which serializes the stats dataclass and
+        its datetimes natively instead of going through asdict(). The stats
+        timestamps are naive local time and are written without an offset,
+        as the json fallback does.
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                self._build_status(self._stats),
+                option=orjson.OPT_SERIALIZE_DATACLASS
+            ).decode()
+        
+        return json.dumps(
+            self._build_status(asdict(self._stats)),
+            default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value)
+        )
+    
+    def _build_status(self, stats: Any) -> Dict[str, Any]:
+        """Build the status payload around the given stats representation."""
         return {
             "running": self._running,
             "shutdown_requested": self._shutdown_requested,
-            "stats": asdict(self._stats),
+            "stats": stats,
             "buffer_size": len(self._data_buffer),
             "consecutive_errors": self._consecutive_errors,
             "components": {
@@ -492,6 +594,8 @@ class RuuviDaemon:
         if self._running:
             raise RuuviDaemonError("Daemon is already running")
         
+        self._loop = asyncio.get_running_loop()
+        
         try:
             # Initialize components first (this sets up logger)
             await self._initialize_components()
@@ -535,14 +639,18 @@ class RuuviDaemon:
         self._running = False
         
         # Cancel background tasks
-        tasks = [self._scan_task, self._write_task, self._stats_task]
+        tasks = [
+            task for task in (self._scan_task, self._write_task, self._stats_task)
+            if task and not task.done()
+        ]
         for task in tasks:
-            if task and not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+            task.cancel()
+        
+        # Wait for all tasks to unwind concurrently
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                self.logger.warning(f"Background task failed during shutdown: {result}")
         
         # Stop configuration monitoring
         if self._config_observer:
@@ -3,19 +3,46 @@ Service Manager for Ruuvi Sensor Service.
 Handles systemd service integration, installation, and management.
 """
 
+import atexit
+import functools
+import grp
 import os
+import selectors
 import sys
 import subprocess
 import signal
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
-from ..utils.config import Config
+try:
+    from jeepney import (
+        DBusAddress, DBusErrorResponse, MatchRule, Properties,
+        message_bus, new_method_call, unwrap_msg
+    )
+    from jeepney.io.blocking import Proxy, open_dbus_connection
+    from jeepney.low_level import HeaderFields
+except ImportError:
+    open_dbus_connection = None
+
+try:
+    from systemd import journal
+except ImportError:
+    journal = None
+
+from ..utils.config import Config, PROJECT_ROOT
 from ..utils.logging import ProductionLogger
 
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_OBJECT_PATH = "/org/freedesktop/systemd1"
+
+# Members of these groups may read the system journal (see journalctl(1))
+JOURNAL_READER_GROUPS = ("systemd-journal", "adm", "wheel")
+
 
 class ServiceStatus(Enum):
     """Service status enumeration."""
@@ -40,6 +67,20 @@ class ServiceInfo:
     last_restart: Optional[str] = None
 
 
+# Unit properties read by the systemctl fallback
+SHOW_PROPERTIES = "ActiveState,SubState,MainPID,ActiveEnterTimestamp"
+
+# Seconds an is_enabled() result is reused
+ENABLED_CACHE_TTL = 5.0
+
+# systemd ActiveState values mapped to service status
+ACTIVE_STATE_MAP = {
+    "active": ServiceStatus.ACTIVE,
+    "inactive": ServiceStatus.INACTIVE,
+    "failed": ServiceStatus.FAILED,
+}
+
+
 class ServiceManagerError(Exception):
     """Base exception for service manager operations."""
     pass
@@ -66,18 +107,56 @@ class ServiceManager:
         self.logger = logger
         
         # Paths
-        self.project_root = Path(__file__).parent.parent.parent
+        self.project_root = PROJECT_ROOT
         self.service_file_path = Path("/etc/systemd/system") / self.SERVICE_FILE
-        self.user_service_path = Path.home() / ".config/systemd/user" / self.SERVICE_FILE
+        config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+        self.user_service_path = Path(config_home) / "systemd/user" / self.SERVICE_FILE
         
         # Service configuration
         self.use_user_service = not self._has_sudo_privileges()
         self.service_path = self.user_service_path if self.use_user_service else self.service_file_path
         
+        # Only elevate for system services when not already running as root
+        self._need_sudo = not self.use_user_service and os.geteuid() != 0
+        
+        # D-Bus connection to systemd (opened lazily, CLI fallback without jeepney)
+        self._use_dbus = open_dbus_connection is not None
+        self._bus = None
+        self._bus_lock = threading.RLock()
+        self._bus_closer_registered = False
+        self._job_signals_subscribed = False
+        
+        # Unit state cache, kept valid by a PropertiesChanged watcher thread
+        self._unit_state_cache: Optional[Tuple[ServiceStatus, Optional[int], Optional[str]]] = None
+        self._unit_state_generation = 0
+        self._status_watch_thread: Optional[threading.Thread] = None
+        self._status_watch_stop = threading.Event()
+        
+        # (monotonic time, enabled) of the last is_enabled() lookup
+        self._enabled_cache: Optional[Tuple[float, bool]] = None
+        
+        # Whether the unit file exists; set by install() and uninstall()
+        self._installed_cache: Optional[bool] = None
+        
+        # Generated unit file content, rebuilt on install()
+        self._service_template: Optional[str] = None
+        
+        # pidfd of the service main process, used to notice its exit without polling
+        self._pidfd: Optional[int] = None
+        self._pidfd_pid: Optional[int] = None
+        
+        # Previous (pid, cpu ticks, monotonic time) sample for CPU usage deltas
+        self._cpu_sample: Optional[Tuple[int, int, float]] = None
+        
         self.logger.info(f"Service manager initialized (user_service: {self.use_user_service})")
     
-    def _has_sudo_privileges(self) -> bool:
-        """Check if current user has sudo privileges."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _has_sudo_privileges() -> bool:
+        """Check if current user has sudo privileges (checked once per process)."""
+        if os.geteuid() == 0:
+            return True
+        
         try:
             result = subprocess.run(
                 ["sudo", "-n", "true"],
@@ -88,43 +167,68 @@ class ServiceManager:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
     
-    def _run_systemctl(self, command: List[str], check: bool = True) -> subprocess.CompletedProcess:
-        """Run systemctl command with appropriate privileges."""
+    def _run_systemctl(self, command: List[str], check: bool = True,
+                       capture: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run systemctl command with appropriate privileges.
+        
+        Args:
+            command: systemctl arguments
+            check: Raise ServiceManagerError on non-zero exit status
+            capture: Capture stdout as text; when False stdout is discarded and
+                only stderr is kept (as bytes) for error reporting
+        """
         cmd = ["systemctl"]
         
         if self.use_user_service:
             cmd.append("--user")
-        else:
-            cmd = ["sudo"] + cmd
+        elif self._need_sudo:
+            cmd = ["sudo", "-n"] + cmd
         
         cmd.extend(command)
         
         try:
-            result = subprocess.run(
+            if capture:
+                return subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                    check=check
+                )
+            
+            return subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=30,
                 check=check
             )
-            return result
         except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else e.stderr
             self.logger.error(f"systemctl command failed: {' '.join(cmd)}")
             self.logger.error(f"stdout: {e.stdout}")
-            self.logger.error(f"stderr: {e.stderr}")
-            raise ServiceManagerError(f"systemctl command failed: {e.stderr}")
+            self.logger.error(f"stderr: {stderr}")
+            raise ServiceManagerError(f"systemctl command failed: {stderr}")
         except subprocess.TimeoutExpired:
             raise ServiceManagerError("systemctl command timed out")
     
     def _get_service_template(self) -> str:
+        """Get the systemd service file content, generating it on first use."""
+        if self._service_template is None:
+            self._service_template = self._build_service_template()
+        return self._service_template
+    
+    def _build_service_template(self) -> str:
         """Generate systemd service file template."""
         python_path = sys.executable
-        project_path = self.project_root.absolute()
+        project_path = self.project_root
         main_script = project_path / "main.py"
         
         # Environment variables
         env_vars = []
-        if (project_path / ".env").exists():
+        if os.path.isfile(project_path / ".env"):
             env_vars.append(f"EnvironmentFile={project_path}/.env")
         
         # User and group settings
@@ -180,8 +284,10 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         return template
     
     def is_installed(self) -> bool:
-        """Check if service is installed."""
-        return self.service_path.exists()
+        """Check if service is installed (cached, updated by install/uninstall)."""
+        if self._installed_cache is None:
+            self._installed_cache = os.path.lexists(self.service_path)
+        return self._installed_cache
     
     def install(self, enable_autostart: bool = True) -> bool:
         """
@@ -199,19 +305,29 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
             # Create service directory if needed
             self.service_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Generate and write service file
+            # Generate and write service file (regenerated in case .env appeared)
+            self._service_template = None
             service_content = self._get_service_template()
-            self.service_path.write_text(service_content)
+            current_content = self.service_path.read_text() if self.service_path.exists() else None
             
-            self.logger.info(f"Service file written to: {self.service_path}")
-            
-            # Reload systemd
-            self._run_systemctl(["daemon-reload"])
+            # Skip the write and daemon-reload when nothing changed
+            file_changed = service_content != current_content
+            if file_changed:
+                self.service_path.write_text(service_content)
+                self.logger.info(f"Service file written to: {self.service_path}")
+            else:
+                self.logger.info(f"Service file unchanged: {self.service_path}")
             
-            # Enable service if requested
-            if enable_autostart:
-                self.enable()
+            if not self._install_dbus(file_changed, enable_autostart):
+                # Reload systemd
+                if file_changed:
+                    self._run_systemctl(["daemon-reload"], capture=False)
+                
+                # Enable service if requested
+                if enable_autostart:
+                    self.enable()
             
+            self._installed_cache = True
             self.logger.info("Service installed successfully")
             return True
             
@@ -219,6 +335,73 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
             self.logger.error(f"Service installation failed: {e}")
             raise ServiceManagerError(f"Installation failed: {e}")
     
+    def _install_dbus(self, reload: bool, enable: bool) -> bool:
+        """
+        Enable the unit and reload systemd in one pipelined D-Bus round trip.
+        
+        Returns:
+            True if handled over D-Bus, False if the caller must use systemctl
+        """
+        if not self._use_dbus:
+            return False
+        
+        manager = self._systemd_manager()
+        messages = []
+        if enable:
+            self.logger.info("Enabling service autostart...")
+            self._enabled_cache = None
+            messages.append(new_method_call(
+                manager, "EnableUnitFiles", "asbb", ([self.SERVICE_FILE], False, False)
+            ))
+        if reload or enable:
+            # A single reload picks up both the unit file and the new symlinks
+            messages.append(new_method_call(manager, "Reload"))
+        
+        try:
+            self._dbus_pipeline(messages)
+        except (OSError, DBusErrorResponse) as e:
+            self.logger.warning(f"D-Bus install failed, falling back to systemctl: {e}")
+            self._disable_dbus()
+            return False
+        
+        if enable:
+            self.logger.info("Service autostart enabled")
+        return True
+    
+    def _dbus_pipeline(self, messages: list, timeout: float = 30.0) -> List[tuple]:
+        """
+        Send several D-Bus method calls before collecting any reply.
+        
+        systemd handles calls from one connection in order, so this costs one
+        round trip instead of one per call.
+        
+        Returns:
+            Unwrapped reply bodies in the order of the messages
+        """
+        with self._bus_lock:
+            conn = self._get_bus()
+            
+            serials = []
+            for message in messages:
+                serial = next(conn.outgoing_serial)
+                conn.send(message, serial=serial)
+                serials.append(serial)
+            
+            replies = {}
+            deadline = time.monotonic() + timeout
+            while len(replies) < len(serials):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("Timed out waiting for D-Bus replies")
+                
+                # Signals arriving meanwhile have no filter waiting on them
+                reply = conn.receive(timeout=remaining)
+                reply_serial = reply.header.fields.get(HeaderFields.reply_serial)
+                if reply_serial in serials:
+                    replies[reply_serial] = reply
+            
+            return [unwrap_msg(replies[serial]) for serial in serials]
+    
     def uninstall(self) -> bool:
         """
         Uninstall systemd service.
@@ -230,7 +413,8 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
             self.logger.info("Uninstalling systemd service...")
             
             # Stop service if running
-            if self.get_status().status in [ServiceStatus.ACTIVE]:
+            status = self.get_status()
+            if status.status is ServiceStatus.ACTIVE:
                 self.stop()
             
             # Disable service
@@ -243,8 +427,9 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
                 self.logger.info(f"Service file removed: {self.service_path}")
             
             # Reload systemd
-            self._run_systemctl(["daemon-reload"])
+            self._run_systemctl(["daemon-reload"], capture=False)
             
+            self._installed_cache = False
             self.logger.info("Service uninstalled successfully")
             return True
             
@@ -256,13 +441,18 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         """Start the service."""
         try:
             self.logger.info("Starting service...")
-            self._run_systemctl(["start", self.SERVICE_NAME])
+            self._invalidate_status_cache()
+            job_result = self._unit_operation("StartUnit", "start")
+            
+            if job_result is None:
+                # Wait for service to start
+                time.sleep(2)
+            elif job_result != "done":
+                raise ServiceManagerError(f"Start job finished with result: {job_result}")
             
-            # Wait for service to start
-            time.sleep(2)
             status = self.get_status()
             
-            if status.status == ServiceStatus.ACTIVE:
+            if status.status is ServiceStatus.ACTIVE:
                 self.logger.info("Service started successfully")
                 return True
             else:
@@ -276,13 +466,18 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         """Stop the service."""
         try:
             self.logger.info("Stopping service...")
-            self._run_systemctl(["stop", self.SERVICE_NAME])
+            self._invalidate_status_cache()
+            job_result = self._unit_operation("StopUnit", "stop")
+            
+            if job_result is None:
+                # Wait for service to stop
+                time.sleep(2)
+            elif job_result != "done":
+                raise ServiceManagerError(f"Stop job finished with result: {job_result}")
             
-            # Wait for service to stop
-            time.sleep(2)
             status = self.get_status()
             
-            if status.status == ServiceStatus.INACTIVE:
+            if status.status is ServiceStatus.INACTIVE:
                 self.logger.info("Service stopped successfully")
                 return True
             else:
@@ -297,13 +492,18 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         """Restart the service."""
         try:
             self.logger.info("Restarting service...")
-            self._run_systemctl(["restart", self.SERVICE_NAME])
+            self._invalidate_status_cache()
+            job_result = self._unit_operation("RestartUnit", "restart")
+            
+            if job_result is None:
+                # Wait for service to restart
+                time.sleep(3)
+            elif job_result != "done":
+                raise ServiceManagerError(f"Restart job finished with result: {job_result}")
             
-            # Wait for service to restart
-            time.sleep(3)
             status = self.get_status()
             
-            if status.status == ServiceStatus.ACTIVE:
+            if status.status is ServiceStatus.ACTIVE:
                 self.logger.info("Service restarted successfully")
                 return True
             else:
@@ -317,7 +517,7 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         """Reload service configuration."""
         try:
             self.logger.info("Reloading service configuration...")
-            self._run_systemctl(["reload", self.SERVICE_NAME])
+            self._run_systemctl(["reload", self.SERVICE_NAME], capture=False)
             self.logger.info("Service configuration reloaded")
             return True
             
@@ -329,7 +529,8 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         """Enable service to start automatically."""
         try:
             self.logger.info("Enabling service autostart...")
-            self._run_systemctl(["enable", self.SERVICE_NAME])
+            self._enabled_cache = None
+            self._run_systemctl(["enable", self.SERVICE_NAME], capture=False)
             self.logger.info("Service autostart enabled")
             return True
             
@@ -341,7 +542,8 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         """Disable service autostart."""
         try:
             self.logger.info("Disabling service autostart...")
-            self._run_systemctl(["disable", self.SERVICE_NAME])
+            self._enabled_cache = None
+            self._run_systemctl(["disable", self.SERVICE_NAME], capture=False)
             self.logger.info("Service autostart disabled")
             return True
             
@@ -351,12 +553,373 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
     
     def is_enabled(self) -> bool:
         """Check if service is enabled for autostart."""
+        now = time.monotonic()
+        if self._enabled_cache is not None and now - self._enabled_cache[0] < ENABLED_CACHE_TTL:
+            return self._enabled_cache[1]
+        
+        enabled = self._query_enabled()
+        self._enabled_cache = (now, enabled)
+        return enabled
+    
+    def _query_enabled(self) -> bool:
+        """Look up the unit file state via D-Bus, falling back to systemctl."""
+        if self._use_dbus:
+            try:
+                state, = self._dbus_call(
+                    new_method_call(self._systemd_manager(), "GetUnitFileState", "s", (self.SERVICE_FILE,))
+                )
+                return state == "enabled"
+            except (OSError, DBusErrorResponse) as e:
+                self.logger.warning(f"D-Bus unit file state query failed, falling back to systemctl: {e}")
+                self._disable_dbus()
+        
         try:
             result = self._run_systemctl(["is-enabled", self.SERVICE_NAME], check=False)
             return result.returncode == 0 and "enabled" in result.stdout
         except Exception:
             return False
     
+    def _get_bus(self):
+        """Get the persistent D-Bus connection to systemd, opening it on first use."""
+        if self._bus is None:
+            self._bus = open_dbus_connection(bus="SESSION" if self.use_user_service else "SYSTEM")
+            self._job_signals_subscribed = False
+            
+            if not self._bus_closer_registered:
+                atexit.register(self.close)
+                self._bus_closer_registered = True
+        return self._bus
+    
+    def _close_bus(self):
+        """Close the shared D-Bus connection, ignoring errors."""
+        if self._bus is not None:
+            try:
+                self._bus.close()
+            except OSError:
+                pass
+            self._bus = None
+        self._job_signals_subscribed = False
+    
+    def _disable_dbus(self):
+        """Drop the D-Bus connection and use systemctl from now on."""
+        with self._bus_lock:
+            self._use_dbus = False
+            self._close_bus()
+    
+    def _dbus_call(self, message) -> tuple:
+        """
+        Send a D-Bus method call and return the unwrapped reply body.
+        
+        Calls are serialized over the shared connection, which is reopened
+        once if it was dropped.
+        """
+        with self._bus_lock:
+            try:
+                reply = self._get_bus().send_and_get_reply(message, timeout=30)
+            except ConnectionError:
+                self._close_bus()
+                reply = self._get_bus().send_and_get_reply(message, timeout=30)
+            return unwrap_msg(reply)
+    
+    def _systemd_manager(self):
+        """Get the D-Bus address of the systemd manager object."""
+        return DBusAddress(
+            SYSTEMD_OBJECT_PATH,
+            bus_name=SYSTEMD_BUS_NAME,
+            interface="org.freedesktop.systemd1.Manager"
+        )
+    
+    def _subscribe_job_signals(self):
+        """Subscribe the shared connection to systemd JobRemoved signals (once)."""
+        if self._job_signals_subscribed:
+            return
+        
+        conn = self._get_bus()
+        Proxy(message_bus, conn).AddMatch(self._job_removed_rule())
+        self._dbus_call(new_method_call(self._systemd_manager(), "Subscribe"))
+        self._job_signals_subscribed = True
+    
+    def _job_removed_rule(self):
+        """Match rule for the systemd manager's JobRemoved signal."""
+        return MatchRule(
+            type="signal",
+            interface="org.freedesktop.systemd1.Manager",
+            member="JobRemoved",
+            path=SYSTEMD_OBJECT_PATH
+        )
+    
+    def _run_unit_job(self, method: str, timeout: float = 30.0) -> str:
+        """
+        Queue a unit job over D-Bus and wait for it to finish.
+        
+        Args:
+            method: Manager method queuing the job (StartUnit, StopUnit, RestartUnit)
+            timeout: Seconds to wait for the job to be removed
+            
+        Returns:
+            Job result reported by systemd ("done", "failed", "timeout", ...)
+        """
+        with self._bus_lock:
+            self._subscribe_job_signals()
+            conn = self._get_bus()
+            
+            # Filter before queuing the job so an early JobRemoved is not missed
+            with conn.filter(self._job_removed_rule()) as queue:
+                job_path, = unwrap_msg(conn.send_and_get_reply(
+                    new_method_call(self._systemd_manager(), method, "ss", (self.SERVICE_FILE, "replace")),
+                    timeout=30
+                ))
+                
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        if remaining <= 0:
+                            raise TimeoutError
+                        job_id, path, unit, result = conn.recv_until_filtered(queue, timeout=remaining).body
+                    except TimeoutError:
+                        raise ServiceManagerError(f"Timed out waiting for {method} job to finish")
+                    
+                    if path == job_path:
+                        return result
+    
+    def _unit_operation(self, method: str, command: str) -> Optional[str]:
+        """
+        Start, stop or restart the unit.
+        
+        Uses a D-Bus job when available and returns its result; falls back to
+        systemctl and returns None, in which case the caller must let the
+        service settle before checking its status.
+        """
+        if self._use_dbus:
+            try:
+                return self._run_unit_job(method)
+            except (OSError, DBusErrorResponse) as e:
+                self.logger.warning(f"D-Bus {method} failed, falling back to systemctl: {e}")
+                self._disable_dbus()
+        
+        self._run_systemctl([command, self.SERVICE_NAME], capture=False)
+        return None
+    
+    def _query_unit_dbus(self) -> Tuple[ServiceStatus, Optional[int], Optional[str]]:
+        """Query unit state, main PID and start time from systemd over D-Bus."""
+        unit_path, = self._dbus_call(
+            new_method_call(self._systemd_manager(), "LoadUnit", "s", (self.SERVICE_FILE,))
+        )
+        unit = DBusAddress(unit_path, bus_name=SYSTEMD_BUS_NAME)
+        
+        unit_props, = self._dbus_call(
+            Properties(unit).get_all("org.freedesktop.systemd1.Unit")
+        )
+        service_props, = self._dbus_call(
+            Properties(unit).get_all("org.freedesktop.systemd1.Service")
+        )
+        
+        # Property values are (signature, value) variants
+        status = ACTIVE_STATE_MAP.get(unit_props["ActiveState"][1], ServiceStatus.UNKNOWN)
+        pid = None
+        uptime = None
+        
+        if status is ServiceStatus.ACTIVE:
+            pid = service_props["MainPID"][1] or None
+            active_since = unit_props["ActiveEnterTimestamp"][1]  # microseconds since epoch
+            if active_since:
+                uptime = datetime.fromtimestamp(active_since / 1_000_000).strftime("%Y-%m-%d %H:%M:%S")
+        
+        self._start_status_watch(unit_path)
+        
+        return status, pid, uptime
+    
+    def _status_watch_active(self) -> bool:
+        """Check whether the property change watcher is running."""
+        return self._status_watch_thread is not None and self._status_watch_thread.is_alive()
+    
+    def _start_status_watch(self, unit_path: str):
+        """Start watching the unit for property changes (once)."""
+        if self._status_watch_active():
+            return
+        
+        self._status_watch_stop.clear()
+        self._status_watch_thread = threading.Thread(
+            target=self._watch_unit_properties,
+            args=(unit_path,),
+            name="ruuvi-service-status-watch",
+            daemon=True
+        )
+        self._status_watch_thread.start()
+    
+    def _watch_unit_properties(self, unit_path: str):
+        """Invalidate the cached unit state whenever systemd reports a property change."""
+        rule = MatchRule(
+            type="signal",
+            interface="org.freedesktop.DBus.Properties",
+            member="PropertiesChanged",
+            path=unit_path
+        )
+        
+        try:
+            # Dedicated connection: the shared one is used for method calls
+            with open_dbus_connection(bus="SESSION" if self.use_user_service else "SYSTEM") as conn:
+                Proxy(message_bus, conn).AddMatch(rule)
+                
+                # systemd only emits unit signals to subscribed clients
+                unwrap_msg(conn.send_and_get_reply(
+                    new_method_call(self._systemd_manager(), "Subscribe"), timeout=30
+                ))
+                
+                with conn.filter(rule) as queue:
+                    while not self._status_watch_stop.is_set():
+                        try:
+                            conn.recv_until_filtered(queue, timeout=1.0)
+                        except TimeoutError:
+                            continue
+                        
+                        self._unit_state_generation += 1
+                        self._unit_state_cache = None
+                        
+        except (OSError, DBusErrorResponse) as e:
+            self.logger.warning(f"Service status watch stopped: {e}")
+        finally:
+            self._unit_state_cache = None
+    
+    def _invalidate_status_cache(self):
+        """Drop the cached unit state so the next query hits systemd."""
+        self._unit_state_generation += 1
+        self._unit_state_cache = None
+    
+    def close(self):
+        """Stop the status watcher and close the D-Bus connection."""
+        self._status_watch_stop.set()
+        if self._status_watch_thread is not None:
+            self._status_watch_thread.join(timeout=2.0)
+            self._status_watch_thread = None
+        
+        with self._bus_lock:
+            self._close_bus()
+        
+        self._close_pidfd()
+    
+    def _watch_main_pid(self, pid: Optional[int]):
+        """Keep a pidfd open on the service main process."""
+        if pid == self._pidfd_pid:
+            return
+        
+        self._close_pidfd()
+        if pid is None or not hasattr(os, "pidfd_open"):
+            return
+        
+        try:
+            self._pidfd = os.pidfd_open(pid)
+            self._pidfd_pid = pid
+        except OSError:
+            pass
+    
+    def _close_pidfd(self):
+        """Close the main process pidfd, if any."""
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+        self._pidfd = None
+        self._pidfd_pid = None
+    
+    def wait_for_exit(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the service main process to exit.
+        
+        Requires a main PID seen by get_status() and pidfd support
+        (Linux 5.3+, Python 3.9+).
+        
+        Args:
+            timeout: Seconds to wait, 0 to poll, None to wait indefinitely
+            
+        Returns:
+            True if the watched process exited, False on timeout or if no
+            process is being watched
+        """
+        if self._pidfd is None:
+            return False
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._pidfd, selectors.EVENT_READ)
+            return bool(selector.select(timeout))
+    
+    def _query_unit_systemctl(self) -> Tuple[ServiceStatus, Optional[int], Optional[str]]:
+        """Query unit state, main PID and start time with systemctl show."""
+        result = self._run_systemctl(
+            ["show", self.SERVICE_NAME, f"--property={SHOW_PROPERTIES}"], check=False
+        )
+        
+        # Key=Value lines, independent of locale and systemd version
+        properties = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+        
+        status = ACTIVE_STATE_MAP.get(properties.get("ActiveState"), ServiceStatus.UNKNOWN)
+        pid = None
+        uptime = None
+        
+        if status is ServiceStatus.ACTIVE:
+            main_pid = properties.get("MainPID", "0")
+            pid = int(main_pid) if main_pid.isdigit() and main_pid != "0" else None
+            uptime = properties.get("ActiveEnterTimestamp") or None
+        
+        return status, pid, uptime
+    
+    def _query_unit(self) -> Tuple[ServiceStatus, Optional[int], Optional[str]]:
+        """Query unit state via D-Bus, falling back to systemctl."""
+        if self._use_dbus:
+            cached = self._unit_state_cache
+            if cached is not None:
+                return cached
+            
+            try:
+                generation = self._unit_state_generation
+                unit_state = self._query_unit_dbus()
+                
+                # Only cache while watched and if no change was signalled meanwhile
+                if self._status_watch_active() and generation == self._unit_state_generation:
+                    self._unit_state_cache = unit_state
+                return unit_state
+            except (OSError, DBusErrorResponse) as e:
+                self.logger.warning(f"D-Bus status query failed, falling back to systemctl: {e}")
+                self._disable_dbus()
+        
+        return self._query_unit_systemctl()
+    
+    def _read_proc_stats(self, pid: int) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Read memory (MB) and CPU usage (%) of a process from /proc.
+        
+        CPU usage is measured since the previous sample of the same PID; the
+        first sample reports the lifetime average like ps does.
+        """
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                rss_pages = int(f.read().split()[1])
+            with open(f"/proc/{pid}/stat") as f:
+                # Fields after the parenthesized command name start at field 3 (state)
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open("/proc/uptime") as f:
+                system_uptime = float(f.read().split()[0])
+        except (OSError, IndexError, ValueError):
+            return None, None
+        
+        memory_mb = rss_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+        
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        now = time.monotonic()
+        
+        previous = self._cpu_sample
+        if previous is not None and previous[0] == pid and now > previous[2]:
+            elapsed = now - previous[2]
+            cpu_usage = (cpu_ticks - previous[1]) / clock_ticks / elapsed * 100
+        else:
+            elapsed = system_uptime - int(fields[19]) / clock_ticks  # starttime
+            cpu_usage = cpu_ticks / clock_ticks / elapsed * 100 if elapsed > 0 else 0.0
+        
+        self._cpu_sample = (pid, cpu_ticks, now)
+        return memory_mb, round(cpu_usage, 1)
+    
     def get_status(self) -> ServiceInfo:
         """Get detailed service status information."""
         if not self.is_installed():
@@ -367,65 +930,17 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
             )
         
         try:
-            # Get basic status
-            result = self._run_systemctl(["status", self.SERVICE_NAME], check=False)
-            
-            # Parse status
-            status = ServiceStatus.UNKNOWN
-            pid = None
-            uptime = None
-            
-            if result.returncode == 0:
-                if "Active: active (running)" in result.stdout:
-                    status = ServiceStatus.ACTIVE
-                elif "Active: inactive" in result.stdout:
-                    status = ServiceStatus.INACTIVE
-                elif "Active: failed" in result.stdout:
-                    status = ServiceStatus.FAILED
-            
-            # Extract PID if running
-            if status == ServiceStatus.ACTIVE:
-                for line in result.stdout.split('\n'):
-                    if "Main PID:" in line:
-                        try:
-                            pid = int(line.split("Main PID:")[1].split()[0])
-                        except (IndexError, ValueError):
-                            pass
-                    elif "Active:" in line and "since" in line:
-                        try:
-                            uptime = line.split("since")[1].strip()
-                        except IndexError:
-                            pass
+            status, pid, uptime = self._query_unit()
+            self._watch_main_pid(pid)
             
             # Get memory and CPU usage if running
             memory_usage = None
             cpu_usage = None
             
             if pid:
-                try:
-                    # Get memory usage
-                    mem_result = subprocess.run(
-                        ["ps", "-p", str(pid), "-o", "rss="],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if mem_result.returncode == 0:
-                        memory_kb = int(mem_result.stdout.strip())
-                        memory_usage = f"{memory_kb / 1024:.1f} MB"
-                    
-                    # Get CPU usage
-                    cpu_result = subprocess.run(
-                        ["ps", "-p", str(pid), "-o", "pcpu="],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if cpu_result.returncode == 0:
-                        cpu_usage = float(cpu_result.stdout.strip())
-                        
-                except (subprocess.TimeoutExpired, ValueError, subprocess.CalledProcessError):
-                    pass
+                memory_mb, cpu_usage = self._read_proc_stats(pid)
+                if memory_mb is not None:
+                    memory_usage = f"{memory_mb:.1f} MB"
             
             return ServiceInfo(
                 name=self.SERVICE_NAME,
@@ -445,40 +960,226 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
                 enabled=False
             )
     
-    def get_logs(self, lines: int = 50, follow: bool = False) -> str:
+    @staticmethod
+    def _unit_display_name(unit: str) -> str:
+        """Strip the .service suffix from a unit name."""
+        return unit[:-len(".service")] if unit.endswith(".service") else unit
+    
+    def get_statuses(self, patterns: List[str]) -> Dict[str, ServiceInfo]:
         """
-        Get service logs.
+        Get status of all units matching the given glob patterns.
+        
+        Uses one ListUnitsByPatterns and one ListUnitFilesByPatterns round
+        trip regardless of the number of units, plus a MainPID lookup per
+        active service. Resource usage is not sampled.
         
         Args:
-            lines: Number of log lines to retrieve
-            follow: Whether to follow logs (for streaming)
+            patterns: Unit name patterns, e.g. ["ruuvi-*.service"]
             
         Returns:
-            Log content as string
+            Mapping of unit name (without .service suffix) to ServiceInfo
         """
         try:
-            cmd = ["journalctl"]
+            if self._use_dbus:
+                try:
+                    return self._list_units_dbus(patterns)
+                except (OSError, DBusErrorResponse) as e:
+                    self.logger.warning(f"D-Bus unit listing failed, falling back to systemctl: {e}")
+                    self._disable_dbus()
             
-            if self.use_user_service:
-                cmd.append("--user")
+            return self._list_units_systemctl(patterns)
             
-            cmd.extend([
-                "-u", self.SERVICE_NAME,
-                "-n", str(lines),
-                "--no-pager"
-            ])
+        except Exception as e:
+            self.logger.error(f"Failed to list service statuses: {e}")
+            return {}
+    
+    def _list_units_dbus(self, patterns: List[str]) -> Dict[str, ServiceInfo]:
+        """List unit states and unit file states over D-Bus."""
+        manager = self._systemd_manager()
+        units, = self._dbus_call(
+            new_method_call(manager, "ListUnitsByPatterns", "asas", ([], patterns))
+        )
+        unit_files, = self._dbus_call(
+            new_method_call(manager, "ListUnitFilesByPatterns", "asas", ([], patterns))
+        )
+        enabled = {os.path.basename(path): state == "enabled" for path, state in unit_files}
+        
+        statuses = {}
+        for name, _description, load_state, active_state, _sub_state, _following, unit_path, *_job in units:
+            if load_state == "not-found":
+                continue
             
-            if follow:
-                cmd.append("-f")
+            status = ACTIVE_STATE_MAP.get(active_state, ServiceStatus.UNKNOWN)
+            pid = None
+            if status is ServiceStatus.ACTIVE and name.endswith(".service"):
+                service = DBusAddress(
+                    unit_path,
+                    bus_name=SYSTEMD_BUS_NAME,
+                    interface="org.freedesktop.systemd1.Service"
+                )
+                (_signature, main_pid), = self._dbus_call(Properties(service).get("MainPID"))
+                pid = main_pid or None
             
-            if not self.use_user_service:
-                cmd = ["sudo"] + cmd
+            display_name = self._unit_display_name(name)
+            statuses[display_name] = ServiceInfo(
+                name=display_name,
+                status=status,
+                enabled=enabled.get(name, False),
+                pid=pid
+            )
+        
+        # Installed but not loaded units only show up as unit files
+        for name, is_enabled in enabled.items():
+            statuses.setdefault(self._unit_display_name(name), ServiceInfo(
+                name=self._unit_display_name(name),
+                status=ServiceStatus.INACTIVE,
+                enabled=is_enabled
+            ))
+        
+        return statuses
+    
+    def _list_units_systemctl(self, patterns: List[str]) -> Dict[str, ServiceInfo]:
+        """List unit states and unit file states with systemctl."""
+        units = self._run_systemctl(
+            ["list-units", "--all", "--plain", "--no-legend", *patterns], check=False
+        )
+        unit_files = self._run_systemctl(
+            ["list-unit-files", "--no-legend", *patterns], check=False
+        )
+        
+        enabled = {}
+        for line in unit_files.stdout.splitlines():
+            fields = line.split()
+            if len(fields) >= 2:
+                enabled[fields[0]] = fields[1] == "enabled"
+        
+        statuses = {}
+        for line in units.stdout.splitlines():
+            fields = line.split()
+            if len(fields) < 4 or fields[1] == "not-found":
+                continue
+            
+            name, _load_state, active_state = fields[:3]
+            display_name = self._unit_display_name(name)
+            statuses[display_name] = ServiceInfo(
+                name=display_name,
+                status=ACTIVE_STATE_MAP.get(active_state, ServiceStatus.UNKNOWN),
+                enabled=enabled.get(name, False)
+            )
+        
+        for name, is_enabled in enabled.items():
+            statuses.setdefault(self._unit_display_name(name), ServiceInfo(
+                name=self._unit_display_name(name),
+                status=ServiceStatus.INACTIVE,
+                enabled=is_enabled
+            ))
+        
+        return statuses
+    
+    def _journalctl_command(self, lines: int, follow: bool = False) -> List[str]:
+        """Build the journalctl command for the service logs."""
+        cmd = ["journalctl"]
+        
+        if self.use_user_service:
+            cmd.append("--user")
+        
+        cmd.extend([
+            "-u", self.SERVICE_NAME,
+            "-n", str(lines),
+            "--no-pager"
+        ])
+        
+        if follow:
+            cmd.append("-f")
+        
+        if self._need_sudo:
+            cmd = ["sudo", "-n"] + cmd
+        
+        return cmd
+    
+    @functools.cached_property
+    def _can_read_journal(self) -> bool:
+        """
+        Whether the service journal can be read directly with python-systemd.
+        
+        Without access to the system journal a reader silently returns no
+        entries, so callers that would need sudo use journalctl instead.
+        """
+        if journal is None:
+            return False
+        if not self._need_sudo:
+            return True
+        
+        groups = set(os.getgroups())
+        for name in JOURNAL_READER_GROUPS:
+            try:
+                if grp.getgrnam(name).gr_gid in groups:
+                    return True
+            except KeyError:
+                continue
+        return False
+    
+    def _open_journal_reader(self):
+        """Open a journal reader matching the service unit."""
+        if self.use_user_service:
+            reader = journal.Reader(journal.CURRENT_USER)
+            reader.add_match(_SYSTEMD_USER_UNIT=self.SERVICE_FILE)
+        else:
+            reader = journal.Reader()
+            reader.add_match(_SYSTEMD_UNIT=self.SERVICE_FILE)
+        return reader
+    
+    @staticmethod
+    def _format_journal_entry(entry: Dict[str, Any]) -> str:
+        """Format a journal entry like journalctl's short output."""
+        prefix = ""
+        timestamp = entry.get("__REALTIME_TIMESTAMP")
+        if timestamp:
+            prefix = timestamp.strftime("%b %d %H:%M:%S ")
+        
+        identifier = entry.get("SYSLOG_IDENTIFIER", "")
+        pid = entry.get("_PID")
+        if pid:
+            identifier = f"{identifier}[{pid}]"
+        
+        return f"{prefix}{entry.get('_HOSTNAME', '')} {identifier}: {entry.get('MESSAGE', '')}"
+    
+    def _read_journal_tail(self, reader, lines: int) -> List[str]:
+        """Read the last lines from a journal reader, oldest first."""
+        reader.seek_tail()
+        entries = []
+        for _ in range(lines):
+            entry = reader.get_previous()
+            if not entry:
+                break
+            entries.append(self._format_journal_entry(entry))
+        entries.reverse()
+        return entries
+    
+    def get_logs(self, lines: int = 50) -> str:
+        """
+        Get service logs; use follow_logs() to stream them.
+        
+        Args:
+            lines: Number of log lines to retrieve
+            
+        Returns:
+            Log content as string
+        """
+        try:
+            if self._can_read_journal:
+                reader = self._open_journal_reader()
+                try:
+                    tail = self._read_journal_tail(reader, lines)
+                finally:
+                    reader.close()
+                return "\n".join(tail) + "\n" if tail else ""
             
             result = subprocess.run(
-                cmd,
+                self._journalctl_command(lines),
                 capture_output=True,
                 text=True,
-                timeout=30 if not follow else None
+                timeout=30
             )
             
             return result.stdout
@@ -487,6 +1188,47 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
             self.logger.error(f"Failed to get service logs: {e}")
             return f"Error retrieving logs: {e}"
     
+    def follow_logs(self, lines: int = 50, poll_timeout: float = 1.0) -> Iterator[str]:
+        """
+        Stream service logs as they are written.
+        
+        Args:
+            lines: Number of existing log lines to yield first
+            poll_timeout: Seconds to wait for new entries per poll
+            
+        Yields:
+            Formatted log lines
+        """
+        if not self._can_read_journal:
+            # Fall back to journalctl -f, reading its output incrementally
+            process = subprocess.Popen(
+                self._journalctl_command(lines, follow=True),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            try:
+                for line in process.stdout:
+                    yield line.rstrip("\n")
+            finally:
+                process.terminate()
+                process.wait()
+            return
+        
+        reader = self._open_journal_reader()
+        try:
+            yield from self._read_journal_tail(reader, lines)
+            
+            # Position after the last entry, then wait for appended entries
+            reader.seek_tail()
+            reader.get_previous()
+            while True:
+                if reader.wait(poll_timeout) == journal.APPEND:
+                    for entry in reader:
+                        yield self._format_journal_entry(entry)
+        finally:
+            reader.close()
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Perform comprehensive service health check.
@@ -494,30 +1236,39 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
         Returns:
             Health check results
         """
+        # A readable pidfd means the main process exited since the last check,
+        # whether it failed, was stopped or is being restarted; the cached unit
+        # state is stale, so drop it and let systemd report the real state
+        if self.wait_for_exit(timeout=0):
+            self._close_pidfd()
+            self._invalidate_status_cache()
+        
         health = {
             "timestamp": time.time(),
             "service_installed": self.is_installed(),
-            "service_enabled": self.is_enabled(),
+            "service_enabled": None,
             "status": None,
             "issues": [],
             "recommendations": []
         }
         
         try:
-            # Get service status
+            # get_status() already reports whether the service is enabled
             status = self.get_status()
-            health["status"] = status.status.value
+            health["service_enabled"] = status.enabled
+            service_status = status.status
+            health["status"] = service_status.value
             
             # Check for issues
             if not health["service_installed"]:
                 health["issues"].append("Service not installed")
                 health["recommendations"].append("Run service installation")
             
-            if status.status == ServiceStatus.FAILED:
+            if service_status is ServiceStatus.FAILED:
                 health["issues"].append("Service is in failed state")
                 health["recommendations"].append("Check service logs and restart")
             
-            if status.status == ServiceStatus.INACTIVE and health["service_enabled"]:
+            if service_status is ServiceStatus.INACTIVE and health["service_enabled"]:
                 health["issues"].append("Service is enabled but not running")
                 health["recommendations"].append("Start the service")
             
@@ -527,7 +1278,7 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
                 health["recommendations"].append("Monitor system resources")
             
             # Check if service is responsive (if running)
-            if status.status == ServiceStatus.ACTIVE:
+            if service_status is ServiceStatus.ACTIVE:
                 # Could add more sophisticated health checks here
                 # like checking if the service is actually scanning for sensors
                 pass
@@ -552,16 +1303,26 @@ WantedBy={'default.target' if self.use_user_service else 'multi-user.target'}
                 journal_conf.mkdir(exist_ok=True)
                 
                 ruuvi_conf = journal_conf / "ruuvi-sensor.conf"
-                ruuvi_conf.write_text(f"""[Journal]
+                conf_content = """[Journal]
 # Ruuvi Sensor Service log retention
 SystemMaxUse=100M
 SystemMaxFileSize=10M
 SystemMaxFiles=10
 MaxRetentionSec=7day
-""")
+"""
                 
-                # Restart journald to apply changes
-                subprocess.run(["sudo", "systemctl", "restart", "systemd-journald"], check=True)
+                # Only touch journald when the drop-in actually changes
+                current_content = ruuvi_conf.read_text() if ruuvi_conf.exists() else None
+                if conf_content != current_content:
+                    ruuvi_conf.write_text(conf_content)
+                    
+                    # Reload rather than restart journald to keep its sockets open;
+                    # reload is only supported from systemd v254, so older
+                    # systems fall back to the restart used before
+                    result = self._run_systemctl(["reload", "systemd-journald"], check=False, capture=False)
+                    if result.returncode != 0:
+                        self.logger.debug("systemd-journald reload unsupported, restarting it")
+                        self._run_systemctl(["restart", "systemd-journald"], capture=False)
             
             self.logger.info("Log rotation configured")
             return True
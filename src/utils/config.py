@@ -5,12 +5,28 @@ Loads configuration from environment variables with validation and defaults.
 
 import os
 import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Union
-from dotenv import load_dotenv
+from typing import Dict, Optional, Tuple, Union
 import logging
 
 
+_LOG = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# The interpreter prefix cannot change at runtime, so detect a venv once
+_IN_VENV = (hasattr(sys, 'real_prefix') or
+            (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix) or
+            'VIRTUAL_ENV' in os.environ)
+
+# Marks a key absent from the environment (distinct from an empty value)
+_MISSING = object()
+
+# Parsed .env files keyed by (path, mtime_ns, size)
+_DOTENV_CACHE: Dict[Tuple[str, int, int], Dict[str, str]] = {}
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
     pass
@@ -20,8 +36,85 @@ class Config:
     """
     Configuration manager that loads settings from environment variables.
     Provides validation and type conversion for configuration values.
+    
+    Property values are parsed on first access and cached on the instance;
+    create a new Config to pick up environment changes.
     """
     
+    # Values accepted as true by get_bool (compared lowercased)
+    _TRUTHY = frozenset({'true', '1', 'yes', 'on', 'enabled', 't', 'y'})
+    
+    _LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+    
+    # Sample/template values that count as unset credentials
+    _PLACEHOLDER_VALUES = frozenset({
+        'your_influxdb_token_here', 'your_organization_name', 'your_organization',
+        'changeme', '<token>', '<org>',
+    })
+    
+    # Accepted bounds used by validate_configuration (ranges are for ints)
+    _PORT_RANGE = range(1, 65536)
+    _LAT_RANGE = (-90.0, 90.0)
+    _LON_RANGE = (-180.0, 180.0)
+    _FORECAST_DAYS_RANGE = range(1, 17)
+    
+    # get_summary layout: section -> ((display key, attribute name), ...)
+    _SUMMARY_SCHEMA = (
+        ('influxdb', (
+            ('host', 'influxdb_host'),
+            ('port', 'influxdb_port'),
+            ('org', 'influxdb_org'),
+            ('bucket', 'influxdb_bucket'),
+            ('verify_ssl', 'influxdb_verify_ssl'),
+            ('enable_gzip', 'influxdb_enable_gzip'),
+        )),
+        ('ble', (
+            ('scan_timeout', 'ble_scan_timeout'),
+            ('retry_attempts', 'ble_retry_attempts'),
+            ('retry_delay', 'ble_retry_delay'),
+            ('scan_interval', 'ble_scan_interval'),
+        )),
+        ('metadata', (
+            ('file_path', 'metadata_file_path'),
+            ('backup_count', 'metadata_backup_count'),
+        )),
+        ('logging', (
+            ('level', 'log_level'),
+            ('dir', 'log_dir'),
+            ('enable_console', 'log_enable_console'),
+            ('enable_syslog', 'log_enable_syslog'),
+        )),
+        ('service', (
+            ('batch_size', 'service_batch_size'),
+            ('flush_interval', 'service_flush_interval'),
+            ('max_retries', 'service_max_retries'),
+            ('buffer_size', 'service_buffer_size'),
+        )),
+    )
+    
+    # Nested under summary['weather'] when weather is enabled
+    _WEATHER_SUMMARY_SCHEMA = (
+        ('location', (
+            ('latitude', 'weather_location_latitude'),
+            ('longitude', 'weather_location_longitude'),
+            ('timezone', 'weather_timezone'),
+        )),
+        ('api', (
+            ('base_url', 'weather_api_base_url'),
+            ('timeout', 'weather_api_timeout'),
+            ('retry_attempts', 'weather_api_retry_attempts'),
+            ('rate_limit', 'weather_api_rate_limit_requests'),
+        )),
+        ('storage', (
+            ('bucket', 'weather_influxdb_bucket'),
+        )),
+        ('scheduling', (
+            ('forecast_interval', 'weather_forecast_interval'),
+            ('forecast_days', 'weather_forecast_days'),
+            ('historical_days', 'weather_historical_days'),
+        )),
+    )
+    
     def __init__(self, env_file: Optional[str] = None):
         """
         Initialize configuration manager.
@@ -29,46 +122,82 @@ class Config:
         Args:
             env_file: Path to .env file (defaults to .env in project root)
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOG
         
         # Load environment variables
         if env_file is None:
-            env_file = Path(__file__).parent.parent.parent / ".env"
+            env_file = PROJECT_ROOT / ".env"
         
-        if Path(env_file).exists():
-            load_dotenv(env_file)
-            self.logger.info(f"Loaded configuration from {env_file}")
-        else:
+        try:
+            st = os.stat(env_file)
+        except FileNotFoundError:
             self.logger.warning(f"Environment file {env_file} not found, using system environment")
+        else:
+            self._load_env_file(env_file, st)
+            self.logger.info(f"Loaded configuration from {env_file}")
+        
+        # Snapshot the environment; settings are read from this plain dict
+        self._env = dict(os.environ)
         
         # Validate virtual environment if required
         if self.get_bool("VIRTUAL_ENV_REQUIRED", True):
             self._check_virtual_environment()
     
+    @staticmethod
+    def _load_env_file(env_file: Union[str, Path], st: os.stat_result):
+        """
+        Load a .env file into os.environ without overriding existing variables.
+        
+        The parsed file is cached by path, mtime and size (taken from the
+        caller's stat result), so creating further Config instances does not
+        re-read an unchanged file.
+        """
+        key = (str(env_file), st.st_mtime_ns, st.st_size)
+        
+        values = _DOTENV_CACHE.get(key)
+        if values is None:
+            # Imported here so deployments without a .env file never load python-dotenv
+            from dotenv import dotenv_values
+            values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+            _DOTENV_CACHE[key] = values
+        
+        for name, value in values.items():
+            os.environ.setdefault(name, value)
+    
     def _check_virtual_environment(self):
         """Check if running in a virtual environment."""
-        if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-            if 'VIRTUAL_ENV' not in os.environ:
-                raise ConfigurationError(
-                    "Virtual environment required but not detected. "
-                    "Please activate the virtual environment or set VIRTUAL_ENV_REQUIRED=false"
-                )
+        if not _IN_VENV:
+            raise ConfigurationError(
+                "Virtual environment required but not detected. "
+                "Please activate the virtual environment or set VIRTUAL_ENV_REQUIRED=false"
+            )
     
     def get_str(self, key: str, default: Optional[str] = None) -> str:
         """Get string configuration value."""
-        value = os.getenv(key, default)
-        if value is None:
-            raise ConfigurationError(f"Required configuration key '{key}' not found")
+        value = self._env.get(key, _MISSING)
+        if value is _MISSING:
+            if default is None:
+                raise ConfigurationError(f"Required configuration key '{key}' not found")
+            return default
         return value
     
     def get_int(self, key: str, default: Optional[int] = None) -> int:
         """Get integer configuration value."""
-        value = os.getenv(key)
-        if value is None:
+        value = self._env.get(key, _MISSING)
+        if value is _MISSING:
             if default is None:
                 raise ConfigurationError(f"Required configuration key '{key}' not found")
             return default
         
+        digits = value.strip()
+        negative = digits[:1] == '-'
+        if digits[:1] in ('-', '+'):
+            digits = digits[1:]
+        # isdecimal() rather than isdigit(): int() rejects superscripts and the like
+        if digits.isdecimal():
+            return -int(digits) if negative else int(digits)
+        
+        # Anything else int() accepts, such as "1_000", stays valid
         try:
             return int(value)
         except ValueError:
@@ -76,8 +205,8 @@ class Config:
     
     def get_float(self, key: str, default: Optional[float] = None) -> float:
         """Get float configuration value."""
-        value = os.getenv(key)
-        if value is None:
+        value = self._env.get(key, _MISSING)
+        if value is _MISSING:
             if default is None:
                 raise ConfigurationError(f"Required configuration key '{key}' not found")
             return default
@@ -89,144 +218,143 @@ class Config:
     
     def get_bool(self, key: str, default: Optional[bool] = None) -> bool:
         """Get boolean configuration value."""
-        value = os.getenv(key)
-        if value is None:
+        value = self._env.get(key, _MISSING)
+        if value is _MISSING:
             if default is None:
                 raise ConfigurationError(f"Required configuration key '{key}' not found")
             return default
         
-        return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
+        return value.strip().lower() in Config._TRUTHY
     
     def get_path(self, key: str, default: Optional[Union[str, Path]] = None) -> Path:
         """Get path configuration value."""
-        value = os.getenv(key)
-        if value is None:
+        value = self._env.get(key, _MISSING)
+        if value is _MISSING:
             if default is None:
                 raise ConfigurationError(f"Required configuration key '{key}' not found")
             value = str(default)
         
-        path = Path(value)
-        if not path.is_absolute():
-            # Make relative paths relative to project root
-            project_root = Path(__file__).parent.parent.parent
-            path = project_root / path
-        
-        return path
+        # Make relative paths relative to project root
+        return Path(value) if os.path.isabs(value) else PROJECT_ROOT / value
     
     # InfluxDB Configuration
-    @property
+    @cached_property
     def influxdb_host(self) -> str:
         return self.get_str("INFLUXDB_HOST")
     
-    @property
+    @cached_property
     def influxdb_port(self) -> int:
         return self.get_int("INFLUXDB_PORT", 8086)
     
-    @property
+    @cached_property
     def influxdb_token(self) -> str:
         return self.get_str("INFLUXDB_TOKEN")
     
-    @property
+    @cached_property
     def influxdb_org(self) -> str:
         return self.get_str("INFLUXDB_ORG")
     
-    @property
+    @cached_property
     def influxdb_bucket(self) -> str:
         return self.get_str("INFLUXDB_BUCKET")
     
-    @property
+    @cached_property
     def influxdb_timeout(self) -> int:
         return self.get_int("INFLUXDB_TIMEOUT", 30)
     
-    @property
+    @cached_property
     def influxdb_verify_ssl(self) -> bool:
         return self.get_bool("INFLUXDB_VERIFY_SSL", True)
     
-    @property
+    @cached_property
     def influxdb_enable_gzip(self) -> bool:
         return self.get_bool("INFLUXDB_ENABLE_GZIP", True)
     
     # BLE Scanner Configuration
-    @property
+    @cached_property
     def ble_scan_timeout(self) -> float:
         return self.get_float("BLE_SCAN_TIMEOUT", 10.0)
     
-    @property
+    @cached_property
     def ble_retry_attempts(self) -> int:
         return self.get_int("BLE_RETRY_ATTEMPTS", 3)
     
-    @property
+    @cached_property
     def ble_retry_delay(self) -> float:
         return self.get_float("BLE_RETRY_DELAY", 2.0)
     
-    @property
+    @cached_property
     def ble_scan_interval(self) -> int:
         return self.get_int("BLE_SCAN_INTERVAL", 20)
     
     # Metadata Configuration
-    @property
+    @cached_property
     def metadata_file_path(self) -> Path:
         return self.get_path("METADATA_FILE_PATH", "./config/ruuvi_sensors.json")
     
-    @property
+    @cached_property
     def metadata_backup_count(self) -> int:
         return self.get_int("METADATA_BACKUP_COUNT", 5)
     
     # Logging Configuration
-    @property
+    @cached_property
     def log_level(self) -> str:
         return self.get_str("LOG_LEVEL", "INFO").upper()
     
-    @property
+    @cached_property
     def log_dir(self) -> Path:
         return self.get_path("LOG_DIR", "./logs")
     
-    @property
+    @cached_property
     def log_max_file_size(self) -> int:
         return self.get_int("LOG_MAX_FILE_SIZE", 10 * 1024 * 1024)  # 10MB
     
-    @property
+    @cached_property
     def log_backup_count(self) -> int:
         return self.get_int("LOG_BACKUP_COUNT", 5)
     
-    @property
+    @cached_property
     def log_enable_console(self) -> bool:
         return self.get_bool("LOG_ENABLE_CONSOLE", True)
     
-    @property
+    @cached_property
     def log_enable_syslog(self) -> bool:
         return self.get_bool("LOG_ENABLE_SYSLOG", False)
     
     # Service Configuration
-    @property
+    @cached_property
     def service_batch_size(self) -> int:
         return self.get_int("SERVICE_BATCH_SIZE", 100)
     
-    @property
+    @cached_property
     def service_flush_interval(self) -> int:
         return self.get_int("SERVICE_FLUSH_INTERVAL", 10)
     
-    @property
+    @cached_property
     def service_max_retries(self) -> int:
         return self.get_int("SERVICE_MAX_RETRIES", 3)
     
-    @property
+    @cached_property
     def service_retry_backoff(self) -> float:
         return self.get_float("SERVICE_RETRY_BACKOFF", 2.0)
     
-    @property
+    @cached_property
     def service_buffer_size(self) -> int:
         return self.get_int("SERVICE_BUFFER_SIZE", 10000)
     
     # Performance Monitoring
-    @property
+    @cached_property
     def enable_performance_monitoring(self) -> bool:
         return self.get_bool("ENABLE_PERFORMANCE_MONITORING", True)
     
-    @property
+    @cached_property
     def performance_log_interval(self) -> int:
         return self.get_int("PERFORMANCE_LOG_INTERVAL", 300)
     
+    @cached_property
+    def stats_report_cpu(self) -> bool:
+        return self.get_bool("STATS_REPORT_CPU", True)
+    
     def validate_configuration(self) -> bool:
         """
         Validate all configuration values.
@@ -241,15 +369,19 @@ class Config:
         
         # Validate InfluxDB configuration
         try:
+            token = self.influxdb_token
+            org = self.influxdb_org
+            port = self.influxdb_port
+            
             if not self.influxdb_host:
                 errors.append("INFLUXDB_HOST cannot be empty")
-            if not self.influxdb_token or self.influxdb_token == "your_influxdb_token_here":
+            if not token or token in Config._PLACEHOLDER_VALUES:
                 errors.append("INFLUXDB_TOKEN must be set to a valid token")
-            if not self.influxdb_org or self.influxdb_org == "your_organization_name":
+            if not org or org in Config._PLACEHOLDER_VALUES:
                 errors.append("INFLUXDB_ORG must be set to a valid organization name")
             if not self.influxdb_bucket:
                 errors.append("INFLUXDB_BUCKET cannot be empty")
-            if self.influxdb_port < 1 or self.influxdb_port > 65535:
+            if port not in Config._PORT_RANGE:
                 errors.append("INFLUXDB_PORT must be between 1 and 65535")
         except ConfigurationError as e:
             errors.append(str(e))
@@ -267,8 +399,8 @@ class Config:
         
         # Validate log level
         try:
-            valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            if self.log_level not in valid_levels:
+            if self.log_level not in Config._LOG_LEVELS:
+                valid_levels = sorted(Config._LOG_LEVELS, key=logging.getLevelName)
                 errors.append(f"LOG_LEVEL must be one of {valid_levels}")
         except ConfigurationError as e:
             errors.append(str(e))
@@ -276,9 +408,13 @@ class Config:
         # Validate weather configuration if enabled
         if self.weather_enabled:
             try:
-                if self.weather_location_latitude < -90 or self.weather_location_latitude > 90:
+                latitude = self.weather_location_latitude
+                longitude = self.weather_location_longitude
+                forecast_days = self.weather_forecast_days
+                
+                if not Config._LAT_RANGE[0] <= latitude <= Config._LAT_RANGE[1]:
                     errors.append("WEATHER_LOCATION_LATITUDE must be between -90 and 90")
-                if self.weather_location_longitude < -180 or self.weather_location_longitude > 180:
+                if not Config._LON_RANGE[0] <= longitude <= Config._LON_RANGE[1]:
                     errors.append("WEATHER_LOCATION_LONGITUDE must be between -180 and 180")
                 if self.weather_api_timeout <= 0:
                     errors.append("WEATHER_API_TIMEOUT must be positive")
@@ -286,7 +422,7 @@ class Config:
                     errors.append("WEATHER_API_RETRY_ATTEMPTS must be at least 1")
                 if self.weather_forecast_interval <= 0:
                     errors.append("WEATHER_FORECAST_INTERVAL must be positive")
-                if self.weather_forecast_days < 1 or self.weather_forecast_days > 16:
+                if forecast_days not in Config._FORECAST_DAYS_RANGE:
                     errors.append("WEATHER_FORECAST_DAYS must be between 1 and 16")
             except ConfigurationError as e:
                 errors.append(str(e))
@@ -296,65 +432,26 @@ class Config:
         
         return True
     
+    def _summary_section(self, fields: Tuple[Tuple[str, str], ...]) -> dict:
+        """Read one summary section; paths are reported as strings."""
+        section = {}
+        for key, attr in fields:
+            value = getattr(self, attr)
+            section[key] = str(value) if isinstance(value, Path) else value
+        return section
+    
     def get_summary(self) -> dict:
         """Get configuration summary for logging/debugging."""
-        summary = {
-            'influxdb': {
-                'host': self.influxdb_host,
-                'port': self.influxdb_port,
-                'org': self.influxdb_org,
-                'bucket': self.influxdb_bucket,
-                'verify_ssl': self.influxdb_verify_ssl,
-                'enable_gzip': self.influxdb_enable_gzip,
-            },
-            'ble': {
-                'scan_timeout': self.ble_scan_timeout,
-                'retry_attempts': self.ble_retry_attempts,
-                'retry_delay': self.ble_retry_delay,
-                'scan_interval': self.ble_scan_interval,
-            },
-            'metadata': {
-                'file_path': str(self.metadata_file_path),
-                'backup_count': self.metadata_backup_count,
-            },
-            'logging': {
-                'level': self.log_level,
-                'dir': str(self.log_dir),
-                'enable_console': self.log_enable_console,
-                'enable_syslog': self.log_enable_syslog,
-            },
-            'service': {
-                'batch_size': self.service_batch_size,
-                'flush_interval': self.service_flush_interval,
-                'max_retries': self.service_max_retries,
-                'buffer_size': self.service_buffer_size,
-            }
-        }
+        summary = {section: self._summary_section(fields)
+                   for section, fields in Config._SUMMARY_SCHEMA}
         
         # Add weather configuration if enabled
-        if self.weather_enabled:
-            summary['weather'] = {
-                'enabled': self.weather_enabled,
-                'location': {
-                    'latitude': self.weather_location_latitude,
-                    'longitude': self.weather_location_longitude,
-                    'timezone': self.weather_timezone,
-                },
-                'api': {
-                    'base_url': self.weather_api_base_url,
-                    'timeout': self.weather_api_timeout,
-                    'retry_attempts': self.weather_api_retry_attempts,
-                    'rate_limit': self.weather_api_rate_limit_requests,
-                },
-                'storage': {
-                    'bucket': self.weather_influxdb_bucket,
-                },
-                'scheduling': {
-                    'forecast_interval': self.weather_forecast_interval,
-                    'forecast_days': self.weather_forecast_days,
-                    'historical_days': self.weather_historical_days,
-                }
-            }
+        weather_enabled = self.weather_enabled
+        if weather_enabled:
+            weather = {'enabled': weather_enabled}
+            weather.update((section, self._summary_section(fields))
+                           for section, fields in Config._WEATHER_SUMMARY_SCHEMA)
+            summary['weather'] = weather
         
         return summary
     
@@ -364,151 +461,168 @@ class Config:
     
     def is_virtual_environment(self) -> bool:
         """Check if running in a virtual environment."""
-        return (hasattr(sys, 'real_prefix') or
-                (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix) or
-                'VIRTUAL_ENV' in os.environ)
+        return _IN_VENV
     
-    @property
+    @cached_property
     def environment(self) -> str:
         """Get current environment."""
         return self.get_str("ENVIRONMENT", "development")
     
-    @property
+    @cached_property
     def ble_adapter(self) -> str:
         """Get BLE adapter."""
         return self.get_str("BLE_ADAPTER", "auto")
     
-    @property
+    @cached_property
     def ble_scan_duration(self) -> float:
         """Get BLE scan duration."""
         return self.get_float("BLE_SCAN_DURATION", 10.0)
     
-    @property
+    @cached_property
     def metadata_file(self) -> str:
         """Get metadata file path."""
         return str(self.get_path("METADATA_FILE", "./data/metadata.json"))
     
-    @property
+    @cached_property
     def backup_dir(self) -> str:
         """Get backup directory path."""
         return str(self.get_path("BACKUP_DIR", "./backups"))
     
-    @property
+    @cached_property
     def influxdb_batch_size(self) -> int:
         """Get InfluxDB batch size."""
         return self.get_int("INFLUXDB_BATCH_SIZE", 100)
     
-    @property
+    @cached_property
     def influxdb_flush_interval(self) -> int:
         """Get InfluxDB flush interval."""
         return self.get_int("INFLUXDB_FLUSH_INTERVAL", 10)
     
-    @property
+    @cached_property
     def influxdb_retry_attempts(self) -> int:
         """Get InfluxDB retry attempts."""
         return self.get_int("INFLUXDB_RETRY_ATTEMPTS", 3)
     
-    @property
+    @cached_property
     def influxdb_retry_delay(self) -> float:
         """Get InfluxDB retry delay."""
         return self.get_float("INFLUXDB_RETRY_DELAY", 2.0)
     
-    @property
+    @cached_property
     def influxdb_retry_exponential_base(self) -> float:
         """Get InfluxDB retry exponential base."""
         return self.get_float("INFLUXDB_RETRY_EXPONENTIAL_BASE", 2.0)
     
-    @property
+    @cached_property
     def max_buffer_size(self) -> int:
         """Get maximum buffer size."""
         return self.get_int("MAX_BUFFER_SIZE", 10000)
     
-    @property
+    @cached_property
     def enable_auto_discovery(self) -> bool:
         """Get auto discovery setting."""
         return self.get_bool("ENABLE_AUTO_DISCOVERY", True)
     
-    @property
+    @cached_property
     def performance_monitoring(self) -> bool:
         """Get performance monitoring setting."""
         return self.get_bool("PERFORMANCE_MONITORING", True)
     
     # Weather Configuration
-    @property
+    @cached_property
     def weather_enabled(self) -> bool:
         """Get weather forecast enabled setting."""
         return self.get_bool("WEATHER_ENABLED", False)
     
-    @property
+    @cached_property
     def weather_location_latitude(self) -> float:
         """Get weather location latitude (Planegg coordinates)."""
         return self.get_float("WEATHER_LOCATION_LATITUDE", 48.1031)
     
-    @property
+    @cached_property
     def weather_location_longitude(self) -> float:
         """Get weather location longitude (Planegg coordinates)."""
         return self.get_float("WEATHER_LOCATION_LONGITUDE", 11.4247)
     
-    @property
+    @cached_property
     def weather_api_base_url(self) -> str:
         """Get weather API base URL."""
         return self.get_str("WEATHER_API_BASE_URL", "https://api.open-meteo.com/v1")
     
-    @property
+    @cached_property
     def weather_api_timeout(self) -> int:
         """Get weather API timeout in seconds."""
         return self.get_int("WEATHER_API_TIMEOUT", 30)
     
-    @property
+    @cached_property
     def weather_api_retry_attempts(self) -> int:
         """Get weather API retry attempts."""
         return self.get_int("WEATHER_API_RETRY_ATTEMPTS", 3)
     
-    @property
+    @cached_property
     def weather_api_retry_delay(self) -> float:
         """Get weather API retry delay in seconds."""
         return self.get_float("WEATHER_API_RETRY_DELAY", 2.0)
     
-    @property
+    @cached_property
     def weather_api_rate_limit_requests(self) -> int:
         """Get weather API rate limit requests per minute."""
         return self.get_int("WEATHER_API_RATE_LIMIT_REQUESTS", 10)
     
-    @property
+    @cached_property
     def weather_influxdb_bucket(self) -> str:
         """Get weather InfluxDB bucket name."""
         return self.get_str("WEATHER_INFLUXDB_BUCKET", "weather_forecasts")
     
-    @property
+    @cached_property
     def weather_forecast_interval(self) -> int:
         """Get weather forecast fetch interval in minutes."""
         return self.get_int("WEATHER_FORECAST_INTERVAL", 60)
     
-    @property
+    @cached_property
     def weather_forecast_days(self) -> int:
         """Get number of forecast days to retrieve."""
         return self.get_int("WEATHER_FORECAST_DAYS", 7)
     
-    @property
+    @cached_property
     def weather_historical_days(self) -> int:
         """Get number of historical days to retrieve."""
         return self.get_int("WEATHER_HISTORICAL_DAYS", 7)
     
-    @property
+    @cached_property
     def weather_circuit_breaker_failure_threshold(self) -> int:
         """Get circuit breaker failure threshold."""
         return self.get_int("WEATHER_CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)
     
-    @property
+    @cached_property
     def weather_circuit_breaker_recovery_timeout(self) -> int:
         """Get circuit breaker recovery timeout in seconds."""
         return self.get_int("WEATHER_CIRCUIT_BREAKER_RECOVERY_TIMEOUT", 300)
     
-    @property
+    @cached_property
     def weather_timezone(self) -> str:
         """Get weather timezone."""
         return self.get_str("WEATHER_TIMEZONE", "Europe/Berlin")
+    
+    @cached_property
+    def weather_analysis_rule_algorithm(self) -> str:
+        """Get frequent itemset algorithm for rule mining ("apriori" or "fpgrowth")."""
+        return self.get_str("WEATHER_ANALYSIS_RULE_ALGORITHM", "apriori").lower()
+    
+    @cached_property
+    def weather_analysis_cache_ttl(self) -> int:
+        """Get analysis query cache lifetime in seconds (0 disables the cache)."""
+        return self.get_int("WEATHER_ANALYSIS_CACHE_TTL", 3600)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared configuration instance, creating it on first use."""
+    return Config()
 
 
-# Global configuration instance
-config = Config()
\ No newline at end of file
+def __getattr__(name: str):
+    """Create the global ``config`` instance lazily on first access."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,13 +3,209 @@ Logging configuration for the Ruuvi Sensor Service.
 Provides comprehensive logging setup with multiple handlers and structured logging.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-import colorlog
-from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+    
+    Serializes with orjson when it is installed (falling back to the stdlib
+    json module); the timestamp is the raw POSIX time, so no strftime runs
+    per record.
+    """
+    
+    def __init__(self, extra_fields: Tuple[str, ...] = ()):
+        super().__init__()
+        self.extra_fields = extra_fields
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "pid": record.process,
+            "tid": record.thread,
+            "msg": record.getMessage(),
+        }
+        for field in self.extra_fields:
+            entry[field] = getattr(record, field, None)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str)
+
+
+# ProductionLogger currently attached to the root logger
+_active_logger: Optional['ProductionLogger'] = None
+
+# Logger returned by setup_logging() once configured
+_configured: Optional['ProductionLogger'] = None
+
+
+class _CachedTimeMixin:
+    """
+    Formatter mixin that renders ``%(asctime)s`` once per wall-clock second.
+    
+    Only used with a whole-second ``datefmt``; without one the stdlib
+    default includes milliseconds, so every record is formatted as usual.
+    """
+    
+    _cached_second = None
+    _cached_time = ''
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+# ANSI color prefix per level for console output
+_LEVEL_COLORS = {
+    logging.DEBUG: '\x1b[36m',        # cyan
+    logging.INFO: '\x1b[32m',         # green
+    logging.WARNING: '\x1b[33m',      # yellow
+    logging.ERROR: '\x1b[31m',        # red
+    logging.CRITICAL: '\x1b[31;47m',  # red on white
+}
+_COLOR_RESET = '\x1b[0m'
+
+
+class _ConsoleFormatter(_CachedTimeMixin, logging.Formatter):
+    """Colorized console formatter with per-second timestamp caching."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return _LEVEL_COLORS.get(record.levelno, '') + super().format(record) + _COLOR_RESET
+
+
+class ComponentFilter(logging.Filter):
+    """
+    Pass only records from the given logger hierarchies and tag each with
+    its component name (``record.component``).
+    """
+    
+    def __init__(self, components: Dict[str, str]):
+        super().__init__()
+        self.components = components
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        for prefix, tag in self.components.items():
+            if name == prefix or name.startswith(prefix + '.'):
+                record.component = tag
+                return True
+        return False
+
+
+class BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that buffers formatted records and writes them
+    with a single os.write() per batch.
+    
+    A batch is written once ``batch_size`` records are buffered or
+    ``flush_interval`` seconds after the first buffered record, whichever
+    comes first. The size-based rollover check runs once per batch instead
+    of once per record.
+    """
+    
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0,
+                 batch_size: int = 64, flush_interval: float = 0.25, delay: bool = False):
+        # Explicit UTF-8: on Python 3.10+ without UTF-8 mode the base class
+        # would otherwise record the pseudo-encoding 'locale', which
+        # str.encode() rejects
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount,
+                         encoding="utf-8", delay=delay)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._timer = None
+        self._last_record = None
+    
+    def _open(self):
+        # Raw append-only descriptor: batches go straight to os.write(), so
+        # no Python-level stream buffer or text encoder sits in between
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return os.fdopen(fd, 'ab', buffering=0)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        self._last_record = record
+        
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return
+            
+            batch = "".join(self._buffer)
+            self._buffer.clear()
+            
+            # Failures go to handleError so emit() (and the queue listener
+            # thread calling it) never raises; the failed batch is dropped
+            try:
+                data = batch.encode(self.encoding)
+                if self.stream is None:
+                    self.stream = self._open()
+                fd = self.stream.fileno()
+                size = os.fstat(fd).st_size
+                # Never rotate an empty file, even if one batch exceeds maxBytes
+                if self.maxBytes > 0 and size and size + len(data) > self.maxBytes:
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    fd = self.stream.fileno()
+                os.write(fd, data)
+            except Exception:
+                self.handleError(self._last_record)
+    
+    def close(self):
+        self.flush()
+        super().close()
 
 
 class ProductionLogger:
@@ -34,53 +230,68 @@ class ProductionLogger:
         self.backup_count = backup_count
         self.enable_console = enable_console
         self.enable_syslog = enable_syslog
+        self._root = logging.getLogger()
+        
+        # Bind the root logger's methods directly on the instance; they shadow
+        # the wrapper methods below and save a Python frame per log call
+        self.debug = self._root.debug
+        self.info = self._root.info
+        self.warning = self._root.warning
+        self.error = self._root.error
+        self.critical = self._root.critical
+        self.isEnabledFor = self._root.isEnabledFor
         
         # Create log directory
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
+        # Loggers only enqueue records; a listener thread owns the real
+        # handlers so callers never wait on disk or syslog I/O
+        self._log_queue = queue.Queue(-1)
+        self._handlers = []
+        self._listener = None
+        
         # Setup loggers
         self._setup_root_logger()
         self._setup_component_loggers()
+        self._start_listener()
+        
+        # Stop the listener of the logger this one replaces so its files are closed
+        global _active_logger
+        if _active_logger is not None:
+            _active_logger.close()
+        _active_logger = self
     
     def _setup_root_logger(self):
         """Configure root logger with multiple handlers."""
-        root_logger = logging.getLogger()
+        root_logger = self._root
         root_logger.setLevel(self.log_level)
         
-        # Clear existing handlers
-        root_logger.handlers.clear()
+        # Detach and close existing handlers
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+            handler.close()
         
         # Console handler with colors (for development/debugging)
         if self.enable_console:
-            console_handler = colorlog.StreamHandler(sys.stdout)
+            console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(self.log_level)
-            console_formatter = colorlog.ColoredFormatter(
-                '%(log_color)s%(asctime)s [%(levelname)8s] %(name)s: %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S',
-                log_colors={
-                    'DEBUG': 'cyan',
-                    'INFO': 'green',
-                    'WARNING': 'yellow',
-                    'ERROR': 'red',
-                    'CRITICAL': 'red,bg_white',
-                }
+            console_formatter = _ConsoleFormatter(
+                '%(asctime)s [%(levelname)8s] %(name)s: %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
             )
             console_handler.setFormatter(console_formatter)
-            root_logger.addHandler(console_handler)
+            self._handlers.append(console_handler)
         
         # File handler with rotation
         file_handler = logging.handlers.RotatingFileHandler(
             self.log_dir / f"{self.app_name}.log",
             maxBytes=self.max_file_size,
-            backupCount=self.backup_count
+            backupCount=self.backup_count,
+            delay=True
         )
         file_handler.setLevel(self.log_level)
-        file_formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)8s] %(name)s [%(process)d:%(thread)d] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(JsonFormatter())
+        self._handlers.append(file_handler)
         
         # Syslog handler for systemd integration
         if self.enable_syslog:
@@ -91,231 +302,345 @@ class ProductionLogger:
                     f'{self.app_name}[%(process)d]: %(levelname)s - %(message)s'
                 )
                 syslog_handler.setFormatter(syslog_formatter)
-                root_logger.addHandler(syslog_handler)
+                self._handlers.append(syslog_handler)
             except Exception as e:
                 print(f"Warning: Could not setup syslog handler: {e}")
+        
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        root_logger.addHandler(self._queue_handler)
     
     def _setup_component_loggers(self):
-        """Configure specific loggers for different components."""
-        # BLE Scanner logger
-        ble_logger = logging.getLogger('ruuvi.ble')
-        ble_handler = logging.handlers.RotatingFileHandler(
-            self.log_dir / "ble_scanner.log",
-            maxBytes=self.max_file_size,
-            backupCount=self.backup_count
-        )
-        ble_handler.setFormatter(logging.Formatter(
-            '%(asctime)s [%(levelname)s] BLE: %(message)s'
-        ))
-        ble_logger.addHandler(ble_handler)
-        
-        # InfluxDB logger
-        influx_logger = logging.getLogger('ruuvi.influxdb')
-        influx_handler = logging.handlers.RotatingFileHandler(
-            self.log_dir / "influxdb.log",
+        """
+        Configure specific loggers for different components.
+        
+        Component records reach the queue by propagating to the root logger;
+        on the listener side a single shared, batching file handler picks them
+        out by logger name and tags each with its component.
+        """
+        # Opened on the first component record, so unused components cost no fd
+        component_handler = BatchingRotatingFileHandler(
+            self.log_dir / "components.log",
             maxBytes=self.max_file_size,
-            backupCount=self.backup_count
+            backupCount=self.backup_count,
+            delay=True
         )
-        influx_handler.setFormatter(logging.Formatter(
-            '%(asctime)s [%(levelname)s] InfluxDB: %(message)s'
-        ))
-        influx_logger.addHandler(influx_handler)
-        
-        # Performance logger
-        perf_logger = logging.getLogger('ruuvi.performance')
-        perf_handler = logging.handlers.RotatingFileHandler(
-            self.log_dir / "performance.log",
-            maxBytes=self.max_file_size,
-            backupCount=self.backup_count
+        component_handler.setFormatter(JsonFormatter(extra_fields=('component',)))
+        component_handler.addFilter(ComponentFilter({
+            'ruuvi.ble': 'BLE',
+            'ruuvi.influxdb': 'InfluxDB',
+            'ruuvi.performance': 'PERF',
+        }))
+        self._handlers.append(component_handler)
+    
+    def _start_listener(self):
+        """Start the background thread that drains the log queue."""
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *self._handlers, respect_handler_level=True
         )
-        perf_handler.setFormatter(logging.Formatter(
-            '%(asctime)s PERF: %(message)s'
-        ))
-        perf_logger.addHandler(perf_handler)
+        self._listener.start()
+        atexit.register(self.close)
+    
+    def close(self):
+        """Flush queued records and close all handlers."""
+        if self._listener is None:
+            return
+        
+        # Detach first so nothing is queued after the listener has stopped
+        self._root.removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._listener = None
+        for handler in self._handlers:
+            handler.close()
     
     def get_logger(self, name: str = None) -> logging.Logger:
         """Get a logger instance."""
         if name:
             return logging.getLogger(name)
-        return logging.getLogger()
+        return self._root
     
+    # Fallbacks for class-level access (e.g. Mock(spec=ProductionLogger));
+    # instances use the bound root logger methods set in __init__
     def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
-        logging.getLogger().debug(message, *args, **kwargs)
+        self._root.debug(message, *args, **kwargs)
     
     def info(self, message: str, *args, **kwargs):
         """Log info message."""
-        logging.getLogger().info(message, *args, **kwargs)
+        self._root.info(message, *args, **kwargs)
     
     def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
-        logging.getLogger().warning(message, *args, **kwargs)
+        self._root.warning(message, *args, **kwargs)
     
     def error(self, message: str, *args, **kwargs):
         """Log error message."""
-        logging.getLogger().error(message, *args, **kwargs)
+        self._root.error(message, *args, **kwargs)
     
     def critical(self, message: str, *args, **kwargs):
         """Log critical message."""
-        logging.getLogger().critical(message, *args, **kwargs)
+        self._root.critical(message, *args, **kwargs)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether the root logger would handle a message of this level."""
+        return self._root.isEnabledFor(level)
+
+
+@dataclass
+class BleScanSample:
+    """One BLE scan recorded by PerformanceMonitor.log_ble_scan."""
+    __slots__ = ('duration', 'devices_found', 'success', 'timestamp')
+    
+    duration: float
+    devices_found: int
+    success: bool
+    timestamp: float
+
+
+@dataclass
+class InfluxWriteSample:
+    """One InfluxDB write recorded by PerformanceMonitor.log_influxdb_write."""
+    __slots__ = ('duration', 'points_written', 'success', 'timestamp')
+    
+    duration: float
+    points_written: int
+    success: bool
+    timestamp: float
+
+
+class _Timer:
+    """Context manager returned by PerformanceMonitor.measure_time."""
+    
+    __slots__ = ('monitor', 'operation_name', 'start')
+    
+    def __init__(self, monitor: 'PerformanceMonitor', operation_name: str):
+        self.monitor = monitor
+        self.operation_name = operation_name
+    
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+    
+    def __exit__(self, exc_type, exc, tb):
+        # Integer nanoseconds until the single conversion to seconds
+        duration = (time.perf_counter_ns() - self.start) / 1e9
+        self.monitor.record_metric(f"{self.operation_name}_duration", duration)
+        self.monitor.logger.info("TIMING %s=%.3fs", self.operation_name, duration)
 
 
 class PerformanceMonitor:
     """
     Performance monitoring and metrics collection for production debugging.
+    
+    Each metric keeps at most ``max_samples`` recent samples; older samples are
+    discarded so memory stays bounded in long-running services. Sample
+    timestamps are POSIX times from time.time() (use datetime.fromtimestamp
+    to convert).
     """
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, max_samples: int = 4096, resource_interval: float = 5.0):
         self.logger = logger or logging.getLogger('ruuvi.performance')
+        self.max_samples = max_samples
+        self.resource_interval = resource_interval
         self.metrics = {
-            'ble_scan_times': [],
-            'influxdb_write_times': [],
-            'metadata_operations': [],
-            'memory_usage': [],
-            'cpu_usage': []
+            'ble_scan_times': deque(maxlen=max_samples),
+            'influxdb_write_times': deque(maxlen=max_samples),
+            'metadata_operations': deque(maxlen=max_samples),
+            'memory_usage': deque(maxlen=max_samples),
+            'cpu_usage': deque(maxlen=max_samples)
+        }
+        self.start_time = time.monotonic()
+        
+        # Running totals over the retained samples, so the summary is O(1)
+        self._ble_success_count = 0
+        self._ble_duration_sum = 0.0
+        self._ble_devices_sum = 0
+        self._influx_success_count = 0
+        self._influx_duration_sum = 0.0
+        self._influx_points_sum = 0
+        
+        # Filled in place by get_performance_summary
+        self._summary = {
+            'uptime_seconds': 0.0,
+            'ble_scans': {'total': 0, 'successful': 0, 'avg_duration': 0, 'avg_devices_found': 0},
+            'influxdb_writes': {'total': 0, 'successful': 0, 'avg_duration': 0, 'total_points_written': 0}
         }
-        self.start_time = datetime.now()
+        
+        # Reused so cpu_percent() measures the time between samples
+        self._process = psutil.Process() if psutil is not None else None
+        self._last_resource_sample = float('-inf')
+        
+        self._metrics_view = MappingProxyType(self.metrics)
+        
+        # Pre-bound for the per-scan/per-write hot paths
+        self._ble_scans = self.metrics['ble_scan_times']
+        self._influx_writes = self.metrics['influxdb_write_times']
+        self._append_ble = self._ble_scans.append
+        self._append_influx = self._influx_writes.append
+        self._log_info = self.logger.info
     
     def log_ble_scan(self, duration: float, devices_found: int, success: bool):
         """Log BLE scan performance metrics."""
-        self.metrics['ble_scan_times'].append({
-            'duration': duration,
-            'devices_found': devices_found,
-            'success': success,
-            'timestamp': datetime.now()
-        })
+        scans = self._ble_scans
+        if len(scans) == scans.maxlen:
+            # The oldest sample is about to be evicted; drop it from the totals
+            self._tally_ble_scan(scans[0], -1)
+        
+        sample = BleScanSample(duration, devices_found, success, time.time())
+        self._append_ble(sample)
+        self._tally_ble_scan(sample, 1)
         
-        self.logger.info(
-            f"BLE_SCAN duration={duration:.2f}s devices={devices_found} success={success}"
+        self._log_info(
+            "BLE_SCAN duration=%.2fs devices=%d success=%s", duration, devices_found, success
         )
     
     def log_influxdb_write(self, duration: float, points_written: int, success: bool):
         """Log InfluxDB write performance metrics."""
-        self.metrics['influxdb_write_times'].append({
-            'duration': duration,
-            'points_written': points_written,
-            'success': success,
-            'timestamp': datetime.now()
-        })
+        writes = self._influx_writes
+        if len(writes) == writes.maxlen:
+            self._tally_influxdb_write(writes[0], -1)
+        
+        sample = InfluxWriteSample(duration, points_written, success, time.time())
+        self._append_influx(sample)
+        self._tally_influxdb_write(sample, 1)
         
-        self.logger.info(
-            f"INFLUXDB_WRITE duration={duration:.2f}s points={points_written} success={success}"
+        self._log_info(
+            "INFLUXDB_WRITE duration=%.2fs points=%d success=%s", duration, points_written, success
         )
     
+    def _tally_ble_scan(self, sample: 'BleScanSample', sign: int):
+        """Add (sign=1) or remove (sign=-1) a BLE scan sample from the running totals."""
+        if sample.success:
+            self._ble_success_count += sign
+            self._ble_duration_sum += sign * sample.duration
+            self._ble_devices_sum += sign * sample.devices_found
+    
+    def _tally_influxdb_write(self, sample: 'InfluxWriteSample', sign: int):
+        """Add (sign=1) or remove (sign=-1) an InfluxDB write sample from the running totals."""
+        self._influx_points_sum += sign * sample.points_written
+        if sample.success:
+            self._influx_success_count += sign
+            self._influx_duration_sum += sign * sample.duration
+    
     def log_system_resources(self):
-        """Log current system resource usage."""
+        """
+        Log current system resource usage.
+        
+        Samples at most once per ``resource_interval`` seconds; calls in
+        between return without touching /proc.
+        """
+        if self._process is None:
+            self.logger.warning("psutil not available for resource monitoring")
+            return
+        
+        now = time.monotonic()
+        if now - self._last_resource_sample < self.resource_interval:
+            return
+        self._last_resource_sample = now
+        
         try:
-            import psutil
-            process = psutil.Process()
-            
-            memory_info = process.memory_info()
-            cpu_percent = process.cpu_percent()
+            memory_info = self._process.memory_info()
+            cpu_percent = self._process.cpu_percent(None)
+            timestamp = time.time()
             
             self.metrics['memory_usage'].append({
                 'rss': memory_info.rss,
                 'vms': memory_info.vms,
-                'timestamp': datetime.now()
+                'timestamp': timestamp
             })
             
             self.metrics['cpu_usage'].append({
                 'cpu_percent': cpu_percent,
-                'timestamp': datetime.now()
+                'timestamp': timestamp
             })
             
             self.logger.info(
-                f"RESOURCES memory_rss={memory_info.rss/1024/1024:.1f}MB "
-                f"memory_vms={memory_info.vms/1024/1024:.1f}MB cpu={cpu_percent:.1f}%"
+                "RESOURCES memory_rss=%.1fMB memory_vms=%.1fMB cpu=%.1f%%",
+                memory_info.rss / 1048576, memory_info.vms / 1048576, cpu_percent
             )
             
-        except ImportError:
-            self.logger.warning("psutil not available for resource monitoring")
         except Exception as e:
-            self.logger.error(f"Failed to log system resources: {e}")
+            self.logger.error("Failed to log system resources: %s", e)
     
     def get_performance_summary(self) -> dict:
-        """Generate performance summary for monitoring dashboards."""
-        summary = {
-            'uptime_seconds': (datetime.now() - self.start_time).total_seconds(),
-            'ble_scans': {
-                'total': len(self.metrics['ble_scan_times']),
-                'successful': sum(1 for scan in self.metrics['ble_scan_times'] if scan['success']),
-                'avg_duration': 0,
-                'avg_devices_found': 0
-            },
-            'influxdb_writes': {
-                'total': len(self.metrics['influxdb_write_times']),
-                'successful': sum(1 for write in self.metrics['influxdb_write_times'] if write['success']),
-                'avg_duration': 0,
-                'total_points_written': sum(write['points_written'] for write in self.metrics['influxdb_write_times'])
-            }
-        }
+        """
+        Generate performance summary for monitoring dashboards.
+        
+        The same dict is updated in place and returned on every call; copy it
+        if a snapshot must be kept.
+        """
+        summary = self._summary
+        summary['uptime_seconds'] = time.monotonic() - self.start_time
         
-        # Calculate averages
-        if self.metrics['ble_scan_times']:
-            successful_scans = [scan for scan in self.metrics['ble_scan_times'] if scan['success']]
-            if successful_scans:
-                summary['ble_scans']['avg_duration'] = sum(scan['duration'] for scan in successful_scans) / len(successful_scans)
-                summary['ble_scans']['avg_devices_found'] = sum(scan['devices_found'] for scan in successful_scans) / len(successful_scans)
+        ble_success = self._ble_success_count
+        ble_scans = summary['ble_scans']
+        ble_scans['total'] = len(self.metrics['ble_scan_times'])
+        ble_scans['successful'] = ble_success
+        ble_scans['avg_duration'] = self._ble_duration_sum / ble_success if ble_success else 0
+        ble_scans['avg_devices_found'] = self._ble_devices_sum / ble_success if ble_success else 0
         
-        if self.metrics['influxdb_write_times']:
-            successful_writes = [write for write in self.metrics['influxdb_write_times'] if write['success']]
-            if successful_writes:
-                summary['influxdb_writes']['avg_duration'] = sum(write['duration'] for write in successful_writes) / len(successful_writes)
+        influx_success = self._influx_success_count
+        influxdb_writes = summary['influxdb_writes']
+        influxdb_writes['total'] = len(self.metrics['influxdb_write_times'])
+        influxdb_writes['successful'] = influx_success
+        influxdb_writes['avg_duration'] = self._influx_duration_sum / influx_success if influx_success else 0
+        influxdb_writes['total_points_written'] = self._influx_points_sum
         
         return summary
     
     def record_metric(self, metric_name: str, value: float):
         """Record a metric value."""
-        if metric_name not in self.metrics:
-            self.metrics[metric_name] = []
+        samples = self.metrics.get(metric_name)
+        if samples is None:
+            samples = self.metrics[metric_name] = deque(maxlen=self.max_samples)
         
-        self.metrics[metric_name].append({
+        samples.append({
             'value': value,
-            'timestamp': datetime.now()
+            'timestamp': time.time()
         })
         
-        self.logger.debug(f"METRIC {metric_name}={value}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("METRIC %s=%s", metric_name, value)
     
     def measure_time(self, operation_name: str):
         """Context manager for measuring operation time."""
-        from contextlib import contextmanager
-        import time
-        
-        @contextmanager
-        def timer():
-            start_time = time.time()
-            try:
-                yield
-            finally:
-                duration = time.time() - start_time
-                self.record_metric(f"{operation_name}_duration", duration)
-                self.logger.info(f"TIMING {operation_name}={duration:.3f}s")
-        
-        return timer()
+        return _Timer(self, operation_name)
     
-    def get_metrics(self) -> dict:
-        """Get all recorded metrics."""
-        return self.metrics.copy()
+    def get_metrics(self) -> Mapping[str, deque]:
+        """
+        Get all recorded metrics.
+        
+        Returns a read-only live view of the metrics dict (no copy is made);
+        use copy.deepcopy() on it if an isolated snapshot is needed.
+        """
+        return self._metrics_view
 
 
-def setup_logging(config=None) -> ProductionLogger:
+def setup_logging(config=None, force: bool = False) -> ProductionLogger:
     """
     Setup logging for the Ruuvi Sensor Service using configuration.
     
+    Repeated calls return the logger from the first call unless ``force`` is
+    set, in which case logging is rebuilt from the given configuration.
+    
     Args:
         config: Configuration instance (if None, will import from utils.config)
+        force: Reconfigure even if logging was already set up
         
     Returns:
         ProductionLogger instance
     """
+    global _configured
+    if _configured is not None and not force:
+        return _configured
+    
     if config is None:
         from .config import config
     
-    return ProductionLogger(
+    _configured = ProductionLogger(
         log_level=config.log_level,
         log_dir=str(config.log_dir),
         max_file_size=config.log_max_file_size,
         backup_count=config.log_backup_count,
         enable_console=config.log_enable_console,
         enable_syslog=config.log_enable_syslog
-    )
\ No newline at end of file
+    )
+    return _configured
\ No newline at end of file
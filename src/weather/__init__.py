@@ -1,42 +1,54 @@
 """
 Weather forecast module for Ruuvi sensor integration.
 Provides weather data fetching, storage, accuracy analysis, data profiling, and sensor data retrieval capabilities.
+
+Submodules are imported on first attribute access, so importing the package
+(e.g. for WeatherAPI) does not pull in the analysis dependencies.
 """
 
-from .api import WeatherAPI, WeatherData, ForecastData, WeatherAPIError
-from .storage import WeatherStorage, WeatherStorageError, WeatherErrorStorage
-from .accuracy import (
-    ForecastAccuracyCalculator,
-    ForecastAccuracyError,
-    ForecastError,
-    get_sensor_data_from_influxdb
-)
-from .analysis import (
-    WeatherDataAnalyzer,
-    DataAnalysisError,
-    InsufficientDataError
-)
-
-__all__ = [
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
     # API components
-    'WeatherAPI',
-    'WeatherData',
-    'ForecastData',
-    'WeatherAPIError',
-    
+    'WeatherAPI': '.api',
+    'WeatherData': '.api',
+    'ForecastData': '.api',
+    'WeatherAPIError': '.api',
+
     # Storage components
-    'WeatherStorage',
-    'WeatherStorageError',
-    'WeatherErrorStorage',
-    
+    'WeatherStorage': '.storage',
+    'WeatherStorageError': '.storage',
+    'WeatherErrorStorage': '.storage',
+
     # Accuracy components
-    'ForecastAccuracyCalculator',
-    'ForecastAccuracyError',
-    'ForecastError',
-    'get_sensor_data_from_influxdb',
-    
+    'ForecastAccuracyCalculator': '.accuracy',
+    'ForecastAccuracyError': '.accuracy',
+    'ForecastError': '.accuracy',
+    'ForecastErrorBatch': '.accuracy',
+    'get_sensor_data_from_influxdb': '.accuracy',
+    'get_sensor_data_from_influxdb_async': '.accuracy',
+
     # Analysis components
-    'WeatherDataAnalyzer',
-    'DataAnalysisError',
-    'InsufficientDataError'
-]
\ No newline at end of file
+    'WeatherDataAnalyzer': '.analysis',
+    'DataAnalysisError': '.analysis',
+    'InsufficientDataError': '.analysis',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access and cache the attribute."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,14 @@ Implements forecast error calculations and data alignment between sensor data an
 """
 
 import asyncio
+import functools
+import numpy as np
 import pandas as pd
+import string
 import time
+import weakref
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 
 from influxdb_client import Point, WritePrecision
@@ -19,6 +23,56 @@ from ..utils.config import Config
 from ..utils.logging import ProductionLogger, PerformanceMonitor
 
 
+# Metrics compared between sensor readings and forecasts, in ForecastError field order
+ERROR_METRICS = ("temperature", "pressure", "humidity")
+
+# Forecast horizons, in hours, evaluated by calculate_and_store_forecast_errors
+FORECAST_HORIZONS = (1, 6, 24, 48)
+
+# Upper bound on horizons calculated and written at the same time
+MAX_CONCURRENT_HORIZONS = 4
+
+# Maximum number of error points per InfluxDB write request
+WRITE_CHUNK_SIZE = 5000
+
+# Maximum distance between a sensor reading and the forecast it is compared to
+ALIGNMENT_TOLERANCE = pd.Timedelta(minutes=30)
+
+_NS_PER_HOUR = 3600 * 1_000_000_000
+
+# Clients created by get_sensor_data_from_influxdb_async from a config, keyed
+# by id(config); the config is kept alongside so its id cannot be reused
+_client_cache: Dict[int, Tuple[Config, RuuviInfluxDBClient]] = {}
+_client_cache_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Query record columns that are not series tags
+_RECORD_META_COLUMNS = frozenset({
+    'result', 'table', '_start', '_stop', '_time', '_value', '_field', '_measurement'
+})
+
+# Aligned (actual, forecast) column names per entry of ERROR_METRICS
+_METRIC_COLUMNS = tuple((f"{metric}_actual", f"{metric}_forecast") for metric in ERROR_METRICS)
+
+# Error field names, in ForecastError field order
+ERROR_FIELDS = tuple(
+    f"{prefix}_{kind}_error"
+    for prefix in ("temp", "pressure", "humidity")
+    for kind in ("abs", "signed")
+)
+
+# Characters escaped in line protocol measurement names and tag values
+_MEASUREMENT_ESCAPES = str.maketrans({',': r'\,', ' ': r'\ '})
+_TAG_VALUE_ESCAPES = str.maketrans({',': r'\,', ' ': r'\ ', '=': r'\='})
+
+
+def _format_line_protocol_float(value: float) -> str:
+    """Format a float field value, trimming the redundant '.0' like Point does."""
+    text = repr(value)
+    return text[:-2] if text.endswith('.0') else text
+
+
 @dataclass
 class ForecastError:
     """Forecast error data point."""
@@ -33,6 +87,43 @@ class ForecastError:
     humidity_signed_error: Optional[float] = None
 
 
+@dataclass
+class ForecastErrorBatch:
+    """
+    Forecast errors for one horizon, stored column-wise.
+    
+    Each error array is float64 and aligned with timestamps; NaN marks a
+    metric that could not be compared at that time.
+    """
+    timestamps: pd.DatetimeIndex
+    forecast_horizon_hours: int
+    source: str
+    temp_abs_error: np.ndarray
+    temp_signed_error: np.ndarray
+    pressure_abs_error: np.ndarray
+    pressure_signed_error: np.ndarray
+    humidity_abs_error: np.ndarray
+    humidity_signed_error: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def columns(self) -> Tuple[np.ndarray, ...]:
+        """Error arrays in ERROR_FIELDS order."""
+        return tuple(getattr(self, name) for name in ERROR_FIELDS)
+    
+    def iter_errors(self) -> Iterator[ForecastError]:
+        """Yield a ForecastError per row, with None for missing metrics."""
+        columns = []
+        for values in self.columns():
+            column = values.astype(object)
+            column[np.isnan(values)] = None
+            columns.append(column.tolist())
+        
+        for timestamp, *values in zip(self.timestamps, *columns):
+            yield ForecastError(timestamp, self.forecast_horizon_hours, self.source, *values)
+
+
 @dataclass
 class AccuracyStats:
     """Statistics for accuracy calculations."""
@@ -48,7 +139,130 @@ class ForecastAccuracyError(Exception):
     pass
 
 
-def get_sensor_data_from_influxdb(
+@functools.lru_cache(maxsize=64)
+def _build_sensor_flux(bucket: str, measurement: str, fields: Tuple[str, ...],
+                       time_range: str, group_by_interval: str) -> str:
+    """Build the sensor data query; fields are pivoted client-side."""
+    field_set = ', '.join(f'"{field}"' for field in fields)
+    
+    return f'''
+        from(bucket: "{bucket}")
+          |> range(start: -{time_range})
+          |> filter(fn: (r) => r["_measurement"] == "{measurement}")
+          |> filter(fn: (r) => contains(value: r["_field"], set: [{field_set}]))
+          |> aggregateWindow(every: {group_by_interval}, fn: mean, createEmpty: false)
+          |> drop(columns: ["_start", "_stop", "_measurement"])
+        '''
+
+
+def _records_to_dataframe(records: List[Dict[str, Any]], fields: Sequence[str]) -> pd.DataFrame:
+    """
+    Pivot per-field query records into a time-indexed float DataFrame.
+    
+    Records hold one '_field'/'_value' pair each, as returned by a Flux query
+    without pivot(). Values sharing a time and series (tag set) become one
+    row, filled into preallocated float64 arrays with NaN for missing fields,
+    so each column is built once with its final dtype.
+    
+    Args:
+        records: Query records with '_time', '_field', '_value' and tag columns
+        fields: Field names to extract as columns
+        
+    Returns:
+        pd.DataFrame: DataFrame indexed by time, sorted ascending
+    """
+    n = len(records)
+    if not n:
+        return pd.DataFrame()
+    
+    times = np.empty(n, dtype=object)
+    columns = {field: np.full(n, np.nan) for field in fields}
+    row_of: Dict[tuple, int] = {}
+    tags_of_table: Dict[Any, tuple] = {}
+    
+    for record in records:
+        values = columns.get(record.get('_field'))
+        if values is None:
+            continue
+        
+        # Tag columns are the same for every record of a result table
+        table = record.get('table')
+        tags = tags_of_table.get(table)
+        if tags is None:
+            tags = tags_of_table[table] = tuple(sorted(
+                column for column in record if column not in _RECORD_META_COLUMNS
+            ))
+        
+        time_value = record['_time']
+        key = (time_value, *[record[tag] for tag in tags])
+        row = row_of.get(key)
+        if row is None:
+            row = row_of[key] = len(row_of)
+            times[row] = time_value
+        
+        value = record['_value']
+        if value is not None:
+            values[row] = float(value)
+    
+    rows = len(row_of)
+    if not rows:
+        return pd.DataFrame()
+    
+    # Parse all timestamps in one call; query times are UTC
+    index = pd.DatetimeIndex(pd.to_datetime(times[:rows], utc=True), name='time')
+    
+    # copy=False keeps one contiguous block per column instead of consolidating;
+    # buffers are only copied when pivoting left them partly unused
+    df = pd.DataFrame(
+        {field: values if rows == n else values[:rows].copy() for field, values in columns.items()},
+        index=index,
+        copy=False
+    )
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+
+def _client_cache_lock() -> asyncio.Lock:
+    """Return the client cache lock for the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _client_cache_locks.get(loop)
+    if lock is None:
+        lock = _client_cache_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _get_cached_client(config: Config, logger: ProductionLogger) -> RuuviInfluxDBClient:
+    """
+    Return a connected client for config, creating it on first use.
+    
+    Args:
+        config: Configuration the client is built from
+        logger: Logger for a newly created client
+        
+    Returns:
+        RuuviInfluxDBClient: Connected client shared by calls with the same config
+        
+    Raises:
+        ForecastAccuracyError: If the client cannot connect
+    """
+    async with _client_cache_lock():
+        entry = _client_cache.get(id(config))
+        if entry is not None:
+            client = entry[1]
+            if client.is_connected():
+                return client
+        else:
+            client = RuuviInfluxDBClient(config, logger, PerformanceMonitor(logger))
+        
+        if not await client.connect():
+            raise ForecastAccuracyError("Failed to connect to InfluxDB")
+        
+        _client_cache[id(config)] = (config, client)
+        return client
+
+
+async def get_sensor_data_from_influxdb_async(
     measurement: str,
     fields: list[str],
     time_range: str = '30 days',
@@ -69,7 +283,8 @@ def get_sensor_data_from_influxdb(
         time_range: Time range for data retrieval (e.g., '30 days', '7d', '24h')
         group_by_interval: Grouping interval for aggregation (e.g., '1h', '15m', '5m')
         influxdb_client: Optional existing InfluxDB client
-        config: Optional configuration instance
+        config: Optional configuration instance; without a client, a connected
+            client is created once per config and reused by later calls
         logger: Optional logger instance
         
     Returns:
@@ -78,64 +293,35 @@ def get_sensor_data_from_influxdb(
     Raises:
         ForecastAccuracyError: If data retrieval fails
     """
-    if influxdb_client is None:
-        if config is None or logger is None:
-            raise ForecastAccuracyError("Either influxdb_client or both config and logger must be provided")
-        
-        from ..utils.logging import PerformanceMonitor
-        performance_monitor = PerformanceMonitor(logger)
-        influxdb_client = RuuviInfluxDBClient(config, logger, performance_monitor)
+    if influxdb_client is None and (config is None or logger is None):
+        raise ForecastAccuracyError("Either influxdb_client or both config and logger must be provided")
     
     if logger is None:
         import logging
         logger = logging.getLogger(__name__)
     
     try:
-        # Build Flux query for sensor data retrieval
-        field_filters = ' or '.join([f'r["_field"] == "{field}"' for field in fields])
+        if influxdb_client is None:
+            influxdb_client = await _get_cached_client(config, logger)
         
-        flux_query = f'''
-        from(bucket: "{influxdb_client.bucket}")
-          |> range(start: -{time_range})
-          |> filter(fn: (r) => r["_measurement"] == "{measurement}")
-          |> filter(fn: (r) => {field_filters})
-          |> aggregateWindow(every: {group_by_interval}, fn: mean, createEmpty: false)
-          |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-          |> sort(columns: ["_time"])
-        '''
+        # Build Flux query for sensor data retrieval
+        flux_query = _build_sensor_flux(
+            influxdb_client.bucket, measurement, tuple(fields), time_range, group_by_interval
+        )
         
         logger.debug(f"Executing sensor data query for measurement: {measurement}")
         
         # Execute query using existing client
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            results = loop.run_until_complete(influxdb_client.query(flux_query))
-        finally:
-            loop.close()
+        results = await influxdb_client.query(flux_query)
         
         if not results:
             logger.warning(f"No sensor data found for measurement: {measurement}")
             return pd.DataFrame()
         
         # Convert results to DataFrame
-        data_rows = []
-        for record in results:
-            row = {'time': pd.to_datetime(record['_time'])}
-            for field in fields:
-                if field in record and record[field] is not None:
-                    row[field] = float(record[field])
-                else:
-                    row[field] = None
-            data_rows.append(row)
-        
-        df = pd.DataFrame(data_rows)
+        df = _records_to_dataframe(results, fields)
         
         if not df.empty:
-            # Set time as index
-            df.set_index('time', inplace=True)
-            df.sort_index(inplace=True)
-            
             logger.info(f"Retrieved {len(df)} sensor data points for {len(fields)} fields")
         else:
             logger.warning("No valid sensor data points found")
@@ -147,6 +333,41 @@ def get_sensor_data_from_influxdb(
         raise ForecastAccuracyError(f"Sensor data retrieval failed: {e}")
 
 
+def get_sensor_data_from_influxdb(
+    measurement: str,
+    fields: list[str],
+    time_range: str = '30 days',
+    group_by_interval: str = '1h',
+    influxdb_client: Optional[RuuviInfluxDBClient] = None,
+    config: Optional[Config] = None,
+    logger: Optional[ProductionLogger] = None
+) -> pd.DataFrame:
+    """
+    Synchronous wrapper around get_sensor_data_from_influxdb_async.
+    
+    Must not be called while an event loop is running in this thread; await
+    get_sensor_data_from_influxdb_async there instead.
+    
+    Returns:
+        pd.DataFrame: DataFrame with time index and sensor columns
+        
+    Raises:
+        ForecastAccuracyError: If called from a running event loop or data retrieval fails
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(get_sensor_data_from_influxdb_async(
+            measurement, fields, time_range, group_by_interval,
+            influxdb_client=influxdb_client, config=config, logger=logger
+        ))
+    
+    raise ForecastAccuracyError(
+        "get_sensor_data_from_influxdb cannot run inside an event loop; "
+        "await get_sensor_data_from_influxdb_async instead"
+    )
+
+
 class ForecastAccuracyCalculator:
     """
     Forecast accuracy calculator for weather data.
@@ -185,6 +406,19 @@ class ForecastAccuracyCalculator:
         # Error storage configuration
         self.error_measurement = "weather_forecast_errors"
         
+        # Hourly forecast query; only the bucket and lookback vary per call.
+        # Fields are pivoted client-side.
+        field_set = ', '.join(f'"{field}"' for field in ERROR_METRICS)
+        self._forecast_query_template = string.Template(f'''
+        from(bucket: "$bucket")
+          |> range(start: -$lookback)
+          |> filter(fn: (r) => r["_measurement"] == "weather_forecasts")
+          |> filter(fn: (r) => contains(value: r["_field"], set: [{field_set}]))
+          |> filter(fn: (r) => r["data_type"] == "forecast")
+          |> aggregateWindow(every: 1h, fn: mean, createEmpty: false)
+          |> drop(columns: ["_start", "_stop", "_measurement", "data_type"])
+        ''')
+        
         # Statistics
         self._stats = AccuracyStats()
         
@@ -207,6 +441,9 @@ class ForecastAccuracyCalculator:
         """
         Align sensor data with forecast data based on timestamps and forecast horizon.
         
+        Each sensor reading is paired with the nearest horizon-shifted forecast
+        within ALIGNMENT_TOLERANCE; readings without one are dropped.
+        
         Args:
             sensor_df: DataFrame with sensor data (time index)
             forecast_df: DataFrame with forecast data (time index)
@@ -216,22 +453,46 @@ class ForecastAccuracyCalculator:
             pd.DataFrame: Aligned data with sensor and forecast columns
         """
         try:
-            # Create forecast horizon offset
-            forecast_offset = pd.Timedelta(hours=forecast_horizon_hours)
-            
-            # Shift forecast timestamps back by horizon to align with actual times
-            forecast_aligned = forecast_df.copy()
-            forecast_aligned.index = forecast_aligned.index - forecast_offset
-            
-            # Merge sensor and forecast data on aligned timestamps
-            aligned_df = pd.merge(
-                sensor_df, 
-                forecast_aligned, 
-                left_index=True, 
-                right_index=True, 
-                how='inner',
-                suffixes=('_actual', '_forecast')
-            )
+            if sensor_df.empty or forecast_df.empty:
+                return pd.DataFrame()
+            
+            # Matching needs sorted timestamps; query frames already are
+            if not sensor_df.index.is_monotonic_increasing:
+                sensor_df = sensor_df.sort_index()
+            if not forecast_df.index.is_monotonic_increasing:
+                forecast_df = forecast_df.sort_index()
+            
+            # Shift forecast timestamps back by horizon to align with actual times,
+            # on int64 nanosecond views rather than a copy of the frame; asi8 is
+            # in the index's own unit, so indexes are brought to ns first
+            sensor_ns = sensor_df.index.as_unit("ns").asi8
+            forecast_ns = forecast_df.index.as_unit("ns").asi8 - forecast_horizon_hours * _NS_PER_HOUR
+            
+            # Nearest forecast for each sensor reading: compare the neighbours on
+            # either side, preferring the earlier one on ties like merge_asof
+            after = np.searchsorted(forecast_ns, sensor_ns)
+            before = np.maximum(after - 1, 0)
+            after = np.minimum(after, len(forecast_ns) - 1)
+            before_distance = np.abs(sensor_ns - forecast_ns[before])
+            after_distance = np.abs(forecast_ns[after] - sensor_ns)
+            nearest = np.where(after_distance < before_distance, after, before)
+            distance = np.minimum(before_distance, after_distance)
+            
+            # Keep only matched rows, like an inner join
+            rows = np.flatnonzero(distance <= ALIGNMENT_TOLERANCE.value)
+            forecast_rows = nearest[rows]
+            
+            overlap = set(sensor_df.columns) & set(forecast_df.columns)
+            columns = {}
+            for column in sensor_df.columns:
+                name = f"{column}_actual" if column in overlap else column
+                columns[name] = sensor_df[column].to_numpy()[rows]
+            for column in forecast_df.columns:
+                name = f"{column}_forecast" if column in overlap else column
+                columns[name] = forecast_df[column].to_numpy()[forecast_rows]
+            
+            # The fancy-indexed arrays are fresh, so each becomes its own block
+            aligned_df = pd.DataFrame(columns, index=sensor_df.index[rows], copy=False)
             
             self.logger.debug(f"Aligned {len(aligned_df)} data points for {forecast_horizon_hours}h horizon")
             return aligned_df
@@ -242,7 +503,7 @@ class ForecastAccuracyCalculator:
     
     def _calculate_errors(self, aligned_df: pd.DataFrame, 
                          forecast_horizon_hours: int,
-                         source: str = "openmeteo") -> List[ForecastError]:
+                         source: str = "openmeteo") -> ForecastErrorBatch:
         """
         Calculate forecast errors from aligned data.
         
@@ -252,69 +513,113 @@ class ForecastAccuracyCalculator:
             source: Forecast data source
             
         Returns:
-            List[ForecastError]: List of calculated forecast errors
+            ForecastErrorBatch: Errors for rows where at least one metric could be compared
         """
-        errors = []
-        
-        for timestamp, row in aligned_df.iterrows():
-            try:
-                error = ForecastError(
-                    timestamp=timestamp,
-                    forecast_horizon_hours=forecast_horizon_hours,
-                    source=source
-                )
-                
-                # Temperature errors
-                if ('temperature_actual' in row and 'temperature_forecast' in row and
-                    pd.notna(row['temperature_actual']) and pd.notna(row['temperature_forecast'])):
-                    actual_temp = float(row['temperature_actual'])
-                    forecast_temp = float(row['temperature_forecast'])
-                    error.temp_abs_error = abs(actual_temp - forecast_temp)
-                    error.temp_signed_error = forecast_temp - actual_temp
-                
-                # Pressure errors
-                if ('pressure_actual' in row and 'pressure_forecast' in row and
-                    pd.notna(row['pressure_actual']) and pd.notna(row['pressure_forecast'])):
-                    actual_pressure = float(row['pressure_actual'])
-                    forecast_pressure = float(row['pressure_forecast'])
-                    error.pressure_abs_error = abs(actual_pressure - forecast_pressure)
-                    error.pressure_signed_error = forecast_pressure - actual_pressure
-                
-                # Humidity errors
-                if ('humidity_actual' in row and 'humidity_forecast' in row and
-                    pd.notna(row['humidity_actual']) and pd.notna(row['humidity_forecast'])):
-                    actual_humidity = float(row['humidity_actual'])
-                    forecast_humidity = float(row['humidity_forecast'])
-                    error.humidity_abs_error = abs(actual_humidity - forecast_humidity)
-                    error.humidity_signed_error = forecast_humidity - actual_humidity
-                
-                # Only add error if at least one metric was calculated
-                if any([error.temp_abs_error is not None,
-                       error.pressure_abs_error is not None,
-                       error.humidity_abs_error is not None]):
-                    errors.append(error)
-                    
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Error calculating forecast error for timestamp {timestamp}: {e}")
+        n = len(aligned_df)
+        error_columns = []
+        row_has_error = np.zeros(n, dtype=bool)
+        columns = set(aligned_df.columns)
+        
+        for actual_col, forecast_col in _METRIC_COLUMNS:
+            if actual_col not in columns or forecast_col not in columns:
+                missing = np.full(n, np.nan)
+                error_columns.extend((missing, missing))
                 continue
+            
+            # Non-numeric values become NaN and are masked out like missing ones
+            actual = pd.to_numeric(aligned_df[actual_col], errors='coerce').to_numpy(dtype=np.float64)
+            forecast = pd.to_numeric(aligned_df[forecast_col], errors='coerce').to_numpy(dtype=np.float64)
+            valid = ~np.isnan(actual) & ~np.isnan(forecast)
+            row_has_error |= valid
+            
+            signed = forecast - actual
+            error_columns.extend((np.abs(signed), signed))
+        
+        # Only keep rows where at least one metric was calculated
+        rows = np.flatnonzero(row_has_error)
+        
+        errors = ForecastErrorBatch(
+            pd.DatetimeIndex(aligned_df.index[rows]),
+            forecast_horizon_hours,
+            source,
+            *[values[rows] for values in error_columns]
+        )
         
         self.logger.debug(f"Calculated {len(errors)} forecast errors for {forecast_horizon_hours}h horizon")
         return errors
     
-    def _convert_errors_to_datapoints(self, errors: List[ForecastError]) -> List[DataPoint]:
+    def _build_line_protocol_batch(self, aligned_df: pd.DataFrame,
+                                   forecast_horizon_hours: int,
+                                   source: str = "openmeteo") -> Tuple[bytes, int]:
+        """
+        Calculate forecast errors and encode them straight to line protocol.
+        
+        Produces the same points as _convert_errors_to_datapoints, reading the
+        error arrays column-wise without building ForecastError or DataPoint
+        objects. Timestamps have second precision.
+        
+        Args:
+            aligned_df: DataFrame with aligned sensor and forecast data
+            forecast_horizon_hours: Forecast horizon in hours
+            source: Forecast data source
+            
+        Returns:
+            Tuple[bytes, int]: Newline-separated line protocol and number of points
+        """
+        errors = self._calculate_errors(aligned_df, forecast_horizon_hours, source)
+        if not errors:
+            return b"", 0
+        
+        # Field columns: "name=value" per row, or None where the metric is missing
+        field_columns = []
+        for name, values in zip(ERROR_FIELDS, errors.columns()):
+            # NaN marks missing metrics; non-finite values are dropped, as the
+            # client's Point encoder does
+            keep = np.isfinite(values)
+            if not keep.any():
+                continue
+            field_columns.append([
+                f"{name}={_format_line_protocol_float(value)}" if kept else None
+                for value, kept in zip(values.tolist(), keep.tolist())
+            ])
+        
+        series_key = (
+            f"{self.error_measurement.translate(_MEASUREMENT_ESCAPES)}"
+            f",forecast_horizon_hours={forecast_horizon_hours}"
+            f",source={source.translate(_TAG_VALUE_ESCAPES)} "
+        )
+        # asi8 is in the index's own unit, so go through ns to whole seconds
+        seconds = errors.timestamps.as_unit("ns").asi8 // 1_000_000_000
+        
+        lines = []
+        for timestamp, *fields in zip(seconds.tolist(), *field_columns):
+            field_set = ",".join(filter(None, fields))
+            if field_set:
+                lines.append(f"{series_key}{field_set} {timestamp}")
+        
+        self.logger.debug(f"Encoded {len(lines)} forecast errors for {forecast_horizon_hours}h horizon")
+        return "\n".join(lines).encode("utf-8"), len(lines)
+    
+    def _convert_errors_to_datapoints(self, errors: Union[ForecastErrorBatch, List[ForecastError]]
+                                      ) -> List[DataPoint]:
         """
         Convert forecast errors to InfluxDB data points.
         
         Args:
-            errors: List of forecast errors
+            errors: Forecast error batch or list of forecast errors
             
         Returns:
             List[DataPoint]: List of InfluxDB data points
         """
+        if isinstance(errors, ForecastErrorBatch):
+            return self._convert_batch_to_datapoints(errors)
+        
         data_points = []
         
-        for error in errors:
-            try:
+        # Errors from _calculate_errors only hold floats or None, so one guard
+        # around the loop replaces a try block per error
+        try:
+            for error in errors:
                 # Build tags
                 tags = {
                     "source": error.source,
@@ -344,9 +649,51 @@ class ForecastAccuracyCalculator:
                         timestamp=error.timestamp
                     ))
                     
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Error converting forecast error to data point: {e}")
-                continue
+        except (ValueError, TypeError) as e:
+            self.logger.warning(
+                f"Error converting forecast errors to data points, "
+                f"kept {len(data_points)} of {len(errors)}: {e}"
+            )
+        
+        return data_points
+    
+    def _convert_batch_to_datapoints(self, errors: ForecastErrorBatch) -> List[DataPoint]:
+        """
+        Convert a forecast error batch to InfluxDB data points column-wise.
+        
+        Missing metrics are resolved with one NaN mask per error array instead
+        of per-row None checks, and values are already floats.
+        
+        Args:
+            errors: Forecast error batch
+            
+        Returns:
+            List[DataPoint]: List of InfluxDB data points
+        """
+        # Tags are identical for every point of a batch
+        tags = {
+            "source": errors.source,
+            "forecast_horizon_hours": str(errors.forecast_horizon_hours)
+        }
+        
+        names, value_columns, mask_columns = [], [], []
+        for name, values in zip(ERROR_FIELDS, errors.columns()):
+            present = ~np.isnan(values)
+            if present.any():
+                names.append(name)
+                value_columns.append(values.tolist())
+                mask_columns.append(present.tolist())
+        
+        data_points = []
+        for timestamp, values, present in zip(errors.timestamps, zip(*value_columns), zip(*mask_columns)):
+            fields = {name: value for name, value, ok in zip(names, values, present) if ok}
+            if fields:  # Only create point if we have fields
+                data_points.append(DataPoint(
+                    measurement=self.error_measurement,
+                    tags=tags,
+                    fields=fields,
+                    timestamp=timestamp
+                ))
         
         return data_points
     
@@ -368,17 +715,78 @@ class ForecastAccuracyCalculator:
         try:
             # Convert to InfluxDB points
             influx_points = self.influxdb_client._convert_to_influx_points(data_points)
+        except Exception as e:
+            self.logger.error(f"Error writing forecast error points: {e}")
+            return False
+        
+        return await self._write_records(influx_points, len(data_points), bucket)
+    
+    async def _write_line_protocol(self, line_protocol: bytes, point_count: int,
+                                   bucket: str) -> int:
+        """
+        Write forecast errors encoded by _build_line_protocol_batch to InfluxDB.
+        
+        Args:
+            line_protocol: Newline-separated line protocol with second precision
+            point_count: Number of points in the batch
+            bucket: InfluxDB bucket name
+            
+        Returns:
+            int: Number of points written before the first failed chunk
+        """
+        if not point_count:
+            return 0
+        
+        if point_count <= WRITE_CHUNK_SIZE:
+            if await self._write_records(line_protocol, point_count, bucket,
+                                         write_precision=WritePrecision.S):
+                return point_count
+            return 0
+        
+        # Large batches go out in chunks so each request stays a bounded size
+        lines = line_protocol.split(b"\n")
+        written = 0
+        for start in range(0, len(lines), WRITE_CHUNK_SIZE):
+            chunk = lines[start:start + WRITE_CHUNK_SIZE]
+            if not await self._write_records(b"\n".join(chunk), len(chunk), bucket,
+                                             write_precision=WritePrecision.S):
+                break
+            written += len(chunk)
+        
+        return written
+    
+    async def _write_records(self, record: Any, point_count: int, bucket: str,
+                             **write_kwargs) -> bool:
+        """
+        Write records to InfluxDB with the client's retry policy.
+        
+        Args:
+            record: Points or line protocol accepted by the write API
+            point_count: Number of points in the record, for logging
+            bucket: InfluxDB bucket name
+            **write_kwargs: Extra arguments for the write API
             
+        Returns:
+            bool: True if write successful
+        """
+        try:
             # Write points to specified bucket
             for attempt in range(self.influxdb_client.retry_attempts):
                 try:
-                    self.influxdb_client._write_api.write(
-                        bucket=bucket,
-                        org=self.influxdb_client.org,
-                        record=influx_points
+                    # The write API is synchronous; run it off the event loop so
+                    # concurrent horizon writes overlap
+                    await asyncio.get_event_loop().run_in_executor(
+                        None,
+                        functools.partial(
+                            self.influxdb_client._write_api.write,
+                            bucket=bucket,
+                            org=self.influxdb_client.org,
+                            record=record,
+                            **write_kwargs
+                        )
                     )
                     
-                    self.logger.debug(f"Wrote {len(data_points)} error points to bucket: {bucket}")
+                    self.logger.debug(f"Wrote {point_count} error points to bucket: {bucket}")
                     return True
                     
                 except (InfluxDBError, ApiException) as e:
@@ -402,6 +810,75 @@ class ForecastAccuracyCalculator:
             self.logger.error(f"Error writing forecast error points: {e}")
             return False
     
+    async def _get_forecast_data(self, bucket_forecast: str, lookback_time: str) -> pd.DataFrame:
+        """
+        Retrieve hourly forecast data as a DataFrame.
+        
+        Args:
+            bucket_forecast: InfluxDB bucket containing forecast data
+            lookback_time: Time range to look back (e.g., '48h', '7d')
+            
+        Returns:
+            pd.DataFrame: DataFrame with time index and forecast columns, empty if none found
+        """
+        forecast_query = self._forecast_query_template.substitute(
+            bucket=bucket_forecast, lookback=lookback_time
+        )
+        forecast_results = await self.influxdb_client.query(forecast_query)
+        return _records_to_dataframe(forecast_results, ERROR_METRICS)
+    
+    async def _process_horizon(self, horizon_hours: int, sensor_df: pd.DataFrame,
+                               forecast_df: pd.DataFrame, bucket_errors: str,
+                               semaphore: asyncio.Semaphore) -> int:
+        """
+        Calculate and store forecast errors for a single horizon.
+        
+        Args:
+            horizon_hours: Forecast horizon in hours
+            sensor_df: DataFrame with sensor data (time index)
+            forecast_df: DataFrame with forecast data (time index)
+            bucket_errors: InfluxDB bucket for storing calculated errors
+            semaphore: Limits how many horizons are processed at once
+            
+        Returns:
+            int: Number of error points stored
+        """
+        async with semaphore:
+            self.logger.debug(f"Calculating errors for {horizon_hours}h forecast horizon")
+            
+            # Align sensor and forecast data
+            aligned_df = self._align_sensor_and_forecast_data(
+                sensor_df, forecast_df, horizon_hours
+            )
+            
+            if aligned_df.empty:
+                self.logger.warning(f"No aligned data for {horizon_hours}h horizon")
+                return 0
+            
+            # Calculate errors straight into line protocol
+            line_protocol, point_count = self._build_line_protocol_batch(
+                aligned_df, horizon_hours, "openmeteo"
+            )
+            
+            if not point_count:
+                self.logger.warning(f"No errors calculated for {horizon_hours}h horizon")
+                return 0
+            
+            # Store errors
+            written = await self._write_line_protocol(line_protocol, point_count, bucket_errors)
+            
+            if written < point_count:
+                # Chunks written before the failure are already stored
+                self._stats.errors_failed += point_count - written
+                self.logger.error(
+                    f"Failed to store {point_count - written} of {point_count} error points "
+                    f"for {horizon_hours}h horizon"
+                )
+                return written
+            
+            self.logger.info(f"Stored {point_count} error points for {horizon_hours}h horizon")
+            return point_count
+    
     async def calculate_and_store_forecast_errors(self,
                                                 bucket_sensor: str,
                                                 bucket_forecast: str,
@@ -432,106 +909,45 @@ class ForecastAccuracyCalculator:
         try:
             self.logger.info(f"Starting forecast accuracy calculation for {lookback_time} lookback")
             
-            # Define forecast horizons to calculate (1h, 6h, 24h, 48h)
-            forecast_horizons = [1, 6, 24, 48]
-            
-            # Get sensor data
-            sensor_df = get_sensor_data_from_influxdb(
-                measurement="ruuvi_environmental",
-                fields=["temperature", "pressure", "humidity"],
-                time_range=lookback_time,
-                group_by_interval="1h",
-                influxdb_client=self.influxdb_client,
-                logger=self.logger
+            forecast_horizons = FORECAST_HORIZONS
+            
+            # Fetch sensor and forecast data concurrently
+            sensor_df, forecast_df = await asyncio.gather(
+                get_sensor_data_from_influxdb_async(
+                    measurement="ruuvi_environmental",
+                    fields=list(ERROR_METRICS),
+                    time_range=lookback_time,
+                    group_by_interval="1h",
+                    influxdb_client=self.influxdb_client,
+                    logger=self.logger
+                ),
+                self._get_forecast_data(bucket_forecast, lookback_time)
             )
             
             if sensor_df.empty:
                 self.logger.warning("No sensor data found for accuracy calculation")
                 return
             
-            # Get forecast data
-            forecast_query = f'''
-            from(bucket: "{bucket_forecast}")
-              |> range(start: -{lookback_time})
-              |> filter(fn: (r) => r["_measurement"] == "weather_forecasts")
-              |> filter(fn: (r) => r["_field"] == "temperature" or r["_field"] == "pressure" or r["_field"] == "humidity")
-              |> filter(fn: (r) => r["data_type"] == "forecast")
-              |> aggregateWindow(every: 1h, fn: mean, createEmpty: false)
-              |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-              |> sort(columns: ["_time"])
-            '''
-            
-            forecast_results = await self.influxdb_client.query(forecast_query)
-            
-            if not forecast_results:
+            if forecast_df.empty:
                 self.logger.warning("No forecast data found for accuracy calculation")
                 return
             
-            # Convert forecast results to DataFrame
-            forecast_rows = []
-            for record in forecast_results:
-                row = {'time': pd.to_datetime(record['_time'])}
-                for field in ["temperature", "pressure", "humidity"]:
-                    if field in record and record[field] is not None:
-                        row[field] = float(record[field])
-                    else:
-                        row[field] = None
-                forecast_rows.append(row)
-            
-            forecast_df = pd.DataFrame(forecast_rows)
-            if not forecast_df.empty:
-                forecast_df.set_index('time', inplace=True)
-                forecast_df.sort_index(inplace=True)
-            
-            if forecast_df.empty:
-                self.logger.warning("No valid forecast data points found")
-                return
+            # Calculate and store each horizon concurrently so writes overlap
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_HORIZONS)
+            results = await asyncio.gather(
+                *[self._process_horizon(horizon_hours, sensor_df, forecast_df, bucket_errors, semaphore)
+                  for horizon_hours in forecast_horizons],
+                return_exceptions=True
+            )
             
             total_errors_calculated = 0
             total_errors_stored = 0
-            
-            # Calculate errors for each forecast horizon
-            for horizon_hours in forecast_horizons:
-                try:
-                    self.logger.debug(f"Calculating errors for {horizon_hours}h forecast horizon")
-                    
-                    # Align sensor and forecast data
-                    aligned_df = self._align_sensor_and_forecast_data(
-                        sensor_df, forecast_df, horizon_hours
-                    )
-                    
-                    if aligned_df.empty:
-                        self.logger.warning(f"No aligned data for {horizon_hours}h horizon")
-                        continue
-                    
-                    # Calculate errors
-                    errors = self._calculate_errors(aligned_df, horizon_hours, "openmeteo")
-                    
-                    if not errors:
-                        self.logger.warning(f"No errors calculated for {horizon_hours}h horizon")
-                        continue
-                    
-                    # Convert to data points
-                    data_points = self._convert_errors_to_datapoints(errors)
-                    
-                    if not data_points:
-                        self.logger.warning(f"No data points created for {horizon_hours}h horizon")
-                        continue
-                    
-                    # Store errors
-                    success = await self._write_error_points(data_points, bucket_errors)
-                    
-                    if success:
-                        total_errors_calculated += len(errors)
-                        total_errors_stored += len(data_points)
-                        self.logger.info(f"Stored {len(data_points)} error points for {horizon_hours}h horizon")
-                    else:
-                        self._stats.errors_failed += len(data_points)
-                        self.logger.error(f"Failed to store error points for {horizon_hours}h horizon")
-                
-                except Exception as e:
-                    self.logger.error(f"Error processing {horizon_hours}h forecast horizon: {e}")
+            for horizon_hours, result in zip(forecast_horizons, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error processing {horizon_hours}h forecast horizon: {result}")
                     continue
+                total_errors_calculated += result
+                total_errors_stored += result
             
             # Update statistics
             calculation_time = time.time() - start_time
@@ -626,7 +1042,7 @@ async def test_forecast_accuracy(config: Config, logger: ProductionLogger,
         await calculator.connect()
         
         # Test sensor data retrieval
-        sensor_df = get_sensor_data_from_influxdb(
+        sensor_df = await get_sensor_data_from_influxdb_async(
             measurement="ruuvi_environmental",
             fields=["temperature", "pressure", "humidity"],
             time_range="24h",
@@ -5,24 +5,51 @@ Implements Phase 2 data analysis features as specified in the project requiremen
 
 import os
 import asyncio
+import functools
+import hashlib
+import multiprocessing
+import time
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 # Data profiling
 from ydata_profiling import ProfileReport
 from ydata_profiling.config import Settings
+from ydata_profiling.utils.paths import get_config as profiling_config_path
 
 # Association rule mining
-from mlxtend.frequent_patterns import apriori, association_rules
-from mlxtend.preprocessing import TransactionEncoder
+from mlxtend.frequent_patterns import apriori, fpgrowth, association_rules
 
 from ..influxdb.client import RuuviInfluxDBClient
 from ..utils.config import Config
 from ..utils.logging import ProductionLogger, PerformanceMonitor
 
 
+# Columns kept from each streamed query chunk
+_ANALYSIS_QUERY_COLUMNS = ('_time', 'temperature', 'humidity', 'pressure')
+
+# Profile reports use a deterministic sample of this many rows for larger frames
+PROFILE_SAMPLE_THRESHOLD = 200_000
+
+# Parquet schema metadata key holding the end time a cached query ran to
+_CACHE_END_TIME_KEY = b"ruuvi.end_time"
+
+# Above this many rows, profile in minimal mode without the kendall, phi_k
+# and cramers correlations (quadratic in practice)
+PROFILE_HEAVY_CORR_THRESHOLD = 50_000
+
+
 class DataAnalysisError(Exception):
     """Base exception for data analysis operations."""
     pass
@@ -33,13 +60,50 @@ class InsufficientDataError(DataAnalysisError):
     pass
 
 
+def _floor_time(value: datetime, window: timedelta) -> datetime:
+    """Floor a naive or aware datetime to a multiple of window since the epoch."""
+    epoch = datetime(1970, 1, 1, tzinfo=value.tzinfo)
+    return value - (value - epoch) % window
+
+
+@functools.lru_cache(maxsize=1)
+def _profile_executor() -> ProcessPoolExecutor:
+    """
+    Return the shared single-worker process pool for profile reports.
+    
+    The worker is spawned rather than forked: the parent already runs the
+    logging listener and executor threads, and a fork taken while one of
+    them holds a lock can deadlock the worker.
+    """
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _render_profile_report(df_profile: pd.DataFrame,
+                           profile_settings: Dict[str, Any],
+                           explorative: bool,
+                           output_path: Path) -> None:
+    """
+    Build a ydata-profiling report and save it as HTML.
+    
+    Module-level so it can run in the profile worker process; settings arrive
+    as a plain dict and are rebuilt into Settings here.
+    """
+    profile = ProfileReport(
+        df_profile,
+        config=Settings().update(profile_settings),
+        minimal=False,
+        explorative=explorative
+    )
+    profile.to_file(output_path)
+
+
 class WeatherDataAnalyzer:
     """
     Weather data analyzer for sensor data profiling and association rule mining.
     
     Features:
     - Automated data profiling using ydata-profiling
-    - Association rule mining using mlxtend
+    - Association rule mining using mlxtend (Apriori, FP-Growth opt-in)
     - Data discretization for continuous variables
     - Integration with existing InfluxDB patterns
     """
@@ -72,6 +136,10 @@ class WeatherDataAnalyzer:
         self.reports_dir = Path("reports")
         self.reports_dir.mkdir(exist_ok=True)
         
+        # Query result cache (Parquet files, needs pyarrow)
+        self.cache_dir = self.reports_dir / ".cache"
+        self.cache_ttl = config.weather_analysis_cache_ttl
+        
         self.logger.info("WeatherDataAnalyzer initialized")
     
     async def connect(self) -> bool:
@@ -88,7 +156,9 @@ class WeatherDataAnalyzer:
     async def get_sensor_data_for_analysis(self, 
                                          start_time: datetime,
                                          end_time: Optional[datetime] = None,
-                                         mac_address: Optional[str] = None) -> pd.DataFrame:
+                                         mac_address: Optional[str] = None,
+                                         aggregate_every: Optional[timedelta] = None,
+                                         cache: bool = True) -> pd.DataFrame:
         """
         Retrieve sensor data from InfluxDB for analysis.
         
@@ -96,6 +166,11 @@ class WeatherDataAnalyzer:
             start_time: Start time for data retrieval
             end_time: End time for data retrieval (defaults to now)
             mac_address: Optional MAC address filter
+            aggregate_every: Optional window for server-side mean downsampling
+                (whole seconds); raw samples are returned when omitted
+            cache: Reuse a result cached for the same start time and parameters
+                whose end time lies up to the configured TTL before end_time,
+                and cache fresh results
             
         Returns:
             pd.DataFrame: Sensor data with time index
@@ -107,34 +182,51 @@ class WeatherDataAnalyzer:
         if end_time is None:
             end_time = datetime.utcnow()
         
+        cache_path = None
+        if cache and pyarrow is not None and self.cache_ttl > 0:
+            cache_path = self._sensor_cache_path(start_time, mac_address, aggregate_every)
+            df_cached = self._read_cached_sensor_data(cache_path, end_time)
+            if df_cached is not None:
+                return df_cached
+        
         try:
-            # Build Flux query for environmental sensor data
+            # Build Flux query for environmental sensor data; only the analysis
+            # fields and columns are sent back
+            field_set = ', '.join(f'"{col}"' for col in _ANALYSIS_QUERY_COLUMNS[1:])
             flux_query = f'''
             from(bucket: "{self.influxdb_client.bucket}")
               |> range(start: {start_time.isoformat()}Z, stop: {end_time.isoformat()}Z)
               |> filter(fn: (r) => r["_measurement"] == "ruuvi_environmental")
+              |> filter(fn: (r) => contains(value: r["_field"], set: [{field_set}]))
             '''
             
             if mac_address:
                 flux_query += f'  |> filter(fn: (r) => r["sensor_mac"] == "{mac_address}")\n'
             
-            flux_query += '''
+            if aggregate_every:
+                every = max(1, int(aggregate_every.total_seconds()))
+                flux_query += f'  |> aggregateWindow(every: {every}s, fn: mean, createEmpty: false)\n'
+            
+            column_set = ', '.join(f'"{col}"' for col in _ANALYSIS_QUERY_COLUMNS)
+            flux_query += f'''
               |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+              |> keep(columns: [{column_set}])
               |> sort(columns: ["_time"])
             '''
             
-            # Execute query
-            results = await self.influxdb_client.query(flux_query)
+            # Stream the result, keeping only the analysis columns of each chunk
+            chunks = []
+            async for chunk in self.influxdb_client.query_data_frame_stream(flux_query):
+                chunks.append(chunk[[col for col in _ANALYSIS_QUERY_COLUMNS if col in chunk.columns]])
             
-            if not results:
+            if not chunks:
                 raise InsufficientDataError("No sensor data found for the specified time range")
             
-            # Convert to DataFrame
-            df = pd.DataFrame(results)
+            df = pd.concat(chunks, ignore_index=True, copy=False)
             
             # Set time as index if available
             if '_time' in df.columns:
-                df['_time'] = pd.to_datetime(df['_time'])
+                df['_time'] = pd.to_datetime(df['_time'], format='ISO8601', utc=True, cache=True)
                 df.set_index('_time', inplace=True)
             
             # Select relevant columns for analysis
@@ -150,7 +242,17 @@ class WeatherDataAnalyzer:
             if df_analysis.empty:
                 raise InsufficientDataError("No valid sensor data after filtering")
             
+            # Readings carry at most two decimals (pressure in hPa), well within
+            # float32 precision; halves memory for profiling and rule mining
+            df_analysis = df_analysis.astype(
+                {col: np.float32 for col in df_analysis.columns if df_analysis[col].dtype == np.float64}
+            )
+            
             self.logger.info(f"Retrieved {len(df_analysis)} sensor data points for analysis")
+            
+            if cache_path is not None:
+                self._write_cached_sensor_data(cache_path, df_analysis, end_time)
+            
             return df_analysis
             
         except Exception as e:
@@ -159,6 +261,69 @@ class WeatherDataAnalyzer:
             self.logger.error(f"Error retrieving sensor data for analysis: {e}")
             raise DataAnalysisError(f"Data retrieval failed: {e}")
     
+    def _sensor_cache_path(self,
+                           start_time: datetime,
+                           mac_address: Optional[str],
+                           aggregate_every: Optional[timedelta]) -> Path:
+        """
+        Return the cache file for a sensor data query, keyed on its parameters.
+        
+        The end time is left out of the key since queries usually end "now";
+        it is stored in the file instead and checked by _read_cached_sensor_data.
+        """
+        key = repr((
+            start_time.isoformat(), mac_address, self.influxdb_client.bucket, aggregate_every
+        ))
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.parquet"
+    
+    def _read_cached_sensor_data(self, cache_path: Path,
+                                 end_time: datetime) -> Optional[pd.DataFrame]:
+        """
+        Load a cached query result, or return None if missing, expired or unreadable.
+        
+        The result is only reused when the query it came from ended at most
+        one TTL before end_time, so it is never missing more than that.
+        """
+        try:
+            if time.time() - cache_path.stat().st_mtime >= self.cache_ttl:
+                return None
+            table = pyarrow.parquet.read_table(cache_path)
+            cached_end_time = datetime.fromisoformat(
+                (table.schema.metadata or {}).get(_CACHE_END_TIME_KEY, b"").decode()
+            )
+            if not timedelta(0) <= end_time - cached_end_time < timedelta(seconds=self.cache_ttl):
+                return None
+            df = table.to_pandas()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable analysis cache file {cache_path}: {e}")
+            return None
+        
+        self.logger.info(f"Loaded {len(df)} sensor data points for analysis from cache")
+        return df
+    
+    def _write_cached_sensor_data(self, cache_path: Path, df: pd.DataFrame,
+                                  end_time: datetime):
+        """Cache a query result and remove expired cache files; failures are only logged."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            expires_before = time.time() - self.cache_ttl
+            for stale_path in self.cache_dir.glob("*.parquet"):
+                if stale_path.stat().st_mtime < expires_before:
+                    stale_path.unlink(missing_ok=True)
+            
+            table = pyarrow.Table.from_pandas(df)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                _CACHE_END_TIME_KEY: end_time.isoformat().encode()
+            })
+            pyarrow.parquet.write_table(table, cache_path, compression='zstd')
+        except Exception as e:
+            self.logger.warning(f"Could not write analysis cache file {cache_path}: {e}")
+    
     def generate_sensor_data_profile_report(self, 
                                           df_sensor: pd.DataFrame,
                                           output_path: str = "reports/sensor_data_profile_report.html") -> None:
@@ -174,46 +339,136 @@ class WeatherDataAnalyzer:
             InsufficientDataError: If DataFrame is empty or invalid
         """
         try:
-            # Validate input data
-            if df_sensor.empty:
-                raise InsufficientDataError("Cannot generate profile report: DataFrame is empty")
+            df_profile, profile_settings, full_profile, output_path = self._prepare_profile_report(
+                df_sensor, output_path
+            )
             
-            # Check for minimum data requirements
-            if len(df_sensor) < 10:
-                raise InsufficientDataError(
-                    f"Insufficient data for profiling: {len(df_sensor)} rows (minimum 10 required)"
-                )
+            # Generate and save profile report
+            start_time = datetime.now()
+            _render_profile_report(df_profile, profile_settings, full_profile, output_path)
             
-            self.logger.info(f"Generating data profile report for {len(df_sensor)} sensor data points")
+            self._record_profile_report(df_sensor, df_profile, output_path, start_time)
             
-            # Ensure output directory exists
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            if isinstance(e, (DataAnalysisError, InsufficientDataError)):
+                raise
+            self.logger.error(f"Error generating data profile report: {e}")
+            raise DataAnalysisError(f"Profile report generation failed: {e}")
+    
+    async def generate_sensor_data_profile_report_async(self, 
+                                                      df_sensor: pd.DataFrame,
+                                                      output_path: str = "reports/sensor_data_profile_report.html") -> None:
+        """
+        Generate the sensor data profiling report in a worker process.
+        
+        Produces the same report as generate_sensor_data_profile_report, but the
+        CPU-bound rendering runs in a separate process so the event loop stays
+        responsive.
+        
+        Args:
+            df_sensor: Sensor data DataFrame
+            output_path: Output path for HTML report
             
-            # Configure profile report using Settings object
-            profile_config = Settings()
-            profile_config.title = "Ruuvi Sensor Data Profile Report"
-            profile_config.dataset.description = "Environmental sensor data from Ruuvi sensors including temperature, humidity, and pressure measurements."
-            profile_config.dataset.creator = "Ruuvi Weather Analysis System"
-            profile_config.dataset.author = "Weather Data Analyzer"
-            profile_config.dataset.copyright_holder = "Ruuvi Project"
-            profile_config.dataset.copyright_year = datetime.now().year
-            
-            # Variable descriptions
-            profile_config.variables.descriptions = {
-                "temperature": "Temperature measurement in degrees Celsius",
-                "humidity": "Relative humidity percentage (0-100%)",
-                "pressure": "Atmospheric pressure in hectopascals (hPa)"
-            }
+        Raises:
+            DataAnalysisError: If report generation fails
+            InsufficientDataError: If DataFrame is empty or invalid
+        """
+        try:
+            df_profile, profile_settings, full_profile, output_path = self._prepare_profile_report(
+                df_sensor, output_path
+            )
             
-            # Enable correlations (access as dictionary)
-            profile_config.correlations["auto"].calculate = True
-            profile_config.correlations["pearson"].calculate = True
-            profile_config.correlations["spearman"].calculate = True
-            profile_config.correlations["kendall"].calculate = True
-            profile_config.correlations["phi_k"].calculate = True
-            profile_config.correlations["cramers"].calculate = True
+            # Generate and save profile report
+            start_time = datetime.now()
+            await asyncio.get_event_loop().run_in_executor(
+                _profile_executor(), _render_profile_report,
+                df_profile, profile_settings, full_profile, output_path
+            )
             
+            self._record_profile_report(df_sensor, df_profile, output_path, start_time)
+            
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # Start a fresh worker on the next report
+                _profile_executor.cache_clear()
+            if isinstance(e, (DataAnalysisError, InsufficientDataError)):
+                raise
+            self.logger.error(f"Error generating data profile report: {e}")
+            raise DataAnalysisError(f"Profile report generation failed: {e}")
+    
+    def _prepare_profile_report(self, 
+                                df_sensor: pd.DataFrame,
+                                output_path: str) -> Tuple[pd.DataFrame, Dict[str, Any], bool, Path]:
+        """
+        Validate sensor data and build the inputs for _render_profile_report.
+        
+        Args:
+            df_sensor: Sensor data DataFrame
+            output_path: Output path for HTML report
+            
+        Returns:
+            Tuple of the frame to profile (sampled when large), the report
+            settings as a plain dict, whether to run a full explorative profile,
+            and the output path
+            
+        Raises:
+            InsufficientDataError: If DataFrame is empty or invalid
+        """
+        # Validate input data
+        if df_sensor.empty:
+            raise InsufficientDataError("Cannot generate profile report: DataFrame is empty")
+        
+        # Check for minimum data requirements
+        if len(df_sensor) < 10:
+            raise InsufficientDataError(
+                f"Insufficient data for profiling: {len(df_sensor)} rows (minimum 10 required)"
+            )
+        
+        self.logger.info(f"Generating data profile report for {len(df_sensor)} sensor data points")
+        
+        # Ensure output directory exists
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Profile a deterministic, time-ordered sample of very large frames
+        df_profile = df_sensor
+        if len(df_sensor) > PROFILE_SAMPLE_THRESHOLD:
+            df_profile = df_sensor.sample(PROFILE_SAMPLE_THRESHOLD, random_state=0).sort_index()
+            self.logger.info(f"Profiling a sample of {len(df_profile)} of {len(df_sensor)} data points")
+        
+        full_profile = len(df_sensor) <= PROFILE_HEAVY_CORR_THRESHOLD
+        
+        # Configure profile report using Settings object. Large frames start
+        # from the minimal preset; ProfileReport(minimal=True) would discard
+        # the custom settings below.
+        if full_profile:
+            profile_config = Settings()
+        else:
+            profile_config = Settings().from_file(profiling_config_path("config_minimal.yaml"))
+        profile_config.title = "Ruuvi Sensor Data Profile Report"
+        profile_config.dataset.description = "Environmental sensor data from Ruuvi sensors including temperature, humidity, and pressure measurements."
+        profile_config.dataset.creator = "Ruuvi Weather Analysis System"
+        profile_config.dataset.author = "Weather Data Analyzer"
+        profile_config.dataset.copyright_holder = "Ruuvi Project"
+        profile_config.dataset.copyright_year = datetime.now().year
+        
+        # Variable descriptions
+        profile_config.variables.descriptions = {
+            "temperature": "Temperature measurement in degrees Celsius",
+            "humidity": "Relative humidity percentage (0-100%)",
+            "pressure": "Atmospheric pressure in hectopascals (hPa)"
+        }
+        
+        # Enable correlations (access as dictionary); the heavy ones only
+        # for frames small enough for a full profile
+        profile_config.correlations["auto"].calculate = True
+        profile_config.correlations["pearson"].calculate = True
+        profile_config.correlations["spearman"].calculate = True
+        profile_config.correlations["kendall"].calculate = full_profile
+        profile_config.correlations["phi_k"].calculate = full_profile
+        profile_config.correlations["cramers"].calculate = full_profile
+        
+        if full_profile:
             # Enable missing value diagrams (access as dictionary)
             profile_config.missing_diagrams["bar"] = True
             profile_config.missing_diagrams["matrix"] = True
@@ -223,39 +478,29 @@ class WeatherDataAnalyzer:
             
             # Enable interactions (access as attributes)
             profile_config.interactions.continuous = True
-            
-            # Sample settings (access as attributes)
-            profile_config.samples.head = 10
-            profile_config.samples.tail = 10
-            profile_config.samples.random = 10
-            
-            # Generate profile report
-            start_time = datetime.now()
-            
-            profile = ProfileReport(
-                df_sensor,
-                config=profile_config,
-                minimal=False,
-                explorative=True
-            )
-            
-            # Save report
-            profile.to_file(output_path)
-            
-            generation_time = (datetime.now() - start_time).total_seconds()
-            
-            # Update performance metrics
-            self.performance_monitor.record_metric("profile_report_generation_time", generation_time)
-            self.performance_monitor.record_metric("profile_report_data_points", len(df_sensor))
-            
-            self.logger.info(f"Data profile report generated successfully in {generation_time:.2f}s")
-            self.logger.info(f"Report saved to: {output_path.absolute()}")
-            
-        except Exception as e:
-            if isinstance(e, (DataAnalysisError, InsufficientDataError)):
-                raise
-            self.logger.error(f"Error generating data profile report: {e}")
-            raise DataAnalysisError(f"Profile report generation failed: {e}")
+        
+        # Sample settings (access as attributes)
+        profile_config.samples.head = 10
+        profile_config.samples.tail = 10
+        profile_config.samples.random = 10
+        
+        return df_profile, profile_config.dict(), full_profile, output_path
+    
+    def _record_profile_report(self, 
+                               df_sensor: pd.DataFrame,
+                               df_profile: pd.DataFrame,
+                               output_path: Path,
+                               start_time: datetime):
+        """Record performance metrics and log completion of a profile report."""
+        generation_time = (datetime.now() - start_time).total_seconds()
+        
+        # Update performance metrics
+        self.performance_monitor.record_metric("profile_report_generation_time", generation_time)
+        self.performance_monitor.record_metric("profile_report_data_points", len(df_sensor))
+        self.performance_monitor.record_metric("profile_report_profiled_points", len(df_profile))
+        
+        self.logger.info(f"Data profile report generated successfully in {generation_time:.2f}s")
+        self.logger.info(f"Report saved to: {output_path.absolute()}")
     
     def _discretize_continuous_data(self, 
                                   df: pd.DataFrame, 
@@ -276,7 +521,7 @@ class WeatherDataAnalyzer:
             DataAnalysisError: If discretization fails
         """
         try:
-            df_discretized = df.copy()
+            binned = {}
             bin_info = {}
             
             for column in columns_to_bin:
@@ -284,54 +529,43 @@ class WeatherDataAnalyzer:
                     self.logger.warning(f"Column '{column}' not found in DataFrame, skipping")
                     continue
                 
-                # Remove NaN values for binning
-                valid_data = df[column].dropna()
+                values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                missing = np.isnan(values)
                 
-                if len(valid_data) < n_bins:
+                if len(values) - np.count_nonzero(missing) < n_bins:
                     self.logger.warning(f"Insufficient data for binning column '{column}', skipping")
                     continue
                 
-                # Create bins using quantiles for equal-frequency binning
-                try:
-                    # First, create the quantile bins to get the bin edges
-                    qcut_result = pd.qcut(valid_data, q=n_bins, duplicates='drop')
-                    bin_edges = qcut_result.cat.categories
-                    
-                    # Extract the right edges for pd.cut (add left edge of first bin)
-                    cut_bins = [bin_edges[0].left] + [edge.right for edge in bin_edges]
-                    
-                    # Apply binning to the full column (preserving NaN)
-                    df_discretized[f"{column}_binned"] = pd.cut(
-                        df[column],
-                        bins=cut_bins,
-                        labels=['low', 'medium', 'high'][:n_bins],
-                        include_lowest=True
-                    )
-                    
-                    # Store bin information for logging
+                # Equal-frequency bins from quantile edges (NaN values are ignored)
+                labels = ['low', 'medium', 'high'][:n_bins]
+                edges = self._quantile_bin_edges(values, n_bins)
+                
+                if len(edges) - 1 == len(labels):
                     bin_info[column] = {
                         'bins': n_bins,
-                        'edges': [f"{edge.left:.2f}-{edge.right:.2f}" for edge in bin_edges]
+                        'edges': [f"{left:.2f}-{right:.2f}" for left, right in zip(edges[:-1], edges[1:])]
                     }
-                    
-                except ValueError as e:
-                    self.logger.warning(f"Could not create {n_bins} bins for '{column}': {e}")
+                else:
+                    self.logger.warning(
+                        f"Could not create {n_bins} bins for '{column}': "
+                        f"only {len(edges) - 1} distinct quantile bins"
+                    )
                     # Fallback to fewer bins
-                    try:
-                        qcut_result = pd.qcut(valid_data, q=2, duplicates='drop')
-                        bin_edges = qcut_result.cat.categories
-                        cut_bins = [bin_edges[0].left] + [edge.right for edge in bin_edges]
-                        
-                        df_discretized[f"{column}_binned"] = pd.cut(
-                            df[column],
-                            bins=cut_bins,
-                            labels=['low', 'high'],
-                            include_lowest=True
-                        )
-                        bin_info[column] = {'bins': 2, 'fallback': True}
-                    except ValueError:
+                    labels = ['low', 'high']
+                    edges = self._quantile_bin_edges(values, 2)
+                    if len(edges) - 1 != len(labels):
                         self.logger.warning(f"Could not discretize column '{column}' at all, skipping")
                         continue
+                    bin_info[column] = {'bins': 2, 'fallback': True}
+                
+                # Right-closed bins like pd.cut: a value equal to an inner edge
+                # belongs to the lower bin; missing values get code -1 (NaN)
+                codes = np.searchsorted(edges[1:-1], values, side='left')
+                codes[missing] = -1
+                
+                binned[f"{column}_binned"] = pd.Categorical.from_codes(
+                    codes, categories=labels, ordered=True
+                )
             
             # Log binning information
             for column, info in bin_info.items():
@@ -340,12 +574,21 @@ class WeatherDataAnalyzer:
                 else:
                     self.logger.info(f"Discretized '{column}' with fallback to {info['bins']} bins")
             
-            return df_discretized
+            # Append the binned columns without copying the input columns;
+            # columns binned by an earlier call are replaced
+            rebinned = df.columns.intersection(list(binned))
+            df_base = df.drop(columns=rebinned) if len(rebinned) else df
+            return pd.concat([df_base, pd.DataFrame(binned, index=df.index)], axis=1, copy=False)
             
         except Exception as e:
             self.logger.error(f"Error discretizing continuous data: {e}")
             raise DataAnalysisError(f"Data discretization failed: {e}")
     
+    @staticmethod
+    def _quantile_bin_edges(values: np.ndarray, n_bins: int) -> np.ndarray:
+        """Return the distinct quantile edges splitting values into n_bins equal-frequency bins."""
+        return np.unique(np.nanquantile(values, np.linspace(0, 1, n_bins + 1)))
+    
     def discover_sensor_association_rules(self, 
                                         df_sensor: pd.DataFrame,
                                         columns_to_bin: List[str],
@@ -354,7 +597,10 @@ class WeatherDataAnalyzer:
                                         min_confidence: float = 0.5,
                                         min_lift: float = 1.0) -> pd.DataFrame:
         """
-        Discover association rules in sensor data using Apriori algorithm.
+        Discover association rules in sensor data using the Apriori algorithm.
+        
+        Setting WEATHER_ANALYSIS_RULE_ALGORITHM=fpgrowth switches to FP-Growth,
+        which yields the same itemsets and is kept for parity checks.
         
         Args:
             df_sensor: Sensor data DataFrame
@@ -400,35 +646,34 @@ class WeatherDataAnalyzer:
             
             self.logger.info(f"Using {len(df_clean)} clean data points with columns: {binned_columns}")
             
-            # Create transactions for association rule mining
-            # Each row becomes a transaction with items like "temperature_low", "humidity_high", etc.
-            transactions = []
-            
-            for _, row in df_clean.iterrows():
-                transaction = []
-                for col in binned_columns:
-                    if pd.notna(row[col]):
-                        # Create item name like "temperature_low"
-                        item_name = f"{col.replace('_binned', '')}_{row[col]}"
-                        transaction.append(item_name)
-                
-                if transaction:  # Only add non-empty transactions
-                    transactions.append(transaction)
+            # One-hot encode rows as transactions with items like "temperature_low",
+            # "humidity_high", etc. Bin labels are distinct per column, so each
+            # item maps to exactly one dummy column; unobserved bins are dropped
+            # and items sorted to match what TransactionEncoder produced. Kept
+            # dense: with one item per column set, a sparse frame is larger.
+            df_encoded = pd.get_dummies(
+                df_clean,
+                prefix=[col.replace('_binned', '') for col in binned_columns],
+                prefix_sep='_',
+                dtype=bool
+            )
+            df_encoded = df_encoded.loc[:, df_encoded.any()].sort_index(axis=1)
             
-            if not transactions:
+            if df_encoded.empty:
                 raise InsufficientDataError("No valid transactions created for rule mining")
             
-            self.logger.info(f"Created {len(transactions)} transactions for rule mining")
-            
-            # Encode transactions for mlxtend
-            te = TransactionEncoder()
-            te_ary = te.fit(transactions).transform(transactions)
-            df_encoded = pd.DataFrame(te_ary, columns=te.columns_)
+            self.logger.info(f"Created {len(df_encoded)} transactions for rule mining")
             
-            # Apply Apriori algorithm to find frequent itemsets
-            self.logger.info(f"Running Apriori algorithm with min_support={min_support}")
+            # Find frequent itemsets. Apriori counts support with vectorized
+            # column operations; mlxtend's FP-Growth builds its tree row by row
+            # in Python, which is far slower for a handful of items per row.
+            if self.config.weather_analysis_rule_algorithm == "fpgrowth":
+                algorithm_name, find_itemsets = "FP-Growth", fpgrowth
+            else:
+                algorithm_name, find_itemsets = "Apriori", apriori
+            self.logger.info(f"Running {algorithm_name} algorithm with min_support={min_support}")
             
-            frequent_itemsets = apriori(df_encoded, min_support=min_support, use_colnames=True)
+            frequent_itemsets = find_itemsets(df_encoded, min_support=min_support, use_colnames=True)
             
             if frequent_itemsets.empty:
                 self.logger.warning(f"No frequent itemsets found with min_support={min_support}")
@@ -540,9 +785,12 @@ class WeatherDataAnalyzer:
             Dict[str, Any]: Analysis results summary
         """
         try:
-            # Calculate time range
+            # Calculate time range; the start is floored to the cache TTL so
+            # reruns within one window reuse the cached query result
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(days=days_back)
+            if self.cache_ttl > 0:
+                start_time = _floor_time(start_time, timedelta(seconds=self.cache_ttl))
             
             self.logger.info(f"Starting comprehensive analysis for {days_back} days of data")
             
@@ -564,36 +812,56 @@ class WeatherDataAnalyzer:
                 'analysis_timestamp': datetime.utcnow().isoformat()
             }
             
-            # Generate profile report
+            # Run the profile report (worker process) and rule mining (thread)
+            # concurrently
+            jobs = {}
+            
             if profile_report:
-                try:
-                    self.generate_sensor_data_profile_report(df_sensor)
+                jobs['profile_report'] = self.generate_sensor_data_profile_report_async(df_sensor)
+            
+            if association_rules:
+                # Default rule mining parameters
+                rule_defaults = {
+                    'columns_to_bin': ['temperature', 'humidity', 'pressure'],
+                    'n_bins': 3,
+                    'min_support': 0.05,
+                    'min_confidence': 0.5,
+                    'min_lift': 1.0
+                }
+                rule_defaults.update(rule_params)
+                
+                jobs['association_rules'] = asyncio.get_event_loop().run_in_executor(
+                    None,
+                    functools.partial(self.discover_sensor_association_rules, df_sensor, **rule_defaults)
+                )
+            
+            outcomes = dict(zip(jobs, await asyncio.gather(*jobs.values(), return_exceptions=True)))
+            
+            # Profile report results
+            if profile_report:
+                error = outcomes['profile_report']
+                if isinstance(error, Exception):
+                    self.logger.error(f"Profile report generation failed: {error}")
                     results['profile_report'] = {
-                        'generated': True,
-                        'path': 'reports/sensor_data_profile_report.html'
+                        'generated': False,
+                        'error': str(error)
                     }
-                except Exception as e:
-                    self.logger.error(f"Profile report generation failed: {e}")
+                else:
                     results['profile_report'] = {
-                        'generated': False,
-                        'error': str(e)
+                        'generated': True,
+                        'path': 'reports/sensor_data_profile_report.html'
                     }
             
-            # Perform association rule mining
+            # Association rule mining results
             if association_rules:
-                try:
-                    # Default rule mining parameters
-                    rule_defaults = {
-                        'columns_to_bin': ['temperature', 'humidity', 'pressure'],
-                        'n_bins': 3,
-                        'min_support': 0.05,
-                        'min_confidence': 0.5,
-                        'min_lift': 1.0
+                rules_df = outcomes['association_rules']
+                if isinstance(rules_df, Exception):
+                    self.logger.error(f"Association rule mining failed: {rules_df}")
+                    results['association_rules'] = {
+                        'generated': False,
+                        'error': str(rules_df)
                     }
-                    rule_defaults.update(rule_params)
-                    
-                    rules_df = self.discover_sensor_association_rules(df_sensor, **rule_defaults)
-                    
+                else:
                     results['association_rules'] = {
                         'generated': True,
                         'rules_found': len(rules_df),
@@ -613,13 +881,6 @@ class WeatherDataAnalyzer:
                             }
                             for _, rule in top_rules.iterrows()
                         ]
-                    
-                except Exception as e:
-                    self.logger.error(f"Association rule mining failed: {e}")
-                    results['association_rules'] = {
-                        'generated': False,
-                        'error': str(e)
-                    }
             
             self.logger.info("Comprehensive analysis completed successfully")
             return results
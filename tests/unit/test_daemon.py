@@ -0,0 +1,105 @@
+"""
+Unit tests for the background daemon.
+Tests buffering of sensor data, the InfluxDB write loop and status callbacks.
+"""
+
+import asyncio
+import json
+from dataclasses import replace
+from unittest.mock import Mock, AsyncMock, patch
+
+import pytest
+
+from src.service.daemon import RuuviDaemon
+
+
+@pytest.fixture
+def daemon(tmp_path, mock_logger):
+    """Create a daemon with a mocked InfluxDB client and a long flush interval."""
+    daemon = RuuviDaemon(tmp_path)
+    daemon.config = Mock()
+    daemon.config.influxdb_batch_size = 3
+    daemon.config.influxdb_flush_interval = 60
+    daemon.config.stats_report_cpu = False
+    daemon.logger = mock_logger
+    daemon.influxdb_client = Mock()
+    daemon.influxdb_client.is_connected.return_value = True
+    daemon.influxdb_client.write_sensor_data = AsyncMock(return_value=True)
+    daemon._running = True
+    return daemon
+
+
+class TestDataWriteLoop:
+    """Test the buffered data write loop."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_of_readings_flushes_before_interval(self, daemon, sample_sensor_data):
+        """Test a batch of readings from one sensor wakes the write loop early."""
+        write_task = asyncio.create_task(daemon._data_write_loop())
+
+        # One sensor, so the buffer never holds more than one entry
+        for sequence in range(3):
+            await daemon._buffer_sensor_data(
+                replace(sample_sensor_data, measurement_sequence=sequence)
+            )
+
+        async def written():
+            while not daemon.influxdb_client.write_sensor_data.called:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(written(), timeout=2.0)
+
+        # Only the latest reading per sensor is written
+        daemon.influxdb_client.write_sensor_data.assert_awaited_once()
+        assert daemon.influxdb_client.write_sensor_data.call_args[0][0].measurement_sequence == 2
+        assert daemon._readings_since_flush == 0
+
+        daemon._shutdown_requested = True
+        daemon._flush_trigger.set()
+        await asyncio.wait_for(write_task, timeout=2.0)
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_waits_for_interval(self, daemon, sample_sensor_data):
+        """Test fewer readings than a batch do not wake the write loop."""
+        write_task = asyncio.create_task(daemon._data_write_loop())
+
+        for sequence in range(2):
+            await daemon._buffer_sensor_data(
+                replace(sample_sensor_data, measurement_sequence=sequence)
+            )
+        await asyncio.sleep(0.1)
+
+        daemon.influxdb_client.write_sensor_data.assert_not_called()
+        assert not daemon._flush_trigger.is_set()
+
+        daemon._shutdown_requested = True
+        daemon._flush_trigger.set()
+        await asyncio.wait_for(write_task, timeout=2.0)
+
+
+class TestStatusCallbacks:
+    """Test status updates sent from the statistics loop."""
+
+    @pytest.mark.asyncio
+    async def test_json_callbacks_receive_serialized_status(self, daemon):
+        """Test JSON status callbacks get the get_status_json() payload."""
+        json_callback = Mock()
+        dict_callback = Mock()
+        daemon.add_status_json_callback(json_callback)
+        daemon.add_status_callback(dict_callback)
+
+        # Run a single statistics tick
+        async def tick(delay):
+            daemon._shutdown_requested = True
+
+        with patch("src.service.daemon.asyncio.sleep", side_effect=tick):
+            await daemon._statistics_loop()
+
+        json_callback.assert_called_once()
+        status = json.loads(json_callback.call_args[0][0])
+        assert status == json.loads(daemon.get_status_json())
+        assert status["stats"]["start_time"] == daemon._stats.start_time.isoformat()
+        dict_callback.assert_called_once()
+
+        daemon.remove_status_json_callback(json_callback)
+        assert not daemon._status_json_callbacks
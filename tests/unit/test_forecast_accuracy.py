@@ -0,0 +1,268 @@
+"""
+Unit tests for the forecast accuracy module.
+Tests data alignment, error calculation, line protocol encoding and chunked writes
+against the original row-by-row implementation.
+"""
+
+import asyncio
+from datetime import timezone
+from unittest.mock import Mock, AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from influxdb_client import Point, WritePrecision
+
+import src.weather.accuracy as accuracy
+from src.weather.accuracy import ForecastAccuracyCalculator, ForecastError
+
+
+def reference_align(sensor_df: pd.DataFrame, forecast_df: pd.DataFrame,
+                    forecast_horizon_hours: int) -> pd.DataFrame:
+    """Original alignment: exact timestamp join on the horizon-shifted forecasts."""
+    forecast_aligned = forecast_df.copy()
+    forecast_aligned.index = forecast_aligned.index - pd.Timedelta(hours=forecast_horizon_hours)
+    return pd.merge(sensor_df, forecast_aligned, left_index=True, right_index=True,
+                    how='inner', suffixes=('_actual', '_forecast'))
+
+
+def reference_errors(aligned_df: pd.DataFrame, forecast_horizon_hours: int,
+                     source: str = "openmeteo"):
+    """Original error calculation, one ForecastError per row via iterrows()."""
+    errors = []
+    for timestamp, row in aligned_df.iterrows():
+        error = ForecastError(timestamp=timestamp, forecast_horizon_hours=forecast_horizon_hours,
+                              source=source)
+        for metric, prefix in (("temperature", "temp"), ("pressure", "pressure"),
+                               ("humidity", "humidity")):
+            actual_col, forecast_col = f"{metric}_actual", f"{metric}_forecast"
+            if (actual_col in row and forecast_col in row and
+                    pd.notna(row[actual_col]) and pd.notna(row[forecast_col])):
+                actual = float(row[actual_col])
+                forecast = float(row[forecast_col])
+                setattr(error, f"{prefix}_abs_error", abs(actual - forecast))
+                setattr(error, f"{prefix}_signed_error", forecast - actual)
+        if any([error.temp_abs_error is not None, error.pressure_abs_error is not None,
+                error.humidity_abs_error is not None]):
+            errors.append(error)
+    return errors
+
+
+def parse_line_protocol(data: bytes):
+    """Split line protocol into (series key, field dict, timestamp) tuples."""
+    points = []
+    for line in data.decode().splitlines():
+        series, fields, timestamp = line.rsplit(" ", 2)
+        points.append((series, dict(field.split("=", 1) for field in fields.split(",")), int(timestamp)))
+    return points
+
+
+@pytest.fixture
+def calculator(mock_logger, mock_performance_monitor):
+    """Create a calculator around a mocked InfluxDB client."""
+    client = Mock()
+    client.retry_attempts = 1
+    client.retry_delay = 0
+    return ForecastAccuracyCalculator(Mock(), mock_logger, mock_performance_monitor,
+                                      influxdb_client=client)
+
+
+@pytest.fixture
+def sensor_df():
+    """Hourly sensor readings with a few missing values."""
+    index = pd.date_range("2024-01-01 00:00", periods=6, freq="h")
+    return pd.DataFrame({
+        "temperature": [20.0, 21.5, np.nan, 19.25, 18.0, np.nan],
+        "pressure": [1013.0, 1012.5, 1011.0, np.nan, 1010.0, np.nan],
+        "humidity": [55.0, 57.0, 60.0, 61.5, np.nan, np.nan],
+    }, index=index)
+
+
+@pytest.fixture
+def forecast_df():
+    """Hourly forecasts valid one hour after each sensor reading."""
+    index = pd.date_range("2024-01-01 01:00", periods=6, freq="h")
+    return pd.DataFrame({
+        "temperature": [20.5, 21.0, 22.0, 19.0, np.nan, 17.0],
+        "pressure": [1012.0, 1013.0, 1011.5, 1010.0, 1009.0, np.nan],
+        "humidity": [50.0, 58.5, 59.0, np.nan, 62.0, np.nan],
+    }, index=index)
+
+
+class TestAlignment:
+    """Test _align_sensor_and_forecast_data."""
+
+    def test_exact_matches_equal_merge(self, calculator, sensor_df, forecast_df):
+        """Test exactly matching timestamps give the original inner join."""
+        aligned = calculator._align_sensor_and_forecast_data(sensor_df, forecast_df, 1)
+
+        pd.testing.assert_frame_equal(aligned, reference_align(sensor_df, forecast_df, 1),
+                                      check_freq=False)
+
+    def test_nearest_forecast_within_tolerance(self, calculator):
+        """Test readings pair with the nearest forecast and ties go to the earlier one."""
+        sensor = pd.DataFrame({"temperature": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=pd.to_datetime([
+            "2024-01-01 10:10", "2024-01-01 10:30", "2024-01-01 10:45",
+            "2024-01-01 11:31", "2024-01-01 13:00"
+        ]))
+        forecast = pd.DataFrame({"temperature": [10.0, 11.0]}, index=pd.to_datetime([
+            "2024-01-01 16:00", "2024-01-01 17:00"
+        ]))
+
+        aligned = calculator._align_sensor_and_forecast_data(sensor, forecast, 6)
+
+        # 11:31 and 13:00 are more than 30 minutes from any forecast
+        assert aligned.index.tolist() == list(pd.to_datetime([
+            "2024-01-01 10:10", "2024-01-01 10:30", "2024-01-01 10:45"
+        ]))
+        assert aligned["temperature_actual"].tolist() == [1.0, 2.0, 3.0]
+        assert aligned["temperature_forecast"].tolist() == [10.0, 10.0, 11.0]
+
+    def test_unsorted_input(self, calculator, sensor_df, forecast_df):
+        """Test unsorted frames align like sorted ones."""
+        aligned = calculator._align_sensor_and_forecast_data(
+            sensor_df.iloc[::-1], forecast_df.iloc[::-1], 1
+        )
+
+        pd.testing.assert_frame_equal(aligned, reference_align(sensor_df, forecast_df, 1),
+                                      check_freq=False)
+
+    @pytest.mark.parametrize("unit", ["s", "ms", "us"])
+    def test_non_nanosecond_index(self, calculator, sensor_df, forecast_df, unit):
+        """Test indexes in other units align on the same timestamps."""
+        sensor = sensor_df.set_axis(sensor_df.index.as_unit(unit))
+        forecast = forecast_df.set_axis(forecast_df.index.as_unit("s"))
+
+        aligned = calculator._align_sensor_and_forecast_data(sensor, forecast, 1)
+
+        assert aligned.index.tolist() == sensor_df.index.tolist()
+        np.testing.assert_array_equal(aligned["temperature_forecast"], forecast_df["temperature"])
+
+    def test_empty_input(self, calculator, sensor_df, forecast_df):
+        """Test empty sensor or forecast data gives an empty frame."""
+        assert calculator._align_sensor_and_forecast_data(sensor_df.iloc[:0], forecast_df, 1).empty
+        assert calculator._align_sensor_and_forecast_data(sensor_df, forecast_df.iloc[:0], 1).empty
+
+    def test_no_forecast_within_tolerance(self, calculator, sensor_df, forecast_df):
+        """Test readings far from every forecast are all dropped."""
+        aligned = calculator._align_sensor_and_forecast_data(sensor_df, forecast_df, 48)
+
+        assert aligned.empty
+
+
+class TestCalculateErrors:
+    """Test _calculate_errors."""
+
+    def test_matches_row_by_row_errors(self, calculator, sensor_df, forecast_df):
+        """Test vectorized errors equal the original per-row results, NaN included."""
+        aligned = reference_align(sensor_df, forecast_df, 1)
+
+        errors = calculator._calculate_errors(aligned, 1)
+
+        assert list(errors.iter_errors()) == reference_errors(aligned, 1)
+        # The last row has no metric that can be compared
+        assert len(errors) == len(aligned) - 1
+
+    def test_missing_metric_columns(self, calculator, sensor_df, forecast_df):
+        """Test metrics absent from the frame are reported as missing."""
+        aligned = reference_align(sensor_df[["temperature"]], forecast_df[["temperature"]], 1)
+
+        errors = calculator._calculate_errors(aligned, 1)
+
+        assert list(errors.iter_errors()) == reference_errors(aligned, 1)
+        assert np.isnan(errors.pressure_abs_error).all()
+        assert np.isnan(errors.humidity_signed_error).all()
+
+    def test_empty_frame(self, calculator):
+        """Test an empty aligned frame gives an empty batch."""
+        errors = calculator._calculate_errors(pd.DataFrame(), 1)
+
+        assert len(errors) == 0
+        assert list(errors.iter_errors()) == []
+
+
+class TestLineProtocol:
+    """Test _build_line_protocol_batch."""
+
+    def test_matches_point_encoding(self, calculator, sensor_df, forecast_df):
+        """Test the encoded batch holds the points the client's Point encoder writes."""
+        aligned = reference_align(sensor_df, forecast_df, 1)
+
+        data, count = calculator._build_line_protocol_batch(aligned, 1, "open meteo")
+
+        expected = []
+        for error in reference_errors(aligned, 1, "open meteo"):
+            point = Point(calculator.error_measurement)
+            point.tag("source", error.source).tag("forecast_horizon_hours", str(error.forecast_horizon_hours))
+            for name in accuracy.ERROR_FIELDS:
+                value = getattr(error, name)
+                if value is not None:
+                    point.field(name, value)
+            point.time(error.timestamp.replace(tzinfo=timezone.utc), WritePrecision.S)
+            expected.append(point.to_line_protocol())
+
+        assert count == len(expected)
+        assert parse_line_protocol(data) == parse_line_protocol("\n".join(expected).encode())
+        assert data.startswith(b"weather_forecast_errors,forecast_horizon_hours=1,source=open\\ meteo ")
+
+    def test_missing_metrics_are_left_out(self, calculator, sensor_df, forecast_df):
+        """Test NaN metrics are omitted from their line and all-NaN rows are skipped."""
+        aligned = reference_align(sensor_df, forecast_df, 1)
+
+        points = parse_line_protocol(calculator._build_line_protocol_batch(aligned, 1)[0])
+
+        # 02:00 has no temperature reading; 05:00 has nothing to compare
+        fields_at = {timestamp: fields for _, fields, timestamp in points}
+        two_am = int(pd.Timestamp("2024-01-01 02:00", tz="UTC").timestamp())
+        assert set(fields_at[two_am]) == {
+            "pressure_abs_error", "pressure_signed_error",
+            "humidity_abs_error", "humidity_signed_error"
+        }
+        assert int(pd.Timestamp("2024-01-01 05:00", tz="UTC").timestamp()) not in fields_at
+
+    def test_empty_frame(self, calculator):
+        """Test an empty aligned frame encodes to nothing."""
+        assert calculator._build_line_protocol_batch(pd.DataFrame(), 1) == (b"", 0)
+
+
+class TestChunkedWrites:
+    """Test chunked line protocol writes and their failure accounting."""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        """Write two points per request."""
+        monkeypatch.setattr(accuracy, "WRITE_CHUNK_SIZE", 2)
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_written(self, calculator):
+        """Test every chunk is written and all points are counted."""
+        calculator._write_records = AsyncMock(return_value=True)
+        data = b"\n".join(b"m f=%d %d" % (i, i) for i in range(5))
+
+        written = await calculator._write_line_protocol(data, 5, "errors")
+
+        assert written == 5
+        assert [call.args[1] for call in calculator._write_records.await_args_list] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_failed_chunk(self, calculator):
+        """Test a failed chunk stops the write and only earlier chunks count."""
+        calculator._write_records = AsyncMock(side_effect=[True, False, True])
+        data = b"\n".join(b"m f=%d %d" % (i, i) for i in range(5))
+
+        written = await calculator._write_line_protocol(data, 5, "errors")
+
+        assert written == 2
+        assert calculator._write_records.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_horizon_counts_unwritten_points_as_failed(self, calculator,
+                                                                     sensor_df, forecast_df):
+        """Test a partial write reports the stored points and fails only the rest."""
+        calculator._write_records = AsyncMock(side_effect=[True, False])
+
+        stored = await calculator._process_horizon(1, sensor_df, forecast_df, "errors",
+                                                   asyncio.Semaphore(1))
+
+        assert stored == 2
+        assert calculator._stats.errors_failed == 3
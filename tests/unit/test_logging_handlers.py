@@ -0,0 +1,64 @@
+"""
+Unit tests for the batching log file handler.
+Tests batched writes, encoding and write failure handling.
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.logging import BatchingRotatingFileHandler
+
+
+def make_record(message: str) -> logging.LogRecord:
+    """Create a log record for the ruuvi.ble component."""
+    return logging.LogRecord("ruuvi.ble", logging.INFO, __file__, 1, message, None, None)
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """Create a batching handler writing to a temporary file."""
+    handler = BatchingRotatingFileHandler(tmp_path / "components.log", batch_size=64, flush_interval=60)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    yield handler
+    handler.close()
+
+
+class TestBatchingRotatingFileHandler:
+    """Test BatchingRotatingFileHandler behaviour."""
+
+    def test_writes_full_batches_and_remainder_as_utf8(self, handler):
+        """Test records are written per batch and the rest on close."""
+        for i in range(70):
+            handler.emit(make_record(f"reading {i} °C"))
+
+        log_file = handler.baseFilename
+        with open(log_file, encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 64
+
+        handler.close()
+
+        with open(log_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert lines == [f"reading {i} °C" for i in range(70)]
+
+    def test_encoding_is_utf8(self, handler):
+        """Test the handler never uses the 'locale' pseudo-encoding."""
+        assert handler.encoding == "utf-8"
+
+    def test_write_failure_is_reported_not_raised(self, handler):
+        """Test a failing batch write goes through handleError."""
+        with patch("src.utils.logging.os.write", side_effect=OSError("disk full")), \
+             patch.object(handler, "handleError") as handle_error:
+            for i in range(64):
+                handler.emit(make_record(f"reading {i}"))
+
+        handle_error.assert_called_once()
+        assert handler._buffer == []
+
+        # The handler keeps working once writes succeed again
+        handler.emit(make_record("recovered"))
+        handler.flush()
+        with open(handler.baseFilename, encoding="utf-8") as f:
+            assert f.read() == "recovered\n"
@@ -39,6 +39,7 @@ def mock_config():
     config.influxdb_retry_attempts = 3
     config.influxdb_retry_delay = 1
     config.influxdb_retry_exponential_base = 2
+    config.weather_analysis_cache_ttl = 0
     return config
 
 
@@ -54,6 +55,15 @@ def mock_performance_monitor():
     return Mock(spec=PerformanceMonitor)
 
 
+def frame_stream(*frames):
+    """Create a query_data_frame_stream mock yielding the given DataFrames."""
+    async def stream(flux_query):
+        for frame in frames:
+            yield frame
+    
+    return Mock(side_effect=stream)
+
+
 @pytest.fixture
 def mock_influxdb_client():
     """Create mock InfluxDB client."""
@@ -61,6 +71,7 @@ def mock_influxdb_client():
     client.is_connected.return_value = True
     client.bucket = "test-bucket"
     client.query = AsyncMock()
+    client.query_data_frame_stream = frame_stream()
     return client
 
 
@@ -192,7 +203,7 @@ class TestWeatherDataAnalyzer:
             }
         ]
         
-        analyzer.influxdb_client.query.return_value = mock_results
+        analyzer.influxdb_client.query_data_frame_stream = frame_stream(pd.DataFrame(mock_results))
         
         start_time = datetime(2023, 1, 1, 10, 0, 0)
         end_time = datetime(2023, 1, 1, 14, 0, 0)
@@ -204,9 +215,14 @@ class TestWeatherDataAnalyzer:
         assert list(result.columns) == ['temperature', 'humidity', 'pressure']
         assert result.index.name == '_time'
         
+        # Readings are downcast to float32 without losing their values
+        assert all(result.dtypes == np.float32)
+        expected = pd.DataFrame(mock_results)[['temperature', 'humidity', 'pressure']]
+        assert np.allclose(result.astype('float64').to_numpy(), expected.to_numpy(), rtol=0, atol=1e-4)
+        
         # Verify query was called with correct parameters
-        analyzer.influxdb_client.query.assert_called_once()
-        query_call = analyzer.influxdb_client.query.call_args[0][0]
+        analyzer.influxdb_client.query_data_frame_stream.assert_called_once()
+        query_call = analyzer.influxdb_client.query_data_frame_stream.call_args[0][0]
         assert 'ruuvi_environmental' in query_call
         assert start_time.isoformat() in query_call
         assert end_time.isoformat() in query_call
@@ -214,7 +230,7 @@ class TestWeatherDataAnalyzer:
     @pytest.mark.asyncio
     async def test_get_sensor_data_no_results(self, analyzer):
         """Test sensor data retrieval with no results."""
-        analyzer.influxdb_client.query.return_value = []
+        analyzer.influxdb_client.query_data_frame_stream = frame_stream()
         
         start_time = datetime(2023, 1, 1, 10, 0, 0)
         
@@ -224,23 +240,114 @@ class TestWeatherDataAnalyzer:
     @pytest.mark.asyncio
     async def test_get_sensor_data_with_mac_filter(self, analyzer):
         """Test sensor data retrieval with MAC address filter."""
-        analyzer.influxdb_client.query.return_value = [
+        analyzer.influxdb_client.query_data_frame_stream = frame_stream(pd.DataFrame([
             {
                 '_time': '2023-01-01T12:00:00Z',
                 'temperature': 20.5,
                 'humidity': 65.0,
                 'pressure': 1013.25
             }
-        ]
+        ]))
         
         start_time = datetime(2023, 1, 1, 10, 0, 0)
         mac_address = "AA:BB:CC:DD:EE:FF"
         
         await analyzer.get_sensor_data_for_analysis(start_time, mac_address=mac_address)
         
-        query_call = analyzer.influxdb_client.query.call_args[0][0]
+        query_call = analyzer.influxdb_client.query_data_frame_stream.call_args[0][0]
         assert f'r["sensor_mac"] == "{mac_address}"' in query_call
     
+    @pytest.mark.asyncio
+    async def test_get_sensor_data_uses_cache(self, analyzer, tmp_path):
+        """Test repeated sensor data retrieval is served from the Parquet cache."""
+        pytest.importorskip("pyarrow")
+        analyzer.cache_dir = tmp_path
+        analyzer.cache_ttl = 3600
+        analyzer.influxdb_client.query_data_frame_stream = frame_stream(pd.DataFrame([
+            {
+                '_time': '2023-01-01T12:00:00Z',
+                'temperature': 20.5,
+                'humidity': 65.0,
+                'pressure': 1013.25
+            }
+        ]))
+        
+        start_time = datetime(2023, 1, 1, 10, 0, 0)
+        end_time = datetime(2023, 1, 1, 14, 0, 0)
+        
+        first = await analyzer.get_sensor_data_for_analysis(start_time, end_time)
+        second = await analyzer.get_sensor_data_for_analysis(start_time, end_time)
+        
+        pd.testing.assert_frame_equal(first, second)
+        analyzer.influxdb_client.query_data_frame_stream.assert_called_once()
+        assert len(list(tmp_path.glob("*.parquet"))) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_sensor_data_cache_keeps_ranges_apart(self, analyzer, tmp_path):
+        """Test different explicit time ranges never share a cache entry."""
+        pytest.importorskip("pyarrow")
+        analyzer.cache_dir = tmp_path
+        analyzer.cache_ttl = 3600
+        # Each query gets its own result
+        analyzer.influxdb_client.query_data_frame_stream = Mock(side_effect=[
+            frame_stream(pd.DataFrame([{'_time': time, 'temperature': value}])).side_effect(None)
+            for time, value in [
+                ('2023-01-01T10:10:00Z', 20.5),
+                ('2023-01-01T10:30:00Z', 22.0),
+                ('2023-01-01T12:30:00Z', 23.5)
+            ]
+        ])
+    
+        first = await analyzer.get_sensor_data_for_analysis(
+            datetime(2023, 1, 1, 10, 5), datetime(2023, 1, 1, 10, 20)
+        )
+        second = await analyzer.get_sensor_data_for_analysis(
+            datetime(2023, 1, 1, 10, 25), datetime(2023, 1, 1, 10, 50)
+        )
+        # Same start, but ending more than one TTL after the cached query
+        third = await analyzer.get_sensor_data_for_analysis(
+            datetime(2023, 1, 1, 10, 5), datetime(2023, 1, 1, 12, 40)
+        )
+    
+        assert first['temperature'].tolist() == [20.5]
+        assert second['temperature'].tolist() == [22.0]
+        assert third['temperature'].tolist() == [23.5]
+        assert analyzer.influxdb_client.query_data_frame_stream.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_run_comprehensive_analysis_reuses_cached_data(self, analyzer, tmp_path):
+        """Test repeated analyses ending "now" hit the cache on the second run."""
+        pytest.importorskip("pyarrow")
+        analyzer.cache_dir = tmp_path
+        analyzer.cache_ttl = 3600
+        analyzer.influxdb_client.query_data_frame_stream = frame_stream(pd.DataFrame([
+            {
+                '_time': '2023-01-01T12:00:00Z',
+                'temperature': 20.5,
+                'humidity': 65.0,
+                'pressure': 1013.25
+            }
+        ]))
+        
+        # The second run ends within one TTL of the cached first run
+        with patch('src.weather.analysis.datetime') as mock_datetime:
+            mock_datetime.side_effect = datetime
+            mock_datetime.fromisoformat.side_effect = datetime.fromisoformat
+            mock_datetime.utcnow.side_effect = [
+                datetime(2023, 1, 1, 14, 5, 0), datetime(2023, 1, 1, 14, 5, 0),
+                datetime(2023, 1, 1, 14, 40, 0), datetime(2023, 1, 1, 14, 40, 0)
+            ]
+            first = await analyzer.run_comprehensive_analysis(
+                days_back=7, profile_report=False, association_rules=False
+            )
+            second = await analyzer.run_comprehensive_analysis(
+                days_back=7, profile_report=False, association_rules=False
+            )
+        
+        assert first['data_points'] == second['data_points'] == 1
+        analyzer.influxdb_client.query_data_frame_stream.assert_called_once()
+        assert len(list(tmp_path.glob("*.parquet"))) == 1
+    
     def test_generate_sensor_data_profile_report_success(self, analyzer, sample_sensor_data):
         """Test successful profile report generation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -415,7 +522,7 @@ class TestWeatherDataAnalyzer:
         analyzer.get_sensor_data_for_analysis = AsyncMock(return_value=sample_sensor_data)
         
         # Mock profile report generation
-        with patch.object(analyzer, 'generate_sensor_data_profile_report') as mock_profile:
+        with patch.object(analyzer, 'generate_sensor_data_profile_report_async') as mock_profile:
             # Mock association rule mining
             mock_rules = pd.DataFrame({
                 'antecedents_str': ['temperature_high'],
@@ -462,7 +569,7 @@ class TestWeatherDataAnalyzer:
         analyzer.get_sensor_data_for_analysis = AsyncMock(return_value=sample_sensor_data)
         
         # Mock profile report to raise error
-        with patch.object(analyzer, 'generate_sensor_data_profile_report', 
+        with patch.object(analyzer, 'generate_sensor_data_profile_report_async', 
                          side_effect=Exception("Profile error")):
             with patch.object(analyzer, 'discover_sensor_association_rules', 
                              return_value=pd.DataFrame()):
@@ -485,7 +592,7 @@ class TestWeatherDataAnalyzer:
         """Test comprehensive analysis with association rules error."""
         analyzer.get_sensor_data_for_analysis = AsyncMock(return_value=sample_sensor_data)
         
-        with patch.object(analyzer, 'generate_sensor_data_profile_report'):
+        with patch.object(analyzer, 'generate_sensor_data_profile_report_async'):
             # Mock association rules to raise error
             with patch.object(analyzer, 'discover_sensor_association_rules',
                              side_effect=Exception("Rules error")):
@@ -524,6 +631,7 @@ async def test_analyzer_integration():
         mock_client_class.return_value = mock_client
         
         config = Mock()
+        config.weather_analysis_cache_ttl = 0
         logger = Mock()
         performance_monitor = Mock()
         
@@ -532,8 +640,9 @@ async def test_analyzer_integration():
         # Mock data retrieval
         analyzer.get_sensor_data_for_analysis = AsyncMock(return_value=df)
         
-        # Run analysis
-        with patch('src.weather.analysis.ProfileReport') as mock_profile:
+        # Run analysis; render the report in-process so the patch applies
+        with patch('src.weather.analysis.ProfileReport') as mock_profile, \
+             patch('src.weather.analysis._profile_executor', return_value=None):
             mock_profile_instance = Mock()
             mock_profile.return_value = mock_profile_instance
             